@@ -44,6 +44,14 @@ if (process.env.DATABASE_URL) {
 
 const pool = mysql.createPool(poolConfig);
 
+// Optional ?limit=&offset= paging for list routes; without a limit the whole list is returned
+export function pageClause(query) {
+  const limit = parseInt(query.limit, 10);
+  if (!(limit > 0)) return { sql: '', params: [] };
+  const offset = Math.max(parseInt(query.offset, 10) || 0, 0);
+  return { sql: ' LIMIT ? OFFSET ?', params: [limit, offset] };
+}
+
 // Test connection on startup
 export async function testConnection() {
   try {
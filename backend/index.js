@@ -23,6 +23,7 @@ import submissionRoutes from './routes/submissions.js';
 import announcementRoutes from './routes/announcements.js';
 import contentRoutes from './routes/content.js';
 import messageRoutes from './routes/messages.js';
+import deckRoutes from './routes/decks.js';
 
 const app = express();
 const PORT = process.env.PORT || 5000;
@@ -58,6 +59,7 @@ app.use('/api/submissions', submissionRoutes);
 app.use('/api/announcements', announcementRoutes);
 app.use('/api/content', contentRoutes);
 app.use('/api/messages', messageRoutes);
+app.use('/api/decks', deckRoutes);
 
 // ── Health check ────────────────────────────────────────────────────────────
 app.get('/api/health', async (req, res) => {
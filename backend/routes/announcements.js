@@ -2,13 +2,14 @@
 // Announcement Routes (MySQL)
 // ─────────────────────────────────────────────────────────────────────────────
 import { Router } from 'express';
-import db from '../database/db.js';
+import db, { pageClause } from '../database/db.js';
 
 const router = Router();
 
-router.get('/', async (_req, res) => {
+router.get('/', async (req, res) => {
   try {
-    const [rows] = await db.query('SELECT * FROM announcements ORDER BY created_at DESC');
+    const page = pageClause(req.query);
+    const [rows] = await db.query('SELECT * FROM announcements ORDER BY created_at DESC, id DESC' + page.sql, page.params);
     const mapped = rows.map(r => ({
       id: r.id, title: r.title, message: r.content, priority: r.priority,
       author: r.author, date: r.date,
@@ -2,7 +2,7 @@
 // Assignment Routes — CRUD + File Upload (MySQL)
 // ─────────────────────────────────────────────────────────────────────────────
 import { Router } from 'express';
-import db from '../database/db.js';
+import db, { pageClause } from '../database/db.js';
 import { uploadAssignmentFiles } from '../middleware/upload.js';
 import fs from 'fs';
 import path from 'path';
@@ -46,7 +46,10 @@ router.get('/', async (req, res) => {
       params.push(createdBy);
     }
     if (conditions.length) sql += ' WHERE ' + conditions.join(' AND ');
-    sql += ' ORDER BY created_at DESC';
+    sql += ' ORDER BY created_at DESC, id DESC';
+    const page = pageClause(req.query);
+    sql += page.sql;
+    params.push(...page.params);
 
     const [rows] = await db.query(sql, params);
     // Attach files for each assignment
@@ -2,7 +2,7 @@
 // Course Routes — CRUD + Enrollment (MySQL)
 // ─────────────────────────────────────────────────────────────────────────────
 import { Router } from 'express';
-import db from '../database/db.js';
+import db, { pageClause } from '../database/db.js';
 
 const router = Router();
 
@@ -33,7 +33,10 @@ router.get('/', async (req, res) => {
     if (createdBy) { conditions.push('created_by = ?'); params.push(createdBy); }
     if (status) { conditions.push('status = ?'); params.push(status); }
     if (conditions.length) sql += ' WHERE ' + conditions.join(' AND ');
-    sql += ' ORDER BY created_at DESC';
+    sql += ' ORDER BY created_at DESC, id DESC';
+    const page = pageClause(req.query);
+    sql += page.sql;
+    params.push(...page.params);
 
     const [rows] = await db.query(sql, params);
     res.json(rows.map(mapCourse));
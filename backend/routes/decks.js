@@ -0,0 +1,47 @@
+// ─────────────────────────────────────────────────────────────────────────────
+// Deck Routes — proxy to the Python deck render service (ppt_server.py)
+// ─────────────────────────────────────────────────────────────────────────────
+import { Router } from 'express';
+
+const router = Router();
+const DECK_SERVICE_URL = process.env.DECK_SERVICE_URL || 'http://127.0.0.1:8765';
+
+// Helper: forward one request and stream the .pptx (or the error) back
+async function forward(req, res, path, init = {}) {
+  try {
+    const headers = { ...(init.headers || {}) };
+    if (req.headers['if-none-match']) headers['If-None-Match'] = req.headers['if-none-match'];
+    const upstream = await fetch(`${DECK_SERVICE_URL}${path}`, { ...init, headers });
+    if (upstream.status === 304) return res.status(304).end();
+    if (!upstream.ok) {
+      const body = await upstream.json().catch(() => ({}));
+      return res.status(upstream.status).json({ error: body.error || 'Failed to render deck.' });
+    }
+    for (const name of ['content-type', 'content-disposition', 'etag']) {
+      const value = upstream.headers.get(name);
+      if (value) res.setHeader(name, value);
+    }
+    res.send(Buffer.from(await upstream.arrayBuffer()));
+  } catch (err) {
+    console.error('Deck service error:', err);
+    res.status(502).json({ error: 'Deck service unavailable.' });
+  }
+}
+
+// ── GET course report deck ──────────────────────────────────────────────────
+router.get('/course/:id', (req, res) => forward(req, res, `/decks/course/${Number(req.params.id)}`));
+
+// ── GET student report deck ─────────────────────────────────────────────────
+router.get('/student/:id', (req, res) => forward(req, res, `/decks/student/${Number(req.params.id)}`));
+
+// ── GET analytics deck ──────────────────────────────────────────────────────
+router.get('/analytics', (req, res) => forward(req, res, '/decks/analytics'));
+
+// ── POST render a deck spec ─────────────────────────────────────────────────
+router.post('/render', (req, res) => forward(req, res, '/render', {
+  method: 'POST',
+  headers: { 'Content-Type': 'application/json' },
+  body: JSON.stringify(req.body),
+}));
+
+export default router;
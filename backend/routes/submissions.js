@@ -2,7 +2,7 @@
 // Submission Routes — Students submit work (MySQL)
 // ─────────────────────────────────────────────────────────────────────────────
 import { Router } from 'express';
-import db from '../database/db.js';
+import db, { pageClause } from '../database/db.js';
 import { uploadSubmissionFiles } from '../middleware/upload.js';
 import fs from 'fs';
 import path from 'path';
@@ -45,7 +45,10 @@ router.get('/', async (req, res) => {
     if (studentId) { conditions.push('student_id = ?'); params.push(studentId); }
     if (courseId) { conditions.push('course_id = ?'); params.push(courseId); }
     if (conditions.length) sql += ' WHERE ' + conditions.join(' AND ');
-    sql += ' ORDER BY submitted_at DESC';
+    sql += ' ORDER BY submitted_at DESC, id DESC';
+    const page = pageClause(req.query);
+    sql += page.sql;
+    params.push(...page.params);
 
     const [rows] = await db.query(sql, params);
     const results = await Promise.all(rows.map(s => getSubmissionWithFiles(s.id)));
@@ -2,14 +2,15 @@
 // User Routes — CRUD for admin user management (MySQL)
 // ─────────────────────────────────────────────────────────────────────────────
 import { Router } from 'express';
-import db from '../database/db.js';
+import db, { pageClause } from '../database/db.js';
 
 const router = Router();
 
 // ── GET all users ───────────────────────────────────────────────────────────
-router.get('/', async (_req, res) => {
+router.get('/', async (req, res) => {
   try {
-    const [rows] = await db.query('SELECT id, name, email, role, initials, status, joined_date, last_active, courses_count, created_at FROM users');
+    const page = pageClause(req.query);
+    const [rows] = await db.query('SELECT id, name, email, role, initials, status, joined_date, last_active, courses_count, created_at FROM users ORDER BY id' + page.sql, page.params);
     res.json(rows);
   } catch (err) {
     console.error('Get users error:', err);
@@ -0,0 +1,129 @@
+"""Shape count and prs.save() time: one text box per bullet vs. one text frame per list.
+
+    python bench_ppt.py [--slides 500] [--repeat 3]
+    python bench_ppt.py --memory [--sizes 1000,10000,50000]
+
+--memory compares peak RSS of a one-slide-per-student roster deck written
+with ppt_stream.StreamingDeck against python-pptx's in-memory save(); every
+case runs in a fresh subprocess.
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+import make_ppt
+
+
+def synthetic_spec(n_slides, spec=None):
+    """Spec of n_slides made by cycling through the prototype slides."""
+    spec = spec or make_ppt.default_spec()
+    slides = spec["slides"]
+    return dict(spec, slides=[slides[i % len(slides)] for i in range(n_slides)])
+
+def shape_count(prs):
+    return sum(len(s.shapes) for s in prs.slides)
+
+def time_save(prs, repeat):
+    """Best-of-`repeat` save time in seconds, plus output size."""
+    best = None
+    for _ in range(repeat):
+        buf = BytesIO()
+        t0 = time.perf_counter()
+        prs.save(buf)
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return best, len(buf.getvalue())
+
+
+# ── Peak memory ───────────────────────────────────────────────
+def roster_slide(s, i):
+    make_ppt.header_bar(s, f"Student {i}", f"student{i}@dbb.edu  |  Student")
+    make_ppt.box(s, 0.5, 1.5, 12.33, 2.2, make_ppt.LBLUE, make_ppt.BLUE, 1)
+    make_ppt.txt(s, f"Enrolled in {i % 7 + 1} courses", 0.8, 1.7, 6, 0.4, 16, True, make_ppt.NAVY)
+    make_ppt.txt(s, f"Average score {40 + i % 61}%", 0.8, 2.3, 6, 0.4, 13, color=make_ppt.DKGREY)
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB.
+
+    VmHWM starts afresh at exec; ru_maxrss (the fallback off Linux) would
+    also count the parent's footprint at fork.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _memory_child(n, mode, out):
+    """Write an n-slide roster deck to `out`; print peak RSS (MB) and seconds."""
+    t0 = time.perf_counter()
+    if mode == "stream":
+        import ppt_stream
+        with ppt_stream.StreamingDeck(out) as deck:
+            for i in range(n):
+                with deck.slide() as s:
+                    roster_slide(s, i)
+    else:
+        prs = make_ppt.new_presentation()
+        for i in range(n):
+            roster_slide(make_ppt.blank_slide(prs), i)
+        prs.save(out)
+    print(peak_rss_mb(), time.perf_counter() - t0)
+
+def memory_bench(sizes, inmemory_max):
+    out = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".bench_memory.pptx")
+    print(f"{'slides':>7} {'mode':<9} {'peak MB':>9} {'seconds':>9} {'bytes':>12}")
+    try:
+        for n in sizes:
+            for mode in ("stream", "in-memory"):
+                if mode == "in-memory" and n > inmemory_max:
+                    continue
+                res = subprocess.run([sys.executable, os.path.abspath(__file__), "--_child",
+                                      str(n), mode, out], capture_output=True, text=True, check=True)
+                rss_mb, seconds = res.stdout.split()
+                print(f"{n:>7} {mode:<9} {float(rss_mb):>9.1f} {float(seconds):>9.2f}"
+                      f" {os.path.getsize(out):>12}")
+    finally:
+        if os.path.exists(out):
+            os.remove(out)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--slides", type=int, default=500, help="size of the synthetic deck")
+    ap.add_argument("--repeat", type=int, default=3, help="save() runs per case, best is kept")
+    ap.add_argument("--memory", action="store_true", help="peak-RSS benchmark of the streaming writer")
+    ap.add_argument("--sizes", default="1000,10000,50000", help="deck sizes for --memory")
+    ap.add_argument("--inmemory-max", type=int, default=1000,
+                    help="largest --memory size also run through prs.save()")
+    ap.add_argument("--_child", nargs=3, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args._child:
+        n, mode, out = args._child
+        return _memory_child(int(n), mode, out)
+    if args.memory:
+        return memory_bench([int(n) for n in args.sizes.split(",")], args.inmemory_max)
+
+    print(f"{'deck':<10} {'mode':<8} {'shapes':>8} {'build s':>9} {'save s':>9} {'bytes':>10}")
+    for n in (len(make_ppt.default_spec()["slides"]), args.slides):
+        for frames in (False, True):
+            spec = synthetic_spec(n)
+            spec["bullet_frames"] = frames
+            t0 = time.perf_counter()
+            prs = make_ppt.build_deck(spec)
+            build_s = time.perf_counter() - t0
+            save_s, size = time_save(prs, args.repeat)
+            mode = "frame" if frames else "per-box"
+            print(f"{n:>4} slides {mode:<8} {shape_count(prs):>8} {build_s:>9.3f} {save_s:>9.3f} {size:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Benchmark suite for the deck generation hot paths.
+
+    python bench_suite.py [--sizes 8,100,1000,10000] [--out bench_results.json]
+                          [--baseline bench_baseline.json] [--update-baseline]
+                          [--threshold 0.15]
+
+Times each helper in isolation (microseconds per call, best of --repeat),
+then full builds of the prototype deck cycled to each size: build time,
+prs.save() and ppt_save.save() time, shape count, output bytes and peak
+RSS. Every build runs in a fresh subprocess so peak memory is per case.
+Results are written as JSON; if a baseline file exists, time and memory
+figures more than --threshold above it are reported as regressions and the
+exit status is 1.
+Baselines are machine specific, so none is checked in: record one with
+--update-baseline on the machine that runs the comparison.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from io import BytesIO
+
+import pptx
+
+import make_ppt
+import ppt_save
+from bench_ppt import peak_rss_mb, shape_count, synthetic_spec
+from make_ppt import BLUE, LBLUE, NAVY
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "bench_baseline.json")
+
+# Helper -> call under test, on a blank slide
+HELPERS = {
+    "box": lambda s: make_ppt.box(s, 1, 1, 3, 1, LBLUE, BLUE, 1),
+    "txt": lambda s: make_ppt.txt(s, "Course progress", 1, 1, 4, 0.4, 14, True, NAVY),
+    "bullet_block": lambda s: make_ppt.bullet_block(
+        s, "Features", ["Dashboards", "Courses", "Assignments", "Grading"], 1, 1, 5),
+    "flow_box": lambda s: make_ppt.flow_box(s, "Login", 1, 1),
+    "arrow": lambda s: make_ppt.arrow(s, 1, 1),
+    "header_bar": lambda s: make_ppt.header_bar(s, "System Overview", "What the platform does"),
+}
+
+# Metrics compared against the baseline (lower is better)
+WATCHED = ("us_per_call", "build_s", "save_s", "fast_save_s", "peak_mb")
+
+
+def time_helper(fn, calls=200, per_slide=20, repeat=5):
+    """Best-of-`repeat` microseconds per call, and shapes added per call.
+
+    Calls are spread over fresh slides, `per_slide` each, so shape-ID
+    allocation on an ever-growing slide does not skew the figure.
+    """
+    best = None
+    for _ in range(repeat):
+        prs = make_ppt.new_presentation()
+        slides = [make_ppt.blank_slide(prs) for _ in range(-(-calls // per_slide))]
+        t0 = time.perf_counter()
+        for i in range(calls):
+            fn(slides[i // per_slide])
+        dt = time.perf_counter() - t0
+        best = dt if best is None else min(best, dt)
+    return {"us_per_call": round(best / calls * 1e6, 2),
+            "shapes_per_call": shape_count(prs) / calls}
+
+def build_case(n):
+    """Build and save an n-slide deck in this process; peak RSS covers only this case."""
+    spec = synthetic_spec(n)
+    t0 = time.perf_counter()
+    prs = make_ppt.build_deck(spec)
+    build_s = time.perf_counter() - t0
+    buf = BytesIO()
+    t0 = time.perf_counter()
+    prs.save(buf)
+    save_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    ppt_save.save_bytes(prs)
+    fast_save_s = time.perf_counter() - t0
+    return {"build_s": round(build_s, 4), "save_s": round(save_s, 4),
+            "fast_save_s": round(fast_save_s, 4),
+            "shapes": shape_count(prs), "bytes": len(buf.getvalue()),
+            "peak_mb": round(peak_rss_mb(), 1)}
+
+def run_suite(sizes, repeat=5):
+    results = {
+        "meta": {"python": platform.python_version(), "python_pptx": pptx.__version__,
+                 "machine": platform.machine(), "code_version": make_ppt.code_version(),
+                 "time": time.strftime("%Y-%m-%dT%H:%M:%S")},
+        "helpers": {},
+        "builds": {},
+    }
+    for name, fn in HELPERS.items():
+        results["helpers"][name] = r = time_helper(fn, repeat=repeat)
+        print(f"  {name:<14} {r['us_per_call']:>9.1f} us/call  {r['shapes_per_call']:.0f} shapes",
+              file=sys.stderr)
+    for n in sizes:
+        res = subprocess.run([sys.executable, os.path.abspath(__file__), "--_case", str(n)],
+                             capture_output=True, text=True, check=True)
+        results["builds"][str(n)] = r = json.loads(res.stdout)
+        print(f"  {n:>6} slides  build {r['build_s']:.3f}s  save {r['save_s']:.3f}s"
+              f" (ppt_save {r['fast_save_s']:.3f}s)"
+              f"  {r['shapes']} shapes  {r['bytes']} bytes  {r['peak_mb']} MB", file=sys.stderr)
+    return results
+
+def _flatten(results):
+    for group in ("helpers", "builds"):
+        for case, metrics in results.get(group, {}).items():
+            for metric, value in metrics.items():
+                if metric in WATCHED:
+                    yield f"{group}.{case}.{metric}", value
+
+def regressions(results, baseline, threshold=0.15):
+    """(metric, baseline, current) for every watched metric over baseline * (1 + threshold)."""
+    base = dict(_flatten(baseline))
+    return [(key, base[key], value) for key, value in _flatten(results)
+            if base.get(key) and value > base[key] * (1 + threshold)]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--sizes", default="8,100,1000,10000", help="slide counts of the full builds")
+    ap.add_argument("--repeat", type=int, default=5, help="helper timing runs, best is kept")
+    ap.add_argument("--out", default="bench_results.json", help="where to write the results")
+    ap.add_argument("--baseline", default=DEFAULT_BASELINE, help="results to compare against")
+    ap.add_argument("--update-baseline", action="store_true",
+                    help="store these results as the new baseline")
+    ap.add_argument("--threshold", type=float, default=0.15,
+                    help="relative slowdown reported as a regression")
+    ap.add_argument("--_case", type=int, help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args._case:
+        print(json.dumps(build_case(args._case)))
+        return 0
+
+    results = run_suite([int(n) for n in args.sizes.split(",")], args.repeat)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print("Results:", args.out)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print("Baseline updated:", args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against; record one with --update-baseline")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        slow = regressions(results, json.load(f), args.threshold)
+    for key, before, after in slow:
+        print(f"REGRESSION {key}: {before} -> {after} (+{(after / before - 1) * 100:.0f}%)")
+    if not slow:
+        print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,42 @@
+"""Digital Black Board prototype deck generator.
+
+The deck content lives in a declarative spec (``deck_spec.json`` by default,
+or any JSON/YAML file with the same shape). ``compile_plan(spec)`` turns it
+into a flat layout plan of positioned primitives, and ``emit_plan(plan)``
+replays that plan through the python-pptx helpers below.
+
+Import and call ``build_deck(spec)`` / ``render_bytes(spec)`` to render the
+deck in-process, or run ``python make_ppt.py [out.pptx]`` to write it to disk.
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import zipfile
+from contextlib import nullcontext
+from copy import deepcopy
+from functools import lru_cache
+from io import BytesIO
+
 from pptx import Presentation
-from pptx.util import Inches, Pt, Emu
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.util import Inches, Length, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
-from pptx.util import Inches, Pt
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+import ppt_images
+import ppt_metrics
+import ppt_save
+import ppt_scene
+from ppt_metrics import LINE, face_id, fit_size, line_counts, metrics, text_height
+from ppt_scene import Scene, emu, grid
+from ppt_zip import ZipWriter
 
 # ── Color palette ──────────────────────────────────────────────
 NAVY    = RGBColor(0x1E, 0x3A, 0x5F)
@@ -17,85 +51,195 @@ AMBER   = RGBColor(0xB4, 0x53, 0x09)
 GREEN   = RGBColor(0x05, 0x96, 0x69)
 BLACK   = RGBColor(0x1E, 0x2A, 0x3A)
 
-prs = Presentation()
-prs.slide_width  = Inches(13.33)
-prs.slide_height = Inches(7.5)
-
-BLANK = prs.slide_layouts[6]   # completely blank layout
+# Names a spec may use instead of hex colors
+PALETTE = {
+    "NAVY": NAVY, "BLUE": BLUE, "LBLUE": LBLUE, "WHITE": WHITE, "GREY": GREY,
+    "DKGREY": DKGREY, "RED": RED, "PURPLE": PURPLE, "AMBER": AMBER,
+    "GREEN": GREEN, "BLACK": BLACK,
+}
+
+SLIDE_W = 13.33
+SLIDE_H = 7.5
+BLANK_LAYOUT = 6   # index of the completely blank layout
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "deck_spec.json")
+DEFAULT_OUT = "DBB_Prototype_Presentation.pptx"
+
+
+@lru_cache(maxsize=None)
+def _base_presentation():
+    prs = Presentation()
+    prs.slide_width  = Inches(SLIDE_W)
+    prs.slide_height = Inches(SLIDE_H)
+    return prs
+
+def new_presentation():
+    """Empty 16:9 presentation; each call returns an independent object.
+
+    Copies a template parsed once per process, about 4x cheaper than
+    opening the default template with Presentation() every time.
+    """
+    return deepcopy(_base_presentation())
+
+def blank_slide(prs):
+    return prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT])
+
+@lru_cache(maxsize=None)
+def _hex_rgb(value):
+    return PALETTE.get(value) or RGBColor.from_string(value.lstrip("#"))
+
+def color(value):
+    """RGBColor from an RGBColor, a PALETTE name or a hex string; None stays None."""
+    if value is None or isinstance(value, RGBColor):
+        return value
+    return _hex_rgb(value)
+
+# ── Run styles ─────────────────────────────────────────────────
+# Named run formats. Every (style, overrides) combination is compiled once
+# into an <a:r> template and each run is a deep copy of it, instead of
+# setting font.size/bold/italic/color one python-pptx proxy at a time.
+STYLES = {
+    "text":            dict(size=18, bold=False, italic=False, color=BLACK),
+    "header-title":    dict(size=24, bold=True, italic=False, color=WHITE),
+    "header-subtitle": dict(size=12, bold=False, italic=False, color=RGBColor(0xA8,0xC4,0xE0)),
+    "block-heading":   dict(size=14, bold=True, color=NAVY),
+    "bullet":          dict(size=12, color=BLACK),
+    "strip-title":     dict(size=13, bold=True, color=WHITE),
+    "flow-label":      dict(size=11, bold=True, color=NAVY),
+    "card-body":       dict(size=10, bold=False, italic=False, color=BLACK),
+}
+
+def run_format(name="text", size=None, bold=None, italic=None, color=None):
+    """STYLES[name] as a new dict, with the non-None arguments overriding it."""
+    fmt = dict(STYLES[name])
+    for key, val in (("size", size), ("bold", bold), ("italic", italic), ("color", color)):
+        if val is not None:
+            fmt[key] = val
+    return fmt
+
+@lru_cache(maxsize=None)
+def run_style(name="text", size=None, bold=None, italic=None, color=None):
+    """Compiled <a:r> template for run_format(name, ...)."""
+    fmt = run_format(name, size, bold, italic, color)
+    attrs = f'sz="{round(fmt["size"]*100)}"'
+    if fmt.get("bold") is not None:
+        attrs += f' b="{int(fmt["bold"])}"'
+    if fmt.get("italic") is not None:
+        attrs += f' i="{int(fmt["italic"])}"'
+    return parse_xml(
+        f'<a:r {nsdecls("a")}><a:rPr {attrs}><a:solidFill><a:srgbClr val="{fmt["color"]}"/>'
+        f'</a:solidFill></a:rPr><a:t/></a:r>'
+    )
+
+def add_run(p, text, style):
+    """Append a run of `text` to a fresh paragraph p, formatted from a run_style() template."""
+    r = deepcopy(style)
+    r.text = text   # escapes control characters the same way _Run.text does
+    p._p.append(r)
+    return r
 
 # ── Helpers ────────────────────────────────────────────────────
-def bg(slide, color):
+# Geometry arguments are inches, or Lengths (EMU) when replayed from a Scene.
+def _len(value):
+    return value if isinstance(value, Length) else Inches(value)
+
+def bg(slide, color_):
     fill = slide.background.fill
     fill.solid()
-    fill.fore_color.rgb = color
+    fill.fore_color.rgb = color(color_)
 
 def box(slide, l, t, w, h, fill_color=None, border_color=None, border_pt=0):
-    shape = slide.shapes.add_shape(1, Inches(l), Inches(t), Inches(w), Inches(h))
+    shape = slide.shapes.add_shape(1, _len(l), _len(t), _len(w), _len(h))
     shape.line.width = Pt(border_pt)
     if fill_color:
         shape.fill.solid()
-        shape.fill.fore_color.rgb = fill_color
+        shape.fill.fore_color.rgb = color(fill_color)
     else:
         shape.fill.background()
     if border_color and border_pt:
-        shape.line.color.rgb = border_color
+        shape.line.color.rgb = color(border_color)
     else:
         shape.line.fill.background()
     return shape
 
 def txt(slide, text, l, t, w, h,
-        size=18, bold=False, color=BLACK, align=PP_ALIGN.LEFT,
-        wrap=True, italic=False):
-    txb = slide.shapes.add_textbox(Inches(l), Inches(t), Inches(w), Inches(h))
+        size=None, bold=None, color=None, align=PP_ALIGN.LEFT,
+        wrap=True, italic=None, style="text"):
+    txb = slide.shapes.add_textbox(_len(l), _len(t), _len(w), _len(h))
     txb.word_wrap = wrap
     tf = txb.text_frame
     tf.word_wrap = wrap
     p = tf.paragraphs[0]
     p.alignment = align
-    run = p.add_run()
-    run.text = text
-    run.font.size = Pt(size)
-    run.font.bold = bold
-    run.font.italic = italic
-    run.font.color.rgb = color
+    add_run(p, text, run_style(style, size, bold, italic, color))
     return txb
 
 def header_bar(slide, title, subtitle=None):
     """Dark navy top bar with title."""
-    box(slide, 0, 0, 13.33, 1.1, NAVY)
-    txt(slide, title, 0.4, 0.15, 10, 0.6, size=24, bold=True, color=WHITE)
-    if subtitle:
-        txt(slide, subtitle, 0.4, 0.72, 10, 0.35, size=12, color=RGBColor(0xA8,0xC4,0xE0))
+    sp = SlidePlan()
+    sp.header_bar(title, subtitle)
+    emit_ops(slide, sp.ops)
+
+def title_strip(slide, title, l, t, w, h, color, size=13):
+    """Solid colored card header with a centered white title."""
+    strip = box(slide, l, t, w, h, color, color, 0)
+    p = strip.text_frame.paragraphs[0]
+    p.alignment = PP_ALIGN.CENTER
+    add_run(p, title, run_style("strip-title", size=size))
+    return strip
+
+def _add_runs(p, item, size, color, prefix=""):
+    """Append an item's runs to paragraph p; item is a string or (text, bold, color) runs."""
+    if isinstance(item, str):
+        item = [(item, False, color)]
+    for i, (text, bold, run_color) in enumerate(item):
+        add_run(p, (prefix if i == 0 else "") + text,
+                run_style("bullet", size, bold or None, None, run_color))
+
+def bullet_list(slide, items, l, t, w, step, size=12, color=BLACK,
+                bullet="-", indent=0.2, frame=True):
+    """Bullet list with `step` inches between items; returns bottom Y.
+
+    With frame=True the whole list is one text box holding a paragraph per
+    item, spaced with space-after and hung from a bullet indent, and sized
+    by bullets_height() so wrapped items stay inside it. frame=False
+    keeps the old layout of one text box per item.
+    """
+    if not frame:
+        for item in items:
+            ibox = slide.shapes.add_textbox(_len(l), _len(t), _len(w), Inches(step-0.02))
+            ibox.text_frame.word_wrap = True
+            _add_runs(ibox.text_frame.paragraphs[0], item, size, color,
+                      bullet + " " if bullet else "")
+            t = Emu(t + Inches(step)) if isinstance(t, Length) else t + step
+        return t
+
+    height = bullets_height(items, w.inches if isinstance(w, Length) else w, step, size,
+                            indent if bullet else 0)
+    lbox = slide.shapes.add_textbox(_len(l), _len(t), _len(w), Inches(height))
+    tf = lbox.text_frame
+    tf.word_wrap = True
+    gap = Pt(max(step*72 - size*1.2, 0))   # pitch minus one line of text
+    for i, item in enumerate(items):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        p.space_after = gap
+        if bullet:
+            pPr = p._p.get_or_add_pPr()
+            pPr.set("marL", str(Inches(indent)))
+            pPr.set("indent", str(-Inches(indent)))
+            pPr.append(pPr.makeelement(qn("a:buChar"), {"char": bullet}))
+        _add_runs(p, item, size, color)
+    return Emu(t + Inches(height)) if isinstance(t, Length) else t + height
 
 def bullet_block(slide, heading, bullets, l, t, w,
-                 head_color=NAVY, bullet_color=BLACK, head_size=14, bullet_size=12):
+                 head_color=NAVY, bullet_color=BLACK, head_size=14, bullet_size=12,
+                 frame=True):
     """Heading + bullet list block."""
-    # Heading
-    hbox = slide.shapes.add_textbox(Inches(l), Inches(t), Inches(w), Inches(0.35))
-    hbox.word_wrap = True
-    htf = hbox.text_frame
-    htf.word_wrap = True
-    hp = htf.paragraphs[0]
-    hr = hp.add_run()
-    hr.text = heading
-    hr.font.size = Pt(head_size)
-    hr.font.bold = True
-    hr.font.color.rgb = head_color
-
-    cur_t = t + 0.38
-    for b in bullets:
-        bh = 0.28
-        bbox = slide.shapes.add_textbox(Inches(l+0.15), Inches(cur_t), Inches(w-0.15), Inches(bh))
-        bbox.word_wrap = True
-        btf = bbox.text_frame
-        btf.word_wrap = True
-        bp = btf.paragraphs[0]
-        br = bp.add_run()
-        br.text = "  -  " + b
-        br.font.size = Pt(bullet_size)
-        br.font.color.rgb = bullet_color
-        cur_t += bh + 0.02
-    return cur_t  # returns bottom Y
+    sp = SlidePlan(frames=frame)
+    bottom = sp.bullet_block(heading, bullets, l, t, w, head_color, bullet_color,
+                             head_size, bullet_size)
+    emit_ops(slide, sp.ops)
+    return bottom  # returns bottom Y
 
 def flow_box(slide, label, l, t, w=1.7, h=0.55,
              fill=LBLUE, border=BLUE, tcolor=NAVY):
@@ -104,510 +248,945 @@ def flow_box(slide, label, l, t, w=1.7, h=0.55,
     tf.word_wrap = True
     p = tf.paragraphs[0]
     p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = label
-    r.font.size = Pt(11)
-    r.font.bold = True
-    r.font.color.rgb = tcolor
+    add_run(p, label, run_style("flow-label", color=tcolor))
 
 def arrow(slide, l, t, w=0.4, h=0.04):
     """Simple horizontal arrow line."""
-    conn = slide.shapes.add_shape(1, Inches(l), Inches(t), Inches(w), Inches(h))
+    conn = slide.shapes.add_shape(1, _len(l), _len(t), _len(w), _len(h))
     conn.fill.solid()
     conn.fill.fore_color.rgb = BLUE
     conn.line.fill.background()
 
+CHART_TYPES = {
+    "column": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "bar": XL_CHART_TYPE.BAR_CLUSTERED,
+    "pie": XL_CHART_TYPE.PIE,
+    "doughnut": XL_CHART_TYPE.DOUGHNUT,
+}
+POINT_COLORS = (BLUE, PURPLE, AMBER, GREEN, RED, NAVY)   # pie/doughnut slices, in turn
+
+def chart(slide, kind, categories, series, l, t, w, h, size=11):
+    """Native chart; series is a list of (name, values, color) and kind a CHART_TYPES key."""
+    data = CategoryChartData()
+    data.categories = categories
+    for name, values, _ in series:
+        data.add_series(name, values)
+    frame = slide.shapes.add_chart(CHART_TYPES[kind], _len(l), _len(t), _len(w), _len(h), data)
+    ch = frame.chart
+    ch.font.size = Pt(size)
+    ch.font.color.rgb = DKGREY
+    plot = ch.plots[0]
+    if kind in ("pie", "doughnut"):
+        ch.has_legend = True
+        ch.legend.position = XL_LEGEND_POSITION.RIGHT
+        ch.legend.include_in_layout = False
+        for i, point in enumerate(plot.series[0].points):
+            point.format.fill.solid()
+            point.format.fill.fore_color.rgb = POINT_COLORS[i % len(POINT_COLORS)]
+    else:
+        ch.has_legend = len(series) > 1
+        if ch.has_legend:
+            ch.legend.position = XL_LEGEND_POSITION.TOP
+            ch.legend.include_in_layout = False
+        plot.gap_width = 60
+        for plot_series, (_, _, series_color) in zip(plot.series, series):
+            plot_series.format.fill.solid()
+            plot_series.format.fill.fore_color.rgb = color(series_color or BLUE)
+    plot.has_data_labels = True
+    plot.data_labels.font.size = Pt(size - 1)
+    return frame
+
+def stamp(slide, component, l, t, w, h, params):
+    """Instance of COMPONENTS[component] at (l, t); w and h are its bounds."""
+    COMPONENTS[component].stamp(slide, _len(l), _len(t), params)
+
+def image(slide, src, l, t, w, h, fit="contain", px=None):
+    """Picture of `src` (a path or upload URL) fitted to the box, "contain" or "cover".
+
+    px is the pixel size compile_plan() settled for the deck; without it the
+    picture is sized for this box. Missing or non-raster files get a blank card.
+    """
+    l, t, w, h = _len(l), _len(t), _len(w), _len(h)
+    store = ppt_images.store()
+    source = store.source(src)
+    if source is None:
+        return box(slide, l, t, w, h, GREY, RGBColor(0xDD,0xE6,0xF0), 1)
+    if px is None:
+        px = ppt_images.pixels(source, ppt_images.box_scale(source, w.inches, h.inches, fit))
+    dx, dy, pw, ph, crop = ppt_images.placement(source, w, h, fit)
+    pic = slide.shapes.add_picture(BytesIO(store.fitted(source, *px)),
+                                   Emu(l + int(dx)), Emu(t + int(dy)), Emu(int(pw)), Emu(int(ph)))
+    if any(crop):
+        pic.crop_left, pic.crop_top, pic.crop_right, pic.crop_bottom = crop
+    return pic
+
+# Plan op name -> helper; an op is [name, *helper args after `slide`]
+EMITTERS = {
+    "box": box,
+    "txt": txt,
+    "title_strip": title_strip,
+    "bullets": bullet_list,
+    "flow_box": flow_box,
+    "arrow": arrow,
+    "chart": chart,
+    "stamp": stamp,
+    "image": image,
+}
+
+
+# ── Layout plan ────────────────────────────────────────────────
+def _plain(value):
+    """JSON-friendly form of a helper argument."""
+    if isinstance(value, RGBColor):
+        return str(value)
+    if isinstance(value, PP_ALIGN):
+        return int(value)
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+def _item_text(item):
+    return item if isinstance(item, str) else "".join(run[0] for run in item)
+
+def bullets_height(items, w, step, size=12, indent=0.2):
+    """Height of a bullet text frame: `step` per item plus a line per extra wrapped line."""
+    lines = sum(line_counts(map(_item_text, items), w - indent, size))
+    return step*len(items) + (lines - len(items)) * size*LINE/72
+
+def bullets_fitting(items, w, step, size, budget, indent=0.2):
+    """How many leading `items` fit a bullet frame `budget` inches tall."""
+    counts = line_counts(map(_item_text, items), w - indent, size)
+    used = 0.0
+    for n, lines in enumerate(counts):
+        used += step + (lines - 1) * size*LINE/72
+        if used > budget + 1e-9:
+            return n
+    return len(counts)
+
+def step_rows(texts, w, size, row_h, gap, budget, min_size=7):
+    """(font size, row heights) for text rows stacked `gap` apart within `budget` inches.
+
+    Rows are at least row_h tall and grow when their text wraps; the size
+    drops by half points until the stack fits.
+    """
+    while True:
+        heights = [max(row_h, text_height(text, w, size)) for text in texts]
+        if sum(heights) + gap*(len(texts)-1) <= budget + 1e-9 or size <= min_size:
+            return size, heights
+        size -= 0.5
+
+class SlidePlan:
+    """Positioned primitives for one slide.
+
+    Methods mirror the helpers above (minus the slide argument) and record
+    one op per primitive; composites such as header_bar() expand into
+    primitives here, so emitting a plan does no layout math.
+    """
+
+    def __init__(self, frames=True):
+        self.frames = frames
+        self.background = None
+        self.ops = []
+
+    def _op(self, name, *args):
+        self.ops.append([name, *map(_plain, args)])
+
+    def bg(self, color_):
+        self.background = _plain(color_)
+
+    def box(self, l, t, w, h, fill_color=None, border_color=None, border_pt=0):
+        self._op("box", l, t, w, h, fill_color, border_color, border_pt)
+
+    def txt(self, text, l, t, w, h, size=None, bold=None, color=None,
+            align=PP_ALIGN.LEFT, wrap=True, italic=None, style="text"):
+        self._op("txt", text, l, t, w, h, size, bold, color, align, wrap, italic, style)
+
+    def title_strip(self, title, l, t, w, h, color, size=13):
+        self._op("title_strip", title, l, t, w, h, color, size)
+
+    def bullets(self, items, l, t, w, step, size=12, color=BLACK,
+                bullet="-", indent=0.2):
+        """Returns the bottom Y, measured: in one text frame, wrapped items push the rest down."""
+        self._op("bullets", items, l, t, w, step, size, color, bullet, indent, self.frames)
+        if not self.frames:
+            return t + step*len(items)
+        return t + bullets_height(items, w, step, size, indent if bullet else 0)
+
+    def flow_box(self, label, l, t, w=1.7, h=0.55, fill=LBLUE, border=BLUE, tcolor=NAVY):
+        self._op("flow_box", label, l, t, w, h, fill, border, tcolor)
+
+    def arrow(self, l, t, w=0.4, h=0.04):
+        self._op("arrow", l, t, w, h)
+
+    def chart(self, kind, categories, series, l, t, w, h, size=11):
+        self._op("chart", kind, categories, series, l, t, w, h, size)
+
+    def stamp(self, component, l, t, /, **params):
+        """Instance of COMPONENTS[component] with its top-left corner at (l, t)."""
+        w, h = COMPONENTS[component].size(params)
+        self._op("stamp", component, l, t, w, h, params)
+
+    def image(self, src, l, t, w, h, fit="contain"):
+        self._op("image", src, l, t, w, h, fit, None)
+
+    def header_bar(self, title, subtitle=None):
+        """Dark navy top bar with title."""
+        self.box(0, 0, SLIDE_W, 1.1, NAVY)
+        self.txt(title, 0.4, 0.15, 10, 0.6, style="header-title")
+        if subtitle:
+            self.txt(subtitle, 0.4, 0.72, 10, 0.35, style="header-subtitle")
+
+    def bullet_block(self, heading, bullets, l, t, w,
+                     head_color=NAVY, bullet_color=BLACK, head_size=14, bullet_size=12):
+        """Heading + bullet list block; returns bottom Y."""
+        self.txt(heading, l, t, w, 0.35, style="block-heading", size=head_size, color=head_color)
+        return self.bullets(bullets, l+0.15, t+0.38, w-0.15, 0.30,
+                            size=bullet_size, color=bullet_color)
+
+    def to_dict(self):
+        return {"bg": self.background, "ops": self.ops}
+
+
+# ── Components ─────────────────────────────────────────────────
+# A card is laid out once per distinct shape (sizes, fonts) by its build
+# function, drawn through the helpers on a scratch slide, and from then on
+# every instance is a deep copy of those <p:sp> elements with its text,
+# colors, offsets and shape ids filled in.
+def _paths(root, match):
+    """Child-index paths from root to each descendant for which match(el) gives a slot name."""
+    found = []
+    def walk(el, path):
+        for i, child in enumerate(el):
+            slot = match(child)
+            if slot is not None:
+                found.append((path + (i,), slot))
+            walk(child, path + (i,))
+    walk(root, ())
+    return found
+
+def _at(root, path):
+    for i in path:
+        root = root[i]
+    return root
+
+class Component:
+    """Shapes laid out by build(sp, **params) at the origin, stamped per instance.
+
+    Parameters named in `texts` (run text) and `colors` (never None) change
+    per instance; all other parameters select the template. build() must
+    not measure or branch on text and color values.
+    """
+
+    def __init__(self, build, texts=(), colors=()):
+        self.build = build
+        self.texts = tuple(texts)
+        self.colors = tuple(colors)
+        self._sizes = {}
+        self._templates = {}
+
+    def _key(self, params):
+        return json.dumps({k: v for k, v in params.items() if k not in self.texts + self.colors},
+                          sort_keys=True)
+
+    def ops(self, params, l=0, t=0):
+        """Plan ops of one instance at (l, t) inches."""
+        sp = SlidePlan()
+        self.build(sp, **params)
+        if not (l or t):
+            return sp.ops
+        scene = Scene.from_ops(sp.ops)
+        scene.translate(emu(l), emu(t))
+        return scene.to_ops()
+
+    def size(self, params):
+        """(w, h) in inches of the instance's bounding box."""
+        key = self._key(params)
+        if key not in self._sizes:
+            scene = Scene.from_ops(self.ops(params))
+            right, bottom = scene.extents()
+            self._sizes[key] = (max(right) / 914400, max(bottom) / 914400)
+        return self._sizes[key]
+
+    def _template(self, params):
+        key = self._key(params)
+        template = self._templates.get(key)
+        if template is None:
+            # Draw once with sentinel text and colors, then note where they landed.
+            texts = {f"\ue000{name}\ue001": name for name in self.texts}
+            colors = {f"C0FFE{i:X}": name for i, name in enumerate(self.colors)}
+            sentinel = dict(params, **{n: s for s, n in texts.items()},
+                            **{n: s for s, n in colors.items()})
+            slide = blank_slide(_scratch())
+            tree = slide.shapes._spTree
+            before = len(tree)
+            emit_ops(slide, self.ops(sentinel))
+            shapes = list(tree[before:])
+            a_t, srgb, cnvpr = qn("a:t"), qn("a:srgbClr"), qn("p:cNvPr")
+            template = [(sp, _paths(sp, lambda el: (
+                            ("text", texts.get(el.text)) if el.tag == a_t and el.text in texts else
+                            ("color", colors[el.get("val")]) if el.tag == srgb and el.get("val") in colors else
+                            ("off", None) if el.tag == qn("a:off") else
+                            ("id", None) if el.tag == cnvpr else None)))
+                        for sp in shapes]
+            self._templates[key] = template
+        return template
+
+    def part_names(self, params):
+        """Per shape of an instance: the text slot it holds, else its color slot, else its index."""
+        names = []
+        for k, (_, slots) in enumerate(self._template(params)):
+            held = ([name for _, (kind, name) in slots if kind == "text"]
+                    or [name for _, (kind, name) in slots if kind == "color"])
+            names.append(held[0] if held and held[0] not in names else str(k))
+        return names
+
+    def stamp(self, slide, l, t, params):
+        """Append an instance at (l, t) EMU to `slide`."""
+        shapes = slide.shapes
+        tree = shapes._spTree
+        next_id = shapes._next_shape_id
+        for sp, slots in self._template(params):
+            sp = deepcopy(sp)
+            for path, (kind, name) in slots:
+                el = _at(sp, path)
+                if kind == "text":
+                    el.getparent().text = params[name]     # a:r.text escapes like add_run
+                elif kind == "color":
+                    el.set("val", str(color(params[name])))
+                elif kind == "off":
+                    el.set("x", str(int(el.get("x")) + l))
+                    el.set("y", str(int(el.get("y")) + t))
+                else:
+                    el.set("id", str(next_id))
+                    el.set("name", f"{el.get('name').rsplit(' ', 1)[0]} {next_id - 1}")
+            tree.append(sp)
+            next_id += 1
+        if shapes._cached_max_shape_id is not None:
+            shapes._cached_max_shape_id = next_id - 1
+
+@lru_cache(maxsize=None)
+def _scratch():
+    return new_presentation()
+
+CARD_BORDER = RGBColor(0xDD,0xE6,0xF0)
+
+def role_card(s, name, email, password, fill, border, strip):
+    s.box(0, 0, 3.0, 6.05, fill, border, 1.5)
+    s.title_strip(name, 0, 0, 3.0, 0.5, strip, size=15)
+    s.txt(email, 0.1, 0.55, 2.8, 0.25, size=10, color=DKGREY, italic=True)
+    s.txt(password, 0.1, 0.78, 2.8, 0.25, size=9, color=DKGREY, italic=True)
+
+def branch_card(s, name, desc, fill, border, strip, w=2.9):
+    s.box(0, 0, w, 1.3, fill, border, 1.5)
+    s.title_strip(name, 0, 0, w, 0.45, strip, size=13)
+    s.txt(desc, 0.1, 0.48, w-0.2, 0.85, size=11, color=BLACK)
+
+def screen_card(s, name, roles, desc, strip, w=3.0, h=1.75, desc_size=9):
+    s.box(0, 0, w, h, WHITE, CARD_BORDER, 1)
+    s.title_strip(name, 0, 0, w, 0.38, strip, size=11)
+    s.txt(roles, 0.1, 0.42, w-0.2, 0.25, size=9, color=DKGREY, bold=True)
+    s.txt(desc, 0.1, 0.65, w-0.2, 1.05, size=desc_size, color=BLACK)
+
+def column_card(s, title, strip, w=3.0, h=6.1, strip_h=0.48, size=13):
+    s.box(0, 0, w, h, WHITE, CARD_BORDER, 1)
+    s.title_strip(title, 0, 0, w, strip_h, strip, size=size)
+
+def cred_card(s, role, email, password, accent):
+    s.box(0, 0, 3.0, 1.25, RGBColor(0x14,0x1E,0x33), accent, 1.5)
+    s.txt(role, 0.15, 0.07, 2.7, 0.3, size=12, bold=True, color=accent)
+    s.txt(email, 0.15, 0.41, 2.7, 0.25, size=10, color=WHITE)
+    s.txt(password, 0.15, 0.65, 2.7, 0.25, size=10, color=RGBColor(0xA8,0xC4,0xE0))
+
+# name -> Component; layouts place them with SlidePlan.stamp()
+COMPONENTS = {
+    "role_card": Component(role_card, ("name", "email", "password"), ("fill", "border", "strip")),
+    "branch_card": Component(branch_card, ("name", "desc"), ("fill", "border", "strip")),
+    "screen_card": Component(screen_card, ("name", "roles", "desc"), ("strip",)),
+    "column_card": Component(column_card, ("title",), ("strip",)),
+    "cred_card": Component(cred_card, ("role", "email", "password"), ("accent",)),
+}
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 1 — TITLE
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s1 = prs.slides.add_slide(BLANK)
-bg(s1, NAVY)
+def slide_title(s, d):
+    s.bg(NAVY)
 
-# Accent strip
-box(s1, 0, 6.8, 13.33, 0.7, BLUE)
+    # Accent strip
+    s.box(0, 6.8, 13.33, 0.7, BLUE)
 
-txt(s1, "Digital Black Board", 1.0, 1.6, 11.33, 1.2,
-    size=44, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-txt(s1, "Learning Management System", 1.0, 2.85, 11.33, 0.6,
-    size=22, bold=False, color=RGBColor(0x93,0xC5,0xFD), align=PP_ALIGN.CENTER)
+    s.txt(d["title"], 1.0, 1.6, 11.33, 1.2,
+          size=44, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    s.txt(d["subtitle"], 1.0, 2.85, 11.33, 0.6,
+          size=22, bold=False, color=RGBColor(0x93,0xC5,0xFD), align=PP_ALIGN.CENTER)
 
-divider = box(s1, 3.5, 3.55, 6.33, 0.05, fill_color=BLUE)
+    s.box(3.5, 3.55, 6.33, 0.05, fill_color=BLUE)
 
-txt(s1, "Prototype Design Document", 1.0, 3.75, 11.33, 0.5,
-    size=16, color=RGBColor(0xBF,0xDB,0xFE), align=PP_ALIGN.CENTER)
+    s.txt(d["document"], 1.0, 3.75, 11.33, 0.5,
+          size=16, color=RGBColor(0xBF,0xDB,0xFE), align=PP_ALIGN.CENTER)
 
-txt(s1, "TEAM 18  |  KL University  |  React 19 + Vite 7", 1.0, 4.25, 11.33, 0.4,
-    size=13, color=RGBColor(0xA8,0xC4,0xE0), align=PP_ALIGN.CENTER)
+    s.txt(d["tagline"], 1.0, 4.25, 11.33, 0.4,
+          size=13, color=RGBColor(0xA8,0xC4,0xE0), align=PP_ALIGN.CENTER)
 
-txt(s1, "https://digital-blackboard.netlify.app", 1.0, 6.9, 11.33, 0.4,
-    size=11, color=WHITE, align=PP_ALIGN.CENTER)
+    s.txt(d["url"], 1.0, 6.9, 11.33, 0.4,
+          size=11, color=WHITE, align=PP_ALIGN.CENTER)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 2 — PROJECT OVERVIEW
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s2 = prs.slides.add_slide(BLANK)
-bg(s2, GREY)
-header_bar(s2, "Project Overview", "What is Digital Black Board?")
-
-# Left column - About
-box(s2, 0.35, 1.25, 5.9, 5.75, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-bullet_block(s2, "About the Project", [
-    "Digital Black Board is a web-based Learning Management System (LMS)",
-    "Enables institutions to centralize academic management on one platform",
-    "Supports course creation, enrollment, assignments, and communication",
-    "Built with React 19 and Vite 7 using modern frontend architecture",
-    "Features role-based access control with four distinct user roles",
-    "Includes dark and light theme support with full mobile responsiveness",
-    "Data is persisted using browser localStorage for seamless session continuity",
-    "Deployed publicly on Netlify with GitHub-based auto-deployment",
-], 0.55, 1.35, 5.6, head_color=NAVY, bullet_color=BLACK, head_size=15)
-
-# Right column - Tech & Features
-box(s2, 6.55, 1.25, 6.45, 2.7, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-bullet_block(s2, "Technology Stack", [
-    "Frontend Framework: React 19",
-    "Build Tool: Vite 7",
-    "Language: JavaScript (ES2023)",
-    "Styling: Custom CSS with CSS Variables",
-    "State Management: React Context API",
-    "Persistence: Browser localStorage",
-    "Deployment: Netlify (CI/CD via GitHub)",
-], 6.75, 1.35, 6.1, head_color=NAVY, bullet_color=BLACK, head_size=15)
-
-box(s2, 6.55, 4.1, 6.45, 2.9, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-bullet_block(s2, "Key Features", [
-    "Four role-based dashboards (Admin, Instructor, Creator, Student)",
-    "Sliding panel login and signup with password strength indicator",
-    "Course creation, publishing, and enrollment workflow",
-    "Assignment submission and grading system",
-    "Announcements, analytics, content library, and settings",
-    "Hamburger menu navigation for mobile devices",
-], 6.75, 4.2, 6.1, head_color=NAVY, bullet_color=BLACK, head_size=15)
+def slide_overview(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    # Left column - About
+    s.box(0.35, 1.25, 5.9, 5.75, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+    s.bullet_block(d["about"]["heading"], d["about"]["bullets"],
+                   0.55, 1.35, 5.6, head_color=NAVY, bullet_color=BLACK, head_size=15)
+
+    # Right column - Tech & Features
+    s.box(6.55, 1.25, 6.45, 2.7, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+    s.bullet_block(d["stack"]["heading"], d["stack"]["bullets"],
+                   6.75, 1.35, 6.1, head_color=NAVY, bullet_color=BLACK, head_size=15)
+
+    s.box(6.55, 4.1, 6.45, 2.9, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+    s.bullet_block(d["features"]["heading"], d["features"]["bullets"],
+                   6.75, 4.2, 6.1, head_color=NAVY, bullet_color=BLACK, head_size=15)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 3 — ROLES
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s3 = prs.slides.add_slide(BLANK)
-bg(s3, GREY)
-header_bar(s3, "User Roles and Responsibilities", "4 roles with distinct permissions and access levels")
-
-roles = [
-    ("Admin", "admin@gmail.com", "Admin@123", RED,   RGBColor(0xFE,0xF2,0xF2), RGBColor(0xFC,0xA5,0xA5), [
-        "Manage all registered users (add, edit, deactivate, delete)",
-        "Create, edit, publish, and remove courses",
-        "Post platform-wide announcements",
-        "Create, assign, and grade assignments",
-        "View platform-wide analytics and statistics",
-        "Configure platform settings and contact information",
-    ]),
-    ("Instructor", "ins@gmail.com", "ins@123", PURPLE, RGBColor(0xF5,0xF3,0xFF), RGBColor(0xC4,0xB5,0xFD), [
-        "View and manage own created courses",
-        "Add and manage assignments for own courses",
-        "Track student submissions and performance",
-        "View course-level analytics",
-        "Read platform announcements",
-    ]),
-    ("Content Creator", "cc@gmail.com", "cc@123", AMBER, RGBColor(0xFF,0xFB,0xEB), RGBColor(0xFC,0xD3,0x4D), [
-        "Upload and manage learning materials",
-        "Edit or delete own content items",
-        "Manage the content library",
-        "View performance analytics for content",
-        "Access About and Contact pages",
-    ]),
-    ("Student", "st@gmail.com", "st@123", GREEN, RGBColor(0xEC,0xFD,0xF5), RGBColor(0x6E,0xE7,0xB7), [
-        "Browse all published courses",
-        "Enroll in courses of interest",
-        "Access enrolled courses via My Learning tab",
-        "View and submit assigned work",
-        "Track personal learning progress",
-        "Read platform announcements",
-    ]),
-]
-
-positions = [(0.3, 1.25), (3.55, 1.25), (6.8, 1.25), (10.05, 1.25)]
-
-for i, (role, email, pwd, color, bg_c, border_c, bullets) in enumerate(roles):
-    lx, ty = positions[i]
-    box(s3, lx, ty, 3.0, 6.05, bg_c, border_c, 1.5)
-    # Role title bar
-    tb = box(s3, lx, ty, 3.0, 0.5, color, color, 0)
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = role
-    r.font.size = Pt(15)
-    r.font.bold = True
-    r.font.color.rgb = WHITE
-
-    txt(s3, email, lx+0.1, ty+0.55, 2.8, 0.25, size=10,
-        color=DKGREY, italic=True)
-    txt(s3, "Pass: " + pwd, lx+0.1, ty+0.78, 2.8, 0.25, size=9,
-        color=DKGREY, italic=True)
-
-    cur = ty + 1.05
-    for b in bullets:
-        bbox = s3.shapes.add_textbox(Inches(lx+0.15), Inches(cur), Inches(2.75), Inches(0.3))
-        bbox.word_wrap = True
-        btf = bbox.text_frame
-        btf.word_wrap = True
-        bp = btf.paragraphs[0]
-        br = bp.add_run()
-        br.text = "- " + b
-        br.font.size = Pt(10)
-        br.font.color.rgb = BLACK
-        cur += 0.32
+def slide_roles(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    positions = [(0.3, 1.25), (3.55, 1.25), (6.8, 1.25), (10.05, 1.25)]
+
+    for i, role in enumerate(d["roles"]):
+        lx, ty = positions[i]
+        s.stamp("role_card", lx, ty, name=role["name"], email=role["email"],
+                password="Pass: " + role["password"], fill=color(role["bg"]),
+                border=color(role["border"]), strip=color(role["color"]))
+
+        s.bullets(role["bullets"], lx+0.15, ty+1.05, 2.75, 0.32, size=10, indent=0.15)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 4 — APPLICATION FLOW
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s4 = prs.slides.add_slide(BLANK)
-bg(s4, GREY)
-header_bar(s4, "Application Flow", "How a user moves from first visit to their dashboard")
-
-# Main flow row
-nodes_main = ["User Visits Site", "Auth Page", "Login / Sign Up", "Credentials Verified", "Role Dashboard"]
-start_x = 0.5
-node_w = 2.0
-gap = 0.45
-y_row = 1.8
-
-for i, label in enumerate(nodes_main):
-    lx = start_x + i*(node_w + gap)
-    fc = NAVY if i in [0,4] else LBLUE
-    bc = NAVY if i in [0,4] else BLUE
-    tc = WHITE if i in [0,4] else NAVY
-    flow_box(s4, label, lx, y_row, node_w, 0.65, fc, bc, tc)
-    if i < len(nodes_main)-1:
-        arrow(s4, lx+node_w+0.05, y_row+0.31, gap-0.1)
-
-# Branch label
-txt(s4, "Role-based redirection after successful authentication:", 0.5, 2.75, 12, 0.35,
-    size=13, bold=True, color=NAVY)
-
-# Four role branches
-branch_data = [
-    ("Admin",           "Full platform control\nUsers, Courses, Analytics, Settings",    RED,    RGBColor(0xFE,0xF2,0xF2), RGBColor(0xFC,0xA5,0xA5)),
-    ("Instructor",      "Teaching tools\nCourses, Assignments, Analytics",              PURPLE, RGBColor(0xF5,0xF3,0xFF), RGBColor(0xC4,0xB5,0xFD)),
-    ("Content Creator", "Media management\nContent Library, Performance",               AMBER,  RGBColor(0xFF,0xFB,0xEB), RGBColor(0xFC,0xD3,0x4D)),
-    ("Student",         "Learning journey\nBrowse, Enroll, Submit, Progress",           GREEN,  RGBColor(0xEC,0xFD,0xF5), RGBColor(0x6E,0xE7,0xB7)),
-]
-
-bw = 2.9
-for i, (role, desc, color, bgc, bdc) in enumerate(branch_data):
-    lx = 0.5 + i*(bw+0.3)
-    b = box(s4, lx, 3.2, bw, 1.3, bgc, bdc, 1.5)
-    tb = box(s4, lx, 3.2, bw, 0.45, color, color, 0)
-    tf = tb.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = role
-    r.font.size = Pt(13)
-    r.font.bold = True
-    r.font.color.rgb = WHITE
-    txt(s4, desc, lx+0.1, 3.68, bw-0.2, 0.85, size=11, color=BLACK)
-
-# Sub-flows
-txt(s4, "Authentication Sub-Flows", 0.5, 4.7, 12, 0.35, size=13, bold=True, color=NAVY)
-
-sub_flows = [
-    ("Sign Up Flow", ["Select role (Admin/Instructor/Creator/Student)", "Fill name, email, password, confirm password", "Enter staff code if non-student role", "Account created and auto-logged in to dashboard"]),
-    ("Login Flow", ["Enter registered email address", "Enter account password", "System validates credentials", "Redirected to role-specific dashboard"]),
-    ("Logout Flow", ["Click Sign Out button in sidebar footer", "Current session is cleared from storage", "User redirected to the authentication page"]),
-]
-
-for i, (title, steps) in enumerate(sub_flows):
-    lx = 0.5 + i*4.28
-    box(s4, lx, 5.1, 4.0, 2.3, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-    txt(s4, title, lx+0.15, 5.18, 3.7, 0.32, size=12, bold=True, color=NAVY)
-    for j, step in enumerate(steps):
-        txt(s4, f"{j+1}.  {step}", lx+0.15, 5.54+j*0.45, 3.7, 0.4, size=10, color=BLACK)
+def slide_flow(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    # Main flow row
+    nodes_main = d["nodes"]
+    start_x = 0.5
+    node_w = 2.0
+    gap = 0.45
+    y_row = 1.8
+
+    for i, label in enumerate(nodes_main):
+        lx = start_x + i*(node_w + gap)
+        ends = i in (0, len(nodes_main)-1)
+        fc = NAVY if ends else LBLUE
+        bc = NAVY if ends else BLUE
+        tc = WHITE if ends else NAVY
+        s.flow_box(label, lx, y_row, node_w, 0.65, fc, bc, tc)
+        if i < len(nodes_main)-1:
+            s.arrow(lx+node_w+0.05, y_row+0.31, gap-0.1)
+
+    # Branch label
+    s.txt(d["branches_heading"], 0.5, 2.75, 12, 0.35,
+          size=13, bold=True, color=NAVY)
+
+    # Four role branches
+    bw = 2.9
+    for i, branch in enumerate(d["branches"]):
+        lx = 0.5 + i*(bw+0.3)
+        s.stamp("branch_card", lx, 3.2, name=branch["name"], desc=branch["desc"], w=bw,
+                fill=color(branch["bg"]), border=color(branch["border"]), strip=color(branch["color"]))
+
+    # Sub-flows
+    s.txt(d["sub_flows_heading"], 0.5, 4.7, 12, 0.35, size=13, bold=True, color=NAVY)
+
+    for i, flow in enumerate(d["sub_flows"]):
+        lx = 0.5 + i*4.28
+        s.box(lx, 5.1, 4.0, 2.3, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+        s.txt(flow["title"], lx+0.15, 5.18, 3.7, 0.32, size=12, bold=True, color=NAVY)
+        steps = [f"{j+1}.  {step}" for j, step in enumerate(flow["steps"])]
+        size, heights = step_rows(steps, 3.7, 10, 0.4, 0.05, 1.8)
+        y = 5.54
+        for text, h in zip(steps, heights):
+            s.txt(text, lx+0.15, y, 3.7, h, size=size, color=BLACK)
+            y += h + 0.05
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 5 — UI SCREENS
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s5 = prs.slides.add_slide(BLANK)
-bg(s5, GREY)
-header_bar(s5, "UI Screens", "All major screens accessible in the application")
-
-screen_data = [
-    ("Login Page",           "All Roles",       BLUE,   "Sliding panel layout with login and signup forms, password strength indicator, show/hide toggle"),
-    ("Signup - Role Picker", "All Roles",       BLUE,   "Step 1: user selects their role from four options. Step 2: fills name, email, password, and staff code if required"),
-    ("Admin Dashboard",      "Admin",           RED,    "Overview statistics: total users, courses, enrollments, assignments. Quick-access cards for core modules"),
-    ("User Management",      "Admin",           RED,    "Full table of all users with add, edit, deactivate, and delete operations. Filterable and searchable"),
-    ("Courses Page",         "All Roles",       BLUE,   "Admin: create and manage courses. Student: browse and enroll. Instructor: view own courses. Filter by category"),
-    ("Assignments",          "Admin, Student",  PURPLE, "Admin creates assignments with due dates and max scores. Students view and submit. Admin grades submissions"),
-    ("Announcements",        "All Roles",       GREEN,  "Platform-wide communication board. Admin creates posts visible to all roles on the platform"),
-    ("Analytics",            "Admin",           AMBER,  "Charts and statistics for course enrollments, user distribution, submissions, and platform activity"),
-    ("Settings",             "Admin",           BLACK,  "Edit platform name, contact email, phone number, and the About page content directly from this screen"),
-    ("Student Dashboard",    "Student",         GREEN,  "Shows enrolled courses, upcoming assignments, learning progress, and announcements in one view"),
-    ("Browse Courses",       "Student",         BLUE,   "Grid of all published courses with category filters, enrollment status badges, and course detail modal"),
-    ("My Learning",          "Student",         GREEN,  "Filtered view showing only courses the student is enrolled in, with quick access to continue learning"),
-]
-
-cols = 4
-rows = 3
-card_w = 3.0
-card_h = 1.75
-gap_x = 0.2
-gap_y = 0.2
-start_x = 0.3
-start_y = 1.25
-
-for idx, (name, role, color, desc) in enumerate(screen_data):
-    col = idx % cols
-    row = idx // cols
-    lx = start_x + col*(card_w+gap_x)
-    ty = start_y + row*(card_h+gap_y)
-
-    # Card bg
-    box(s5, lx, ty, card_w, card_h, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-    # Color top strip
-    strip = box(s5, lx, ty, card_w, 0.38, color, color, 0)
-    tf = strip.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = name
-    r.font.size = Pt(11)
-    r.font.bold = True
-    r.font.color.rgb = WHITE
+def slide_screens(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    cols = 4
+    card_w = 3.0
+    card_h = 1.75
+    gap_x = 0.2
+    gap_y = 0.2
+    start_x = 0.3
+    start_y = 1.25
 
-    # Role badge
-    txt(s5, "Role: " + role, lx+0.1, ty+0.42, card_w-0.2, 0.25, size=9, color=DKGREY, bold=True)
-    # Description
-    txt(s5, desc, lx+0.1, ty+0.65, card_w-0.2, 1.05, size=9, color=BLACK)
+    cells = grid(len(d["screens"]), cols, card_w, card_h, gap_x, gap_y, start_x, start_y)
+    for screen, (lx, ty) in zip(d["screens"], cells):
+        s.stamp("screen_card", lx, ty, name=screen["name"], roles="Role: " + screen["roles"],
+                desc=screen["desc"], strip=color(screen["color"]), w=card_w, h=card_h,
+                desc_size=fit_size(screen["desc"], card_w-0.2, 1.05, 9))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 6 — NAVIGATION
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s6 = prs.slides.add_slide(BLANK)
-bg(s6, GREY)
-header_bar(s6, "Navigation", "Role-based sidebar navigation — each role sees only their permitted pages")
-
-nav_data = [
-    ("Admin", RED, [
-        "Dashboard - Platform overview and statistics",
-        "User Management - Add, edit, delete users",
-        "All Courses - Create and manage all courses",
-        "Assignments - Create and grade assignments",
-        "Announcements - Post platform messages",
-        "Analytics - View platform-wide data",
-        "Platform Settings - Configure the system",
-        "About Us - Editable about page",
-        "Contact Us - Contact information page",
-    ]),
-    ("Instructor", PURPLE, [
-        "Dashboard - Teaching overview",
-        "My Courses - View own created courses",
-        "Assignments - Manage course assignments",
-        "Announcements - Read platform messages",
-        "Analytics - View course performance data",
-        "About Us - About page",
-        "Contact Us - Contact page",
-    ]),
-    ("Content Creator", AMBER, [
-        "Dashboard - Content overview",
-        "Content Library - Upload and manage materials",
-        "Performance - View content analytics",
-        "About Us - About page",
-        "Contact Us - Contact page",
-    ]),
-    ("Student", GREEN, [
-        "Dashboard - Learning overview",
-        "Browse Courses - Discover all published courses",
-        "My Learning - Access enrolled courses only",
-        "Assignments - View and submit work",
-        "Announcements - Read platform messages",
-        "My Progress - Track personal analytics",
-        "About Us - About page",
-        "Contact Us - Contact page",
-    ]),
-]
-
-col_w = 3.0
-gap_c = 0.27
-sx = 0.3
-
-for i, (role, color, navs) in enumerate(nav_data):
-    lx = sx + i*(col_w+gap_c)
-    box(s6, lx, 1.25, col_w, 6.1, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-    strip = box(s6, lx, 1.25, col_w, 0.48, color, color, 0)
-    tf = strip.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = role
-    r.font.size = Pt(13)
-    r.font.bold = True
-    r.font.color.rgb = WHITE
-
-    cur_y = 1.82
-    for nav in navs:
-        parts = nav.split(" - ", 1)
-        nb = s6.shapes.add_textbox(Inches(lx+0.15), Inches(cur_y), Inches(col_w-0.25), Inches(0.38))
-        nb.word_wrap = True
-        ntf = nb.text_frame
-        ntf.word_wrap = True
-        np_ = ntf.paragraphs[0]
-        nr1 = np_.add_run()
-        nr1.text = parts[0]
-        nr1.font.size = Pt(10)
-        nr1.font.bold = True
-        nr1.font.color.rgb = color
-        if len(parts) > 1:
-            nr2 = np_.add_run()
-            nr2.text = "  " + parts[1]
-            nr2.font.size = Pt(10)
-            nr2.font.bold = False
-            nr2.font.color.rgb = BLACK
-        cur_y += 0.42
-
-# Mobile note
-txt(s6, "On mobile devices, the sidebar is hidden by default. A hamburger button (top-left) reveals it as a slide-in drawer with a dark overlay. Tapping any menu item navigates and closes the sidebar automatically.", 0.3, 7.1, 12.73, 0.38, size=10, color=DKGREY, italic=True)
+def slide_navigation(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    col_w = 3.0
+    gap_c = 0.27
+    sx = 0.3
+
+    for i, column in enumerate(d["nav"]):
+        lx = sx + i*(col_w+gap_c)
+        role_color = color(column["color"])
+        s.stamp("column_card", lx, 1.25, title=column["role"], strip=role_color, w=col_w)
+
+        items = []
+        for nav in column["items"]:
+            parts = nav.split(" - ", 1)
+            runs = [(parts[0], True, role_color)]
+            if len(parts) > 1:
+                runs.append(("  " + parts[1], False, BLACK))
+            items.append(runs)
+        s.bullets(items, lx+0.15, 1.82, col_w-0.25, 0.42, size=10, bullet=None)
+
+    # Mobile note
+    s.txt(d["note"], 0.3, 7.1, 12.73, 0.38, size=10, color=DKGREY, italic=True)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 7 — FUNCTIONAL WORKFLOW
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s7 = prs.slides.add_slide(BLANK)
-bg(s7, GREY)
-header_bar(s7, "Functional Workflow", "Step-by-step operations for core platform functions")
-
-workflows = [
-    ("User Registration", NAVY, [
-        "Visit the application and click Create one on the auth page",
-        "Select a role: Admin, Instructor, Content Creator, or Student",
-        "Fill in full name, email address, password, and confirm password",
-        "Enter staff code (required for Instructor, Content Creator, Admin roles)",
-        "Click Create Account to complete registration",
-        "Account is created and user is automatically logged into their dashboard",
-    ]),
-    ("Admin: Create and Publish Course", RED, [
-        "Log in with admin credentials",
-        "Navigate to All Courses in the sidebar",
-        "Click the New Course button in the top-right corner",
-        "Enter title, category, level, duration, number of lessons, and description",
-        "Set the status to Published so students can see the course",
-        "Click Create Course - the course is now visible to all enrolled students",
-    ]),
-    ("Student: Browse and Enroll", GREEN, [
-        "Log in with student credentials",
-        "Navigate to Browse Courses in the sidebar",
-        "Browse the grid of published courses, filter by category if needed",
-        "Click any course card to open the course detail modal",
-        "Review course information including lessons, duration, and description",
-        "Click Enroll Now - the course appears in My Learning immediately",
-    ]),
-    ("Assignment: Full Lifecycle", PURPLE, [
-        "Admin creates an assignment linked to a specific course with a due date",
-        "Students enrolled in that course see the assignment in their Assignments page",
-        "Student writes an answer in the text field and clicks Submit",
-        "Admin and Instructor receive a notification about the new submission",
-        "Admin opens the submission and enters a score and written feedback",
-        "Student can view their grade and feedback in the Assignments section",
-    ]),
-    ("User Management (Admin)", AMBER, [
-        "Admin navigates to User Management in the sidebar",
-        "View a table of all registered users with name, email, role, and status",
-        "Click Add User to create a new account with a specific role and password",
-        "Click the edit icon to modify name, role, or account status of any user",
-        "Toggle a user to inactive to suspend access without deleting their data",
-        "Click the delete icon and confirm to permanently remove a user account",
-    ]),
-    ("Content Upload (Creator)", RGBColor(0x0E,0x74,0x90), [
-        "Log in with Content Creator credentials",
-        "Navigate to Content Library in the sidebar",
-        "Click Add Content to open the upload form",
-        "Enter title, content type (video, document, PDF), URL, and any notes",
-        "Associate the material with a specific course or leave it as general",
-        "Click Save - the content appears in the library and is viewable by others",
-    ]),
-]
-
-wf_w = 4.0
-wf_gap = 0.27
-wf_sx = 0.3
-for i, (title, color, steps) in enumerate(workflows):
-    col = i % 3
-    row = i // 3
-    lx = wf_sx + col*(wf_w+wf_gap)
-    ty = 1.25 + row*3.1
-    box(s7, lx, ty, wf_w, 3.0, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
-    strip = box(s7, lx, ty, wf_w, 0.44, color, color, 0)
-    tf = strip.text_frame
-    p = tf.paragraphs[0]
-    p.alignment = PP_ALIGN.CENTER
-    r = p.add_run()
-    r.text = title
-    r.font.size = Pt(12)
-    r.font.bold = True
-    r.font.color.rgb = WHITE
-    for j, step in enumerate(steps):
-        txt(s7, f"{j+1}.  {step}", lx+0.15, ty+0.5+j*0.41, wf_w-0.25, 0.38, size=9.5, color=BLACK)
+def slide_workflow(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    wf_w = 4.0
+    wf_gap = 0.27
+    wf_sx = 0.3
+    for i, wf in enumerate(d["workflows"]):
+        col = i % 3
+        row = i // 3
+        lx = wf_sx + col*(wf_w+wf_gap)
+        ty = 1.25 + row*3.1
+        s.stamp("column_card", lx, ty, title=wf["title"], strip=color(wf["color"]),
+                w=wf_w, h=3.0, strip_h=0.44, size=12)
+        steps = [f"{j+1}.  {step}" for j, step in enumerate(wf["steps"])]
+        size, heights = step_rows(steps, wf_w-0.25, 9.5, 0.38, 0.03, 2.45)
+        y = ty + 0.5
+        for text, h in zip(steps, heights):
+            s.txt(text, lx+0.15, y, wf_w-0.25, h, size=size, color=BLACK)
+            y += h + 0.03
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # SLIDE 8 — LINKS AND TEAM
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-s8 = prs.slides.add_slide(BLANK)
-bg(s8, NAVY)
-
-txt(s8, "Digital Black Board — LMS", 0.5, 0.6, 12.33, 0.7, size=30, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-txt(s8, "TEAM 18  |  KL University", 0.5, 1.35, 12.33, 0.4, size=14, color=RGBColor(0xA8,0xC4,0xE0), align=PP_ALIGN.CENTER)
-
-# Link boxes
-links = [
-    ("Live Application", "https://digital-blackboard.netlify.app", BLUE),
-    ("Source Code (GitHub)", "https://github.com/NALIN-9/LMS-PROJECT", RGBColor(0x16,0x18,0x22)),
-]
-for i, (label, url, color) in enumerate(links):
-    lx = 1.5 + i*5.5
-    box(s8, lx, 2.0, 5.0, 0.9, color, color, 0)
-    txt(s8, label, lx+0.2, 2.08, 4.6, 0.3, size=12, bold=True, color=WHITE)
-    txt(s8, url, lx+0.2, 2.42, 4.6, 0.45, size=11, color=RGBColor(0xBF,0xDB,0xFE))
-
-# Credentials
-txt(s8, "Login Credentials", 0.5, 3.1, 12.33, 0.35, size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
-creds = [
-    ("Admin",           "admin@gmail.com", "Admin@123", RED),
-    ("Instructor",      "ins@gmail.com",   "ins@123",   PURPLE),
-    ("Content Creator", "cc@gmail.com",    "cc@123",    AMBER),
-    ("Student",         "st@gmail.com",    "st@123",    GREEN),
-]
-for i, (role, email, pwd, color) in enumerate(creds):
-    lx = 0.4 + i*3.2
-    box(s8, lx, 3.55, 3.0, 1.25, RGBColor(0x14,0x1E,0x33), color, 1.5)
-    txt(s8, role, lx+0.15, 3.62, 2.7, 0.3, size=12, bold=True, color=color)
-    txt(s8, email, lx+0.15, 3.96, 2.7, 0.25, size=10, color=WHITE)
-    txt(s8, f"Password: {pwd}", lx+0.15, 4.2, 2.7, 0.25, size=10, color=RGBColor(0xA8,0xC4,0xE0))
-
-txt(s8, "Staff Code for signup (non-student roles):  DBBLMS", 0.5, 4.95, 12.33, 0.35,
-    size=12, color=RGBColor(0xBF,0xDB,0xFE), align=PP_ALIGN.CENTER)
-
-# Team
-box(s8, 0.5, 5.45, 12.33, 1.75, RGBColor(0x14,0x1E,0x33), BLUE, 1)
-txt(s8, "Team Members", 0.7, 5.55, 11.9, 0.35, size=13, bold=True, color=WHITE)
-members = [
-    "KANTAMANI NALIN KUMAR      (2400030332)",
-    "GHANTA NAGA PRASANTH BABU  (2400030196)",
-    "KARANAM BHARGAV            (2400031923)",
-]
-for i, m in enumerate(members):
-    txt(s8, m, 0.7, 5.95+i*0.32, 7.0, 0.3, size=11, color=RGBColor(0xBF,0xDB,0xFE))
-
-txt(s8, "Guide: Dr. NAGARJUNA KARYEMSETTY  |  KL University", 7.5, 5.95, 5.0, 0.65,
-    size=11, color=RGBColor(0xA8,0xC4,0xE0))
+def slide_links(s, d):
+    s.bg(NAVY)
+
+    s.txt(d["title"], 0.5, 0.6, 12.33, 0.7, size=30, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    s.txt(d["team"], 0.5, 1.35, 12.33, 0.4, size=14, color=RGBColor(0xA8,0xC4,0xE0), align=PP_ALIGN.CENTER)
+
+    # Link boxes
+    for i, link in enumerate(d["links"]):
+        lx = 1.5 + i*5.5
+        link_color = color(link["color"])
+        s.box(lx, 2.0, 5.0, 0.9, link_color, link_color, 0)
+        s.txt(link["label"], lx+0.2, 2.08, 4.6, 0.3, size=12, bold=True, color=WHITE)
+        s.txt(link["url"], lx+0.2, 2.42, 4.6, 0.45, size=11, color=RGBColor(0xBF,0xDB,0xFE))
+
+    # Credentials
+    s.txt(d["creds_heading"], 0.5, 3.1, 12.33, 0.35, size=14, bold=True, color=WHITE, align=PP_ALIGN.CENTER)
+    for i, cred in enumerate(d["creds"]):
+        lx = 0.4 + i*3.2
+        role_color = color(cred["color"])
+        s.stamp("cred_card", lx, 3.55, role=cred["role"], email=cred["email"],
+                password=f"Password: {cred['password']}", accent=role_color)
+
+    s.txt(d["staff_code"], 0.5, 4.95, 12.33, 0.35,
+          size=12, color=RGBColor(0xBF,0xDB,0xFE), align=PP_ALIGN.CENTER)
+
+    # Team
+    s.box(0.5, 5.45, 12.33, 1.75, RGBColor(0x14,0x1E,0x33), BLUE, 1)
+    s.txt(d["members_heading"], 0.7, 5.55, 11.9, 0.35, size=13, bold=True, color=WHITE)
+    for i, m in enumerate(d["members"]):
+        s.txt(m, 0.7, 5.95+i*0.32, 7.0, 0.3, size=11, color=RGBColor(0xBF,0xDB,0xFE))
+
+    s.txt(d["guide"], 7.5, 5.95, 5.0, 0.65,
+          size=11, color=RGBColor(0xA8,0xC4,0xE0))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# REPORT SUMMARY — stat cards + up to two bullet columns
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def slide_summary(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    stats = d.get("stats", [])
+    if stats:
+        card_w = (12.73 - 0.2*(len(stats)-1)) / len(stats)
+        for i, stat in enumerate(stats):
+            lx = 0.3 + i*(card_w+0.2)
+            s.box(lx, 1.25, card_w, 1.1, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+            s.box(lx, 1.25, 0.08, 1.1, color(stat.get("color", "BLUE")))
+            value = str(stat["value"])
+            s.txt(value, lx+0.25, 1.3, card_w-0.35, 0.6,
+                  size=fit_size(value, card_w-0.35, 0.6, 26, bold=True), bold=True, color=NAVY)
+            s.txt(stat["label"], lx+0.25, 1.88, card_w-0.35, 0.35, size=11, color=DKGREY)
+
+    blocks = d.get("blocks", [])[:2]
+    top = 2.55 if stats else 1.25
+    col_w = 12.73 if len(blocks) == 1 else 6.26
+    for i, block in enumerate(blocks):
+        lx = 0.3 + i*(col_w+0.21)
+        bullets = block["bullets"]
+        # bullet_block's list: 0.15 in from the block, 0.38 below its top
+        fits = bullets_fitting(bullets, col_w-0.55, 0.30, 12, 7.2 - top - 0.5)
+        if len(bullets) > fits:
+            bullets = bullets[:fits-1] + [f"+ {len(bullets) - fits + 1} more"]
+        s.box(lx, top, col_w, 7.2-top, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+        s.bullet_block(block["heading"], bullets, lx+0.2, top+0.1, col_w-0.4, head_size=15)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CHART — one native chart on a card, optional note underneath
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def slide_chart(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+    note = d.get("note")
+    bottom = 6.7 if note else 7.2
+    s.box(0.3, 1.3, 12.73, bottom-1.3, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+    series = [(x["name"], x["values"], x.get("color")) for x in d["series"]]
+    s.chart(d.get("chart", "column"), d["categories"], series, 0.5, 1.45, 12.33, bottom-1.6)
+    if note:
+        s.txt(note, 0.3, 6.8, 12.73, 0.4, size=11, italic=True, color=DKGREY)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# GALLERY — captioned pictures on cards (course media, uploads)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def slide_gallery(s, d):
+    s.bg(GREY)
+    s.header_bar(d["title"], d.get("subtitle"))
+
+    images = d["images"][:12]
+    cols = d.get("columns") or min(4, max(len(images), 1))
+    rows = max(1, -(-len(images) // cols))
+    gap = 0.2
+    card_w = (12.73 - gap*(cols-1)) / cols
+    card_h = (5.95 - gap*(rows-1)) / rows
+
+    cells = grid(len(images), cols, card_w, card_h, gap, gap, 0.3, 1.25)
+    for item, (lx, ty) in zip(images, cells):
+        s.box(lx, ty, card_w, card_h, WHITE, RGBColor(0xDD,0xE6,0xF0), 1)
+        caption = item.get("caption")
+        image_h = card_h - 0.2 - (0.4 if caption else 0)
+        s.image(item["src"], lx+0.1, ty+0.1, card_w-0.2, image_h, item.get("fit", d.get("fit", "contain")))
+        if caption:
+            s.txt(metrics().clip(caption, card_w-0.4, 11), lx+0.1, ty+card_h-0.42, card_w-0.2, 0.35,
+                  size=11, color=DKGREY, align=PP_ALIGN.CENTER, wrap=False)
+
+
+# ── Build ─────────────────────────────────────────────────────
+# spec["slides"][i]["layout"] -> layout function
+LAYOUTS = {
+    "title": slide_title,
+    "overview": slide_overview,
+    "roles": slide_roles,
+    "flow": slide_flow,
+    "screens": slide_screens,
+    "navigation": slide_navigation,
+    "workflow": slide_workflow,
+    "links": slide_links,
+    "summary": slide_summary,
+    "chart": slide_chart,
+    "gallery": slide_gallery,
+}
+
+@lru_cache(maxsize=64)
+def _read_text(path, mtime_ns, size):
+    # keyed on the file's stamp so long-lived processes see edited specs
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def load_spec(path):
+    """Read a deck spec from a .json, .yaml or .yml file."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    text = _read_text(path, st.st_mtime_ns, st.st_size)
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("PyYAML is required to read YAML deck specs") from None
+        return yaml.safe_load(text)
+    return json.loads(text)
+
+def default_spec():
+    """The bundled prototype deck spec. Returns a fresh dict on every call."""
+    return load_spec(SPEC_PATH)
+
+@lru_cache(maxsize=None)
+def code_version():
+    """Hash of the layout code's source and the measuring fonts; a cached plan
+    is only valid for the code (and text metrics) that made it."""
+    h = hashlib.sha256()
+    for module in (sys.modules[__name__], ppt_metrics, ppt_scene, ppt_images):
+        with open(module.__file__, "rb") as f:
+            h.update(f.read())
+    h.update(face_id().encode())
+    return h.hexdigest()[:16]
+
+def spec_hash(spec):
+    """Content hash of a spec plus the code version."""
+    blob = json.dumps(spec, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256((code_version() + blob).encode()).hexdigest()
+
+def slide_key(d, frames=True):
+    """Hash of everything one slide is built from: its spec, options and the code."""
+    blob = json.dumps([frames, d], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return "dbb-" + hashlib.sha256((code_version() + blob).encode()).hexdigest()[:32]
+
+def compile_slide(d, frames=True):
+    """Layout plan of one slide spec: {"key": slide_key, "bg": hex, "ops": [[op, *args], ...]}."""
+    sp = SlidePlan(frames=frames)
+    LAYOUTS[d["layout"]](sp, d)
+    return dict(sp.to_dict(), key=slide_key(d, frames))
+
+def _layout(spec):
+    frames = spec.get("bullet_frames", True)
+    return [compile_slide(d, frames) for d in spec["slides"]]
+
+def compile_plan(spec):
+    """Flat layout plan for the whole deck: a list of compiled slides."""
+    return ppt_images.settle(_layout(spec))
+
+def load_plan(spec, cache_dir=None):
+    """compile_plan(), memoized on disk under cache_dir by spec_hash().
+
+    The cached plan is the layout before image sizes are settled: those
+    depend on the image files, not the spec, so they are settled on every load.
+    """
+    if cache_dir is None:
+        return compile_plan(spec)
+    path = os.path.join(cache_dir, spec_hash(spec) + ".json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            return ppt_images.settle(json.load(f))
+    except (OSError, ValueError):
+        pass
+    plan = _layout(spec)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(plan, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return ppt_images.settle(plan)
+
+def expand_ops(ops):
+    """`ops` with each stamp op replaced by its component's primitive ops."""
+    out = []
+    for op in ops:
+        if op[0] == "stamp":
+            _, component, l, t, _, _, params = op
+            out += COMPONENTS[component].ops(params, l, t)
+        else:
+            out.append(op)
+    return out
+
+def emit_ops(slide, ops):
+    for name, *args in ops:
+        EMITTERS[name](slide, *args)
+
+def _shape_names(op, i, args, count):
+    if op == "stamp":
+        return [f"{args[0]}-{i}.{part}" for part in COMPONENTS[args[0]].part_names(args[-1])]
+    if count == 1:
+        return [f"{op}-{i}"]
+    return [f"{op}-{i}.{k}" for k in range(count)]
+
+def emit_scene(slide, scene):
+    """Replay a Scene through the helpers, geometry already in EMU.
+
+    Shapes are named after the op that drew them, "<op>-<i>" for the slide's
+    i-th op and "<op>-<i>.<k>" when it drew several; a stamp's shapes are
+    "<component>-<i>.<slot>" after the text or color slot they hold.
+
+    The names are positions, not identities: an op added or dropped before
+    a shape (an optional subtitle or chart note, another bullet, step or
+    card) renumbers it. They only carry over between renders of specs that
+    differ in text and colors that leave the layout's ops as they were,
+    which is what ppt_patch is for.
+    """
+    tree = slide.shapes._spTree
+    for i, (name, args) in enumerate(scene.calls(Emu)):
+        before = len(tree)
+        EMITTERS[name](slide, *args)
+        added = tree[before:]
+        for el, shape_name in zip(added, _shape_names(name, i, args, len(added))):
+            el[0][0].set("name", shape_name)     # nvSpPr / nvPicPr / ... -> cNvPr
+
+def emit_slide(prs, slide_plan):
+    slide = blank_slide(prs)
+    # The slide key rides along as the (never displayed) slide name so an
+    # incremental build can recognise this slide in the saved package.
+    slide._element.cSld.name = slide_plan.get("key")
+    scene = Scene.from_plan(slide_plan)
+    if scene.background:
+        bg(slide, scene.background)
+    emit_scene(slide, scene)
+    return slide
+
+def emit_plan(plan):
+    """Presentation built from a layout plan."""
+    prs = new_presentation()
+    for slide_plan in plan:
+        emit_slide(prs, slide_plan)
+    return prs
+
+def build_deck(spec=None, cache_dir=None):
+    """Build the deck in memory and return the Presentation."""
+    if spec is None:
+        spec = default_spec()
+    return emit_plan(load_plan(spec, cache_dir))
+
+def render_bytes(spec=None, cache_dir=None, level=6):
+    """Render the deck to .pptx bytes; only cache_dir, if given, touches disk.
+
+    Saved by ppt_save: the same spec gives the same bytes, and `level` is the
+    deflate level (0 stores).
+    """
+    return ppt_save.save_bytes(build_deck(spec, cache_dir), level)
+
+def warm_up():
+    """Parse the template and compile the common run styles before the first real build."""
+    spec = default_spec()
+    spec["slides"].append({"layout": "summary", "title": "", "stats": [{"label": "", "value": 0}],
+                           "blocks": [{"heading": "", "bullets": [""]}]})
+    render_bytes(spec)
+
+
+# ── Incremental build ─────────────────────────────────────────
+_SLIDE_PART = re.compile(r"ppt/slides/slide\d+\.xml$")
+_SLIDE_KEY = re.compile(rb'<p:cSld name="(dbb-[0-9a-f]+)"')
+
+def _slide_rels(partname):
+    head, tail = partname.rsplit("/", 1)
+    return f"{head}/_rels/{tail}.rels"
+
+def reusable_slides(previous):
+    """slide_key -> slide XML bytes for every reusable slide in a previous render.
+
+    Only slides whose sole relationship is their layout qualify; anything
+    that pulls in other parts (charts, pictures) is always rebuilt.
+    """
+    found = {}
+    with zipfile.ZipFile(BytesIO(previous)) as z:
+        names = set(z.namelist())
+        for name in names:
+            if not _SLIDE_PART.match(name):
+                continue
+            xml = z.read(name)
+            m = _SLIDE_KEY.search(xml, 0, 512)
+            rels = _slide_rels(name)
+            if m and rels in names and z.read(rels).count(b"<Relationship ") == 1:
+                found[m.group(1).decode()] = xml
+    return found
+
+def render_incremental(spec, previous, cache_dir=None, level=6):
+    """Render like render_bytes(), copying unchanged slides from `previous`.
+
+    Slides whose slide_key() matches a slide in the previous package are
+    added as empty placeholders and their XML is swapped for the old bytes
+    when the package is written; only changed slides go through the
+    helpers. Returns (pptx bytes, number of reused slides).
+    """
+    old = reusable_slides(previous) if previous else {}
+    prs = new_presentation()
+    reuse = {}
+    for i, slide_plan in enumerate(load_plan(spec, cache_dir), 1):
+        if slide_plan["key"] in old:
+            blank_slide(prs)
+            reuse[f"ppt/slides/slide{i}.xml"] = old[slide_plan["key"]]
+        else:
+            emit_slide(prs, slide_plan)
+    buf = BytesIO()
+    ppt_save.save(prs, buf, level)
+    if not reuse:
+        return buf.getvalue(), 0
+
+    out = BytesIO()
+    with zipfile.ZipFile(buf) as zin, ZipWriter(out, level) as zout:
+        for info in zin.infolist():
+            data = reuse.get(info.filename)
+            zout.write(info.filename, data if data is not None else zin.read(info),
+                       0 if info.compress_type == zipfile.ZIP_STORED else level)
+    return out.getvalue(), len(reuse)
 
 
 # ── SAVE ──────────────────────────────────────────────────────
-out = r"C:\Users\nalin\Downloads\DBB_Prototype_Presentation.pptx"
-prs.save(out)
-print("Saved:", out)
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render the Digital Black Board deck.")
+    ap.add_argument("out", nargs="?", default=DEFAULT_OUT)
+    ap.add_argument("--spec", default=SPEC_PATH, help="deck spec (.json, .yaml or .yml)")
+    ap.add_argument("--cache-dir", help="reuse compiled layout plans from this directory")
+    ap.add_argument("--level", type=int, default=6, choices=range(10),
+                    help="deflate level of the package, 0 stores (default 6)")
+    ap.add_argument("--image-cache", help="keep downscaled images here (default: DBB_IMAGE_CACHE"
+                                          " or ~/.cache/dbb-images)")
+    ap.add_argument("--trace", metavar="JSON",
+                    help="profile the build: write a Chrome trace here and print a summary")
+    ap.add_argument("--incremental", action="store_true",
+                    help="reuse unchanged slides from an existing output file")
+    args = ap.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    if args.image_cache:
+        ppt_images.use_cache(args.image_cache)
+    trace = None
+    if args.trace:
+        from ppt_trace import BuildTrace   # imports this module; only load it on demand
+        trace = BuildTrace(sys.modules[__name__])
+    with trace or nullcontext():
+        if args.incremental and os.path.exists(args.out):
+            with open(args.out, "rb") as f:
+                data, reused = render_incremental(spec, f.read(), args.cache_dir, args.level)
+            print(f"Reused {reused} of {len(spec['slides'])} slides")
+        else:
+            data = render_bytes(spec, args.cache_dir, args.level)
+    with open(args.out, "wb") as f:
+        f.write(data)
+    print("Saved:", args.out)
+    if trace:
+        trace.write_chrome(args.trace)
+        print(trace.summary())
+        print("Trace:", args.trace)
+
+
+if __name__ == "__main__":
+    main()
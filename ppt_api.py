@@ -0,0 +1,253 @@
+"""LMS REST API data source for live decks.
+
+    python ppt_api.py [--url http://localhost:5000/api] [--demo N] [--page-size 500]
+
+LMSClient reads the Express routes (courses, assignments, submissions,
+announcements, users) over a small pool of keep-alive HTTP connections:
+
+    api = LMSClient()
+    data = api.snapshot()                      # all collections, fetched concurrently
+    for sub in api.pages("/submissions"):      # a large collection as a stream
+        ...
+
+fetch_all() issues independent calls concurrently from a thread pool.
+pages() walks a list route with ?limit=&offset= and yields items while
+the next page is already being fetched; a server that ignores the paging
+parameters ends the stream after the first response (a longer page, or the
+same page again). ppt_charts --api builds the analytics deck this way.
+Other responses are cached per URL: within `ttl` seconds they are served
+from memory, after that they are revalidated with If-None-Match, which
+Express answers with 304 when nothing changed.
+
+--demo serves a SQLite stand-in through the stub in ppt_api_stub.py, so
+the client can be exercised without the Node backend or a network.
+"""
+import argparse
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_URL = os.environ.get("LMS_API_URL", "http://localhost:5000/api")
+
+# snapshot() name -> route
+COLLECTIONS = {
+    "courses": "/courses",
+    "assignments": "/assignments",
+    "submissions": "/submissions",
+    "announcements": "/announcements",
+    "users": "/users",
+}
+
+
+class APIError(RuntimeError):
+    def __init__(self, status, url, message):
+        super().__init__(f"{status} from {url}: {message}")
+        self.status = status
+
+
+# ── Connections ───────────────────────────────────────────────
+class ConnectionPool:
+    """Up to `size` keep-alive connections to one host, shared between threads."""
+
+    def __init__(self, base_url, size=8, timeout=30):
+        u = urlsplit(base_url)
+        self.scheme, self.host, self.port = u.scheme, u.hostname, u.port
+        self.prefix = u.path.rstrip("/")
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self):
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def request(self, path, headers):
+        """(status, response headers, body) for GET prefix+path."""
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn, reused = self._connect(), False
+            try:
+                try:
+                    conn.request("GET", self.prefix + path, headers=headers)
+                    resp = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionError):
+                    if not reused:
+                        raise
+                    # The server closed an idle keep-alive connection; retry on a new one.
+                    conn.close()
+                    conn = self._connect()
+                    conn.request("GET", self.prefix + path, headers=headers)
+                    resp = conn.getresponse()
+                body = resp.read()
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            return resp.status, resp.headers, body
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class ResponseCache:
+    """url -> (etag, fresh-until, value), at most `size` entries, least recently used out first."""
+
+    def __init__(self, ttl=30, size=256):
+        self.ttl = ttl
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            entry = self._items.get(url)
+            if entry:
+                self._items.move_to_end(url)
+            return entry
+
+    def put(self, url, etag, value):
+        with self._lock:
+            self._items[url] = (etag, time.monotonic() + self.ttl, value)
+            self._items.move_to_end(url)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def expire(self):
+        """Mark every entry stale, so the next get() revalidates it."""
+        with self._lock:
+            for url, (etag, _, value) in self._items.items():
+                self._items[url] = (etag, 0, value)
+
+
+# ── Client ────────────────────────────────────────────────────
+class LMSClient:
+    def __init__(self, base_url=DEFAULT_URL, pool_size=8, ttl=30, timeout=30):
+        self.pool = ConnectionPool(base_url, pool_size, timeout)
+        self.cache = ResponseCache(ttl)
+        self._executor = ThreadPoolExecutor(pool_size)
+        self.stats = {"requests": 0, "not_modified": 0, "cache_hits": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown()
+        self.pool.close()
+
+    def get(self, path, params=None, cache=True):
+        """Decoded JSON of GET path?params, through the cache unless cache=False."""
+        url = path + ("?" + urlencode(params) if params else "")
+        cached = self.cache.get(url) if cache else None
+        if cached and cached[1] > time.monotonic():
+            self.stats["cache_hits"] += 1
+            return cached[2]
+
+        headers = {"Accept": "application/json", "Connection": "keep-alive"}
+        if cached and cached[0]:
+            headers["If-None-Match"] = cached[0]
+        self.stats["requests"] += 1
+        status, resp_headers, body = self.pool.request(url, headers)
+        if status == 304 and cached:
+            self.stats["not_modified"] += 1
+            value = cached[2]
+        elif status >= 400:
+            try:
+                message = json.loads(body).get("error", "")
+            except (ValueError, AttributeError):
+                message = body[:200].decode("utf-8", "replace")
+            raise APIError(status, url, message)
+        else:
+            value = json.loads(body)
+        if cache:
+            self.cache.put(url, resp_headers.get("ETag"), value)
+        return value
+
+    def fetch_all(self, paths):
+        """{name: JSON} for a {name: path} mapping, fetched concurrently."""
+        futures = {name: self._executor.submit(self.get, path) for name, path in paths.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+    def snapshot(self):
+        """Every collection in COLLECTIONS, fetched concurrently."""
+        return self.fetch_all(COLLECTIONS)
+
+    def pages(self, path, page_size=500, params=None):
+        """Yield the items of a list route page by page, prefetching the next page.
+
+        Pages bypass the response cache, so a long stream holds at most two pages.
+        """
+        params = dict(params or {})
+
+        def page(offset):
+            return self._executor.submit(self.get, path,
+                                         dict(params, limit=page_size, offset=offset), False)
+
+        offset, previous = 0, None
+        pending = page(offset)
+        while pending is not None:
+            items = pending.result()
+            if items == previous:
+                break           # the route ignores paging and sent its whole list again
+            offset += len(items)
+            # A short page is the last; a page over the limit means the route ignores paging.
+            pending = page(offset) if len(items) == page_size else None
+            previous = items
+            yield from items
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Fetch the LMS collections a live deck is built from.")
+    ap.add_argument("--url", default=DEFAULT_URL, help="API base URL (default: LMS_API_URL)")
+    ap.add_argument("--demo", type=int, metavar="N",
+                    help="serve a SQLite stand-in with N generated students locally instead")
+    ap.add_argument("--page-size", type=int, default=500)
+    args = ap.parse_args(argv)
+
+    server = None
+    url = args.url
+    if args.demo:
+        import ppt_data
+        from ppt_api_stub import stub_server
+        server = stub_server(ppt_data.sqlite_standin(students=args.demo,
+                                                     courses=max(4, args.demo // 100)))
+        url = f"http://127.0.0.1:{server.server_port}/api"
+
+    try:
+        with LMSClient(url) as api:
+            t0 = time.perf_counter()
+            data = api.snapshot()
+            t1 = time.perf_counter()
+            print("snapshot: " + ", ".join(f"{len(v)} {k}" for k, v in data.items())
+                  + f"  ({t1 - t0:.2f}s)")
+            count = sum(1 for _ in api.pages("/submissions", args.page_size))
+            t2 = time.perf_counter()
+            print(f"paged: {count} submissions in pages of {args.page_size}  ({t2 - t1:.2f}s)")
+            api.cache.expire()
+            api.snapshot()
+            print(f"revalidated snapshot in {time.perf_counter() - t2:.2f}s;  {api.stats}")
+    finally:
+        if server:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Local stub of the LMS API routes, and checks of ppt_api.LMSClient against it.
+
+    python ppt_api_stub.py          # run the checks
+
+stub_server() answers the list routes LMSClient reads (and
+/courses/:id/enrollment) from a SQLite database such as
+ppt_data.sqlite_standin(), with ?limit=&offset= paging, camelCase keys and
+ETag/If-None-Match like the Express routes. ppt_api --demo and
+ppt_charts --api --demo use it in place of the Node backend; it is a
+development aid, not part of the client.
+
+Run as a script, it checks pages() without a network: a short last page
+ends the stream, a route that ignores paging ends it after one page
+whether that page is longer than page_size or repeats, and the next page
+is requested while the current one is still being consumed.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from ppt_api import COLLECTIONS, LMSClient
+
+
+def stub_server(source, port=0, paging=True):
+    """Threaded HTTP server answering the list routes from a SQLite database.
+
+    `source` (e.g. ppt_data.sqlite_standin()) is copied into a connection the
+    handler threads share. paging=False ignores ?limit=&offset=, like a
+    route without pageClause(). Every request path is appended to the
+    server's `hits` list. Returns the running server; its base URL is
+    http://127.0.0.1:<server_port>/api.
+    """
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    source.backup(conn)
+    lock = threading.Lock()
+    tables = {route.strip("/") for route in COLLECTIONS.values()}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            server.hits.append(self.path)
+            u = urlsplit(self.path)
+            parts = u.path.removeprefix("/api/").strip("/").split("/")
+            if parts[0] == "courses" and len(parts) == 3 and parts[2] == "enrollment":
+                with lock:
+                    rows = conn.execute("SELECT user_id FROM enrollments WHERE course_id = ?",
+                                        (parts[1],)).fetchall()
+                body = json.dumps({"enrolled": [r[0] for r in rows]}).encode()
+                return self._send(200, body, 'W/"%s"' % hashlib.sha1(body).hexdigest())
+            table = parts[0]
+            if len(parts) > 1 or table not in tables:
+                return self._send(404, json.dumps({"error": "Not found."}).encode())
+            q = {k: v[0] for k, v in parse_qs(u.query).items()}
+            sql, args = f"SELECT * FROM {table} ORDER BY id", ()
+            if paging and q.get("limit"):
+                sql += " LIMIT ? OFFSET ?"
+                args = (int(q["limit"]), int(q.get("offset", 0)))
+            with lock:
+                cur = conn.execute(sql, args)
+                # camelCase keys, as the Express routes map their rows
+                cols = [re.sub(r"_(\w)", lambda m: m.group(1).upper(), c[0])
+                        for c in cur.description]
+                body = json.dumps([dict(zip(cols, r)) for r in cur.fetchall()]).encode()
+            etag = 'W/"%s"' % hashlib.sha1(body).hexdigest()
+            if self.headers.get("If-None-Match") == etag:
+                return self._send(304, b"", etag)
+            self._send(200, body, etag)
+
+        def _send(self, status, body, etag=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            if etag:
+                self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.daemon_threads = True
+    server.hits = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ── Checks ────────────────────────────────────────────────────
+def _database(users):
+    db = sqlite3.connect(":memory:")
+    db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, role TEXT)")
+    db.executemany("INSERT INTO users (id, name, role) VALUES (?, ?, 'Student')",
+                   [(i, f"Student {i}") for i in range(1, users + 1)])
+    db.commit()         # backup() waits on an open write transaction
+    return db
+
+def _paged(users, page_size, paging=True):
+    """(ids pages() yields, list-route requests made) for `users` rows."""
+    server = stub_server(_database(users), paging=paging)
+    try:
+        with LMSClient(f"http://127.0.0.1:{server.server_port}/api") as api:
+            ids = [user["id"] for user in api.pages("/users", page_size)]
+        return ids, len(server.hits)
+    finally:
+        server.shutdown()
+
+def check_short_page():
+    ids, requests = _paged(23, 10)
+    assert ids == list(range(1, 24)), ids
+    assert requests == 3, requests                  # 10 + 10 + 3, nothing after the short page
+
+def check_exact_pages():
+    ids, requests = _paged(20, 10)
+    assert ids == list(range(1, 21)), ids
+    assert requests == 3, requests                  # the empty third page ends it
+
+def check_longer_page():
+    ids, requests = _paged(25, 10, paging=False)
+    assert ids == list(range(1, 26)), ids
+    assert requests == 1, requests
+
+def check_repeated_page():
+    ids, requests = _paged(10, 10, paging=False)    # whole list == one full page
+    assert ids == list(range(1, 11)), ids
+    assert requests == 2, requests                  # the repeat is dropped, not looped on
+
+def check_prefetch():
+    server = stub_server(_database(30))
+    try:
+        with LMSClient(f"http://127.0.0.1:{server.server_port}/api") as api:
+            stream = api.pages("/users", 10)
+            assert next(stream)["id"] == 1
+            deadline = time.monotonic() + 5
+            while len(server.hits) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # page two was requested while page one is still being consumed
+            assert len(server.hits) == 2 and "offset=10" in server.hits[1], server.hits
+            assert len(list(stream)) == 29
+    finally:
+        server.shutdown()
+
+CHECKS = [check_short_page, check_exact_pages, check_longer_page, check_repeated_page,
+          check_prefetch]
+
+
+def main():
+    t0 = time.perf_counter()
+    for check in CHECKS:
+        check()
+        print(f"  ok  {check.__name__}")
+    print(f"{len(CHECKS)} checks passed in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Batch-render one report deck per course and one per student.
+
+    python ppt_batch.py OUT_DIR [--db URL | --demo N] [--kind all|course|student]
+                        [--workers N]
+
+Report data comes from a handful of whole-table queries against the LMS
+tables (users, courses, enrollments, assignments, submissions and the image
+uploads in assignment_files), grouped once in the parent. Deck specs are
+then handed to a ProcessPoolExecutor whose workers import python-pptx and
+parse the blank template once at start-up; each worker writes its deck
+straight into OUT_DIR.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import make_ppt
+import ppt_data
+
+
+# ── Report data ───────────────────────────────────────────────
+class ReportData:
+    """The LMS tables a report needs, grouped by course and by student."""
+
+    def __init__(self, conn):
+        q = lambda sql: ppt_data.rows(conn, sql)
+        self.users = {uid: (name, email, role) for uid, name, email, role in
+                      q("SELECT id, name, email, role FROM users")}
+        self.courses = list(q("SELECT id, title, category, instructor, status FROM courses ORDER BY id"))
+        self.course_title = {c[0]: c[1] for c in self.courses}
+
+        self.students_of = defaultdict(list)
+        self.courses_of = defaultdict(list)
+        for course_id, user_id in q("SELECT course_id, user_id FROM enrollments ORDER BY id"):
+            self.students_of[course_id].append(user_id)
+            self.courses_of[user_id].append(course_id)
+
+        self.assignments_of = defaultdict(list)
+        for row in q("SELECT id, course_id, title, due_date FROM assignments ORDER BY id"):
+            self.assignments_of[row[1]].append(row)
+
+        self.subs_of_assignment = defaultdict(list)
+        self.subs_of_student = defaultdict(list)
+        for row in q("SELECT assignment_id, student_id, assignment_title, course_name,"
+                     " score, max_score, status FROM submissions ORDER BY id"):
+            self.subs_of_assignment[row[0]].append(row)
+            self.subs_of_student[row[1]].append(row)
+
+        # Image uploads on a course's assignments (SVG can't be embedded)
+        self.images_of = defaultdict(list)
+        for course_id, name, url in q(
+                "SELECT a.course_id, f.original_name, f.url FROM assignment_files f"
+                " JOIN assignments a ON a.id = f.assignment_id"
+                " WHERE f.mimetype LIKE 'image/%' AND f.mimetype <> 'image/svg+xml' ORDER BY f.id"):
+            self.images_of[course_id].append({"src": url, "caption": name})
+
+    def course_spec(self, course):
+        course_id, title, category, instructor, status = course
+        assignments = self.assignments_of[course_id]
+        subs = [self.subs_of_assignment[a[0]] for a in assignments]
+        graded = [sum(1 for r in rows if r[6] == "graded") for rows in subs]
+        lines = [f"{a[2]}  -  due {a[3] or 'n/a'}  -  {len(rows)} submitted, {g} graded"
+                 for a, rows, g in zip(assignments, subs, graded)]
+        students = [self.users[u][0] for u in self.students_of[course_id] if u in self.users]
+        slides = [{
+            "layout": "summary",
+            "title": title,
+            "subtitle": f"{category or 'General'}  |  Instructor: {instructor or 'n/a'}  |  {status}",
+            "stats": [
+                {"label": "Students enrolled", "value": len(students), "color": "BLUE"},
+                {"label": "Assignments", "value": len(assignments), "color": "PURPLE"},
+                {"label": "Submissions", "value": sum(len(rows) for rows in subs), "color": "AMBER"},
+                {"label": "Graded", "value": sum(graded), "color": "GREEN"},
+            ],
+            "blocks": [
+                {"heading": "Assignments", "bullets": lines or ["No assignments yet"]},
+                {"heading": "Enrolled Students", "bullets": students or ["No students enrolled"]},
+            ],
+        }]
+        if self.images_of[course_id]:
+            slides.append({"layout": "gallery", "title": f"{title}: Course Media",
+                           "subtitle": "Images uploaded to this course's assignments",
+                           "images": self.images_of[course_id]})
+        return {"slides": slides}
+
+    def student_spec(self, user_id):
+        name, email, role = self.users[user_id]
+        subs = self.subs_of_student[user_id]
+        scores = [100 * r[4] / (r[5] or 100) for r in subs if r[4] is not None]
+        avg = f"{sum(scores) / len(scores):.0f}%" if scores else "-"
+        lines = [f"{r[2]} ({r[3]})  -  " + (f"{r[4]}/{r[5]}" if r[4] is not None else r[6])
+                 for r in subs]
+        courses = [self.course_title.get(c, f"Course {c}") for c in self.courses_of[user_id]]
+        return {"slides": [{
+            "layout": "summary",
+            "title": name,
+            "subtitle": f"{email}  |  {role}",
+            "stats": [
+                {"label": "Courses", "value": len(courses), "color": "BLUE"},
+                {"label": "Submissions", "value": len(subs), "color": "AMBER"},
+                {"label": "Graded", "value": len(scores), "color": "GREEN"},
+                {"label": "Average score", "value": avg, "color": "PURPLE"},
+            ],
+            "blocks": [
+                {"heading": "Enrolled Courses", "bullets": courses or ["Not enrolled in any course"]},
+                {"heading": "Submissions", "bullets": lines or ["No submissions yet"]},
+            ],
+        }]}
+
+    def jobs(self, out_dir, kind="all"):
+        """Lazily yield (output path, deck spec) pairs."""
+        if kind in ("all", "course"):
+            for course in self.courses:
+                yield os.path.join(out_dir, f"course-{course[0]}.pptx"), self.course_spec(course)
+        if kind in ("all", "student"):
+            for user_id, (_, _, role) in self.users.items():
+                if role == "Student":
+                    yield os.path.join(out_dir, f"student-{user_id}.pptx"), self.student_spec(user_id)
+
+
+# ── Workers ───────────────────────────────────────────────────
+def _warm_worker():
+    # Pay for the python-pptx import, template parsing and style compilation
+    # once per process instead of on the first job.
+    make_ppt.warm_up()
+
+def _render_job(job):
+    path, spec = job
+    data = make_ppt.render_bytes(spec)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path, len(data)
+
+def run_batch(jobs, workers=None, max_pending=None):
+    """Render (path, spec) jobs in a process pool, yielding (path, bytes) as decks finish.
+
+    At most `max_pending` jobs are queued at once, so a lazy job iterator
+    is never drained into memory ahead of the workers.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 4
+    with ProcessPoolExecutor(workers, initializer=_warm_worker) as pool:
+        pending = set()
+        for job in jobs:
+            pending.add(pool.submit(_render_job, job))
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield fut.result()
+        for fut in wait(pending).done:
+            yield fut.result()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render per-course and per-student report decks.")
+    ap.add_argument("out_dir")
+    ap.add_argument("--db", help="database URL (default: DATABASE_URL / DB_* like the backend)")
+    ap.add_argument("--demo", type=int, metavar="N",
+                    help="use an in-memory SQLite stand-in with N generated students")
+    ap.add_argument("--kind", choices=("all", "course", "student"), default="all")
+    ap.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    args = ap.parse_args(argv)
+
+    if args.demo:
+        conn = ppt_data.sqlite_standin(students=args.demo, courses=max(4, args.demo // 100))
+    else:
+        conn = ppt_data.connect(args.db)
+    t0 = time.perf_counter()
+    data = ReportData(conn)
+    conn.close()
+    print(f"Loaded report data in {time.perf_counter() - t0:.2f}s")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    t0 = time.perf_counter()
+    count = total = 0
+    for path, size in run_batch(data.jobs(args.out_dir, args.kind), args.workers):
+        count += 1
+        total += size
+        if count % 100 == 0:
+            rate = count / (time.perf_counter() - t0)
+            print(f"  {count} decks  {rate:.1f} decks/s", file=sys.stderr)
+    elapsed = time.perf_counter() - t0
+    print(f"Rendered {count} decks ({total / 1e6:.1f} MB) in {elapsed:.1f}s"
+          f"  -  {count / elapsed if elapsed else 0:.1f} decks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Analytics chart slides built from aggregate queries.
+
+    python ppt_charts.py OUT.pptx [--db URL | --api [URL]] [--demo N] [--top N]
+
+Three GROUP BY queries against the LMS tables (enrollments per course,
+submissions vs. graded per assignment, users per role) become "chart"
+slides in a deck spec, which make_ppt renders as native charts: one chart
+part per slide instead of a shape per data point. With --api the same
+charts are built from the Express routes through ppt_api.LMSClient.
+"""
+import argparse
+import time
+from collections import Counter
+
+import make_ppt
+import ppt_api
+import ppt_data
+
+ENROLLMENTS_SQL = """
+SELECT c.title, COUNT(e.id)
+FROM courses c LEFT JOIN enrollments e ON e.course_id = c.id
+GROUP BY c.id, c.title
+ORDER BY COUNT(e.id) DESC, c.id
+"""
+
+SUBMISSIONS_SQL = """
+SELECT a.title, a.course_name, COUNT(s.id),
+       SUM(CASE WHEN s.status = 'graded' THEN 1 ELSE 0 END)
+FROM assignments a LEFT JOIN submissions s ON s.assignment_id = a.id
+GROUP BY a.id, a.title, a.course_name
+ORDER BY COUNT(s.id) DESC, a.id
+"""
+
+ROLES_SQL = "SELECT role, COUNT(*) FROM users GROUP BY role"
+
+
+def _top(rows, top):
+    """First `top` rows, with the rest summed into one "Other" row."""
+    rows = list(rows)
+    if len(rows) <= top:
+        return rows
+    rest = rows[top-1:]
+    other = ["Other"] + [int(sum(r[i] or 0 for r in rest)) for i in range(1, len(rest[0]))]
+    return rows[:top-1] + [tuple(other)]
+
+def analytics_slides(conn, top=15):
+    """Chart slide specs for the analytics page."""
+    # MySQL returns SUM() as Decimal, which the spec's JSON hashing can't take
+    return _slides(((title, int(n)) for title, n in ppt_data.rows(conn, ENROLLMENTS_SQL)),
+                   ((title, course, int(n), int(graded or 0))
+                    for title, course, n, graded in ppt_data.rows(conn, SUBMISSIONS_SQL)),
+                   {role: int(n) for role, n in ppt_data.rows(conn, ROLES_SQL)}, top)
+
+def api_analytics_slides(api, top=15, page_size=500):
+    """analytics_slides() from the Express routes through a ppt_api.LMSClient.
+
+    Courses and assignments are fetched concurrently, then every course's
+    enrollment list concurrently; submissions and users are streamed page by
+    page and counted, so the charts match the SQL aggregates.
+    """
+    data = api.fetch_all({"courses": "/courses", "assignments": "/assignments"})
+    courses = sorted(data["courses"], key=lambda c: c["id"])
+    enrolled = api.fetch_all({c["id"]: f"/courses/{c['id']}/enrollment" for c in courses})
+    per_course = sorted(((len(enrolled[c["id"]]["enrolled"]), c["id"], c["title"]) for c in courses),
+                        key=lambda r: (-r[0], r[1]))
+
+    sub_counts, graded = Counter(), Counter()
+    for sub in api.pages("/submissions", page_size):
+        sub_counts[sub["assignmentId"]] += 1
+        graded[sub["assignmentId"]] += sub["status"] == "graded"
+    assignments = sorted(data["assignments"], key=lambda a: (-sub_counts[a["id"]], a["id"]))
+
+    roles = Counter(user["role"] for user in api.pages("/users", page_size))
+    return _slides(((title, n) for n, _, title in per_course),
+                   ((a["title"], a.get("courseName"), sub_counts[a["id"]], graded[a["id"]])
+                    for a in assignments),
+                   dict(roles), top)
+
+def _slides(enrollments, submissions, counts, top):
+    # (title, n) rows, (title, course, submitted, graded) rows and {role: n}, largest first
+    enrollments = _top(enrollments, top)
+    submissions = _top(((f"{title} ({course})" if course else title, n, graded)
+                        for title, course, n, graded in submissions), top)
+    roles = [r for r in ppt_data.ROLES if counts.get(r)] + \
+            sorted(r for r in counts if r not in ppt_data.ROLES)
+
+    total = sum(n for _, n in enrollments)
+    return [
+        {"layout": "chart", "title": "Enrollments per Course",
+         "subtitle": f"{total} enrollments",
+         "chart": "bar",
+         "categories": [title for title, _ in reversed(enrollments)],
+         "series": [{"name": "Enrollments", "values": [n for _, n in reversed(enrollments)],
+                     "color": "BLUE"}]},
+        {"layout": "chart", "title": "Submissions vs Graded",
+         "subtitle": "Per assignment, most submitted first",
+         "chart": "column",
+         "categories": [r[0] for r in submissions],
+         "series": [{"name": "Submitted", "values": [r[1] for r in submissions], "color": "BLUE"},
+                    {"name": "Graded", "values": [r[2] for r in submissions], "color": "GREEN"}]},
+        {"layout": "chart", "title": "Users by Role",
+         "subtitle": f"{sum(counts.values())} users",
+         "chart": "doughnut",
+         "categories": roles,
+         "series": [{"name": "Users", "values": [counts[r] for r in roles]}]},
+    ]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render the analytics chart slides.")
+    ap.add_argument("out")
+    ap.add_argument("--db", help="database URL (default: DATABASE_URL / DB_* like the backend)")
+    ap.add_argument("--api", nargs="?", const=ppt_api.DEFAULT_URL, metavar="URL",
+                    help="read the Express API instead of the database (default URL: LMS_API_URL)")
+    ap.add_argument("--demo", type=int, metavar="N",
+                    help="use an in-memory SQLite stand-in with N generated students"
+                         " (served by a local API stub with --api)")
+    ap.add_argument("--top", type=int, default=15, help="categories per chart before 'Other'")
+    args = ap.parse_args(argv)
+
+    if args.demo:
+        conn = ppt_data.sqlite_standin(students=args.demo, courses=max(4, args.demo // 100))
+    else:
+        conn = None if args.api else ppt_data.connect(args.db)
+    t0 = time.perf_counter()
+    if args.api:
+        from ppt_api_stub import stub_server
+        server = stub_server(conn) if conn else None
+        url = f"http://127.0.0.1:{server.server_port}/api" if server else args.api
+        try:
+            with ppt_api.LMSClient(url) as api:
+                slides = api_analytics_slides(api, args.top)
+        finally:
+            if server:
+                server.shutdown()
+    else:
+        try:
+            slides = analytics_slides(conn, args.top)
+        finally:
+            conn.close()
+    t1 = time.perf_counter()
+    with open(args.out, "wb") as f:
+        f.write(make_ppt.render_bytes({"slides": slides}))
+    print(f"Saved: {args.out}  (queries {t1 - t0:.2f}s, render {time.perf_counter() - t1:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
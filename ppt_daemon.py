@@ -0,0 +1,139 @@
+"""Long-lived render worker: warm once, then render jobs from stdin or a Unix socket.
+
+    python ppt_daemon.py                       # JSON lines on stdin -> stdout
+    python ppt_daemon.py --socket /tmp/dbb.sock [--cache-dir DIR]
+
+The python-pptx/lxml import, default template parsing and run-style
+compilation happen once at start-up (make_ppt.warm_up); every job then
+starts from make_ppt.new_presentation(), a copy of the pre-parsed 13.33x7.5
+base presentation. One job per line:
+
+    {"id": 1, "spec": {...}, "out": "deck.pptx"}
+    {"id": 2, "spec_path": "deck_spec.json"}           # no "out": bytes come back
+
+and one reply line per job, in order:
+
+    {"id": 1, "ok": true, "out": "deck.pptx", "bytes": 48211, "ms": 182.4}
+    {"id": 2, "ok": true, "pptx_b64": "...", "bytes": 48211, "ms": 175.0}
+    {"id": 3, "ok": false, "error": "KeyError: 'layout'"}
+
+Over a socket each connection is a JSON-lines session of its own; renders
+from all connections go through one lock, so jobs run one at a time.
+"""
+import argparse
+import base64
+import contextlib
+import json
+import os
+import signal
+import socketserver
+import stat
+import sys
+import threading
+import time
+
+import make_ppt
+
+
+def render_job(job, cache_dir=None):
+    """Run one job dict and return its reply dict; errors are reported, not raised."""
+    reply = {"id": job.get("id")}
+    try:
+        spec = job["spec"] if "spec" in job else make_ppt.load_spec(job["spec_path"])
+        t0 = time.perf_counter()
+        data = make_ppt.render_bytes(spec, cache_dir)
+        reply["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+        out = job.get("out")
+        if out:
+            tmp = out + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, out)
+            reply["out"] = out
+        else:
+            reply["pptx_b64"] = base64.b64encode(data).decode("ascii")
+        reply.update(ok=True, bytes=len(data))
+    except Exception as e:
+        reply.update(ok=False, error=f"{type(e).__name__}: {e}")
+    return reply
+
+def serve_lines(lines, write, cache_dir=None, lock=None):
+    """Answer each JSON job line from `lines` through `write(reply_line)`."""
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            reply = {"id": None, "ok": False, "error": f"bad job line: {e}"}
+        else:
+            if lock:
+                with lock:
+                    reply = render_job(job, cache_dir)
+            else:
+                reply = render_job(job, cache_dir)
+        write(json.dumps(reply) + "\n")
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server
+        lines = (raw.decode("utf-8") for raw in self.rfile)
+
+        def write(text):
+            self.wfile.write(text.encode("utf-8"))
+            self.wfile.flush()
+
+        serve_lines(lines, write, server.cache_dir, server.render_lock)
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, cache_dir=None):
+        try:
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError(f"{path} exists and is not a socket")
+            os.remove(path)         # left behind by a daemon that died
+        except FileNotFoundError:
+            pass
+        super().__init__(path, _Handler)
+        self.cache_dir = cache_dir
+        self.render_lock = threading.Lock()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Warm deck render worker.")
+    ap.add_argument("--socket", metavar="PATH", help="listen on a Unix socket instead of stdin")
+    ap.add_argument("--cache-dir", help="reuse compiled layout plans from this directory")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    make_ppt.warm_up()
+    print(f"Warm in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+    if not args.socket:
+        def write(text):
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        serve_lines(sys.stdin, write, args.cache_dir)
+        return
+
+    # Exit through the finally below on SIGTERM too, so the socket file goes away.
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server = RenderServer(args.socket, args.cache_dir)
+    except FileExistsError as e:
+        sys.exit(f"ppt_daemon: {e}")
+    with server:
+        print(f"Listening on {args.socket}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""Static HTML slides from the same layout plan as the .pptx, in one pass.
+
+    python ppt_html.py [out.pptx] [--html frontend/public/deck] [--spec deck_spec.json]
+                       [--cache-dir DIR] [--level 6]
+
+export() compiles the deck once (make_ppt.load_plan) and writes both
+targets from that plan: index.html, then the .pptx. Every plan op becomes
+an absolutely positioned element at the op's own geometry, as a percentage
+of the slide, and font sizes are in container-query units, so a slide
+scales with its width like a picture of it does. Colors are written as the CSS variables of
+frontend/public/prototype.html where the palette has them. Images go into
+media/ beside index.html, one file per picture.
+
+The output is plain HTML and CSS with no scripts, so Netlify or Render can
+serve it as it is (the default --html is inside the front end's public/).
+"""
+import argparse
+import html
+import math
+import os
+import time
+
+import make_ppt
+import ppt_images
+import ppt_save
+from ppt_metrics import INSET_X, INSET_Y, LINE
+
+W, H = make_ppt.SLIDE_W, make_ppt.SLIDE_H
+DEFAULT_HTML_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "frontend", "public", "deck")
+
+# make_ppt colors -> the prototype page's CSS variables (frontend/public/prototype.html)
+CSS_VARS = {
+    "1E3A5F": "navy", "2563EB": "blue", "DBEAFE": "light-blue", "F4F7FB": "bg",
+    "FFFFFF": "white", "DDE6F0": "border", "1E2A3A": "text", "607D9A": "muted",
+    "DC2626": "red", "7C3AED": "purple", "B45309": "amber", "059669": "green",
+}
+FONTS = "Calibri, Carlito, 'Segoe UI', Arial, sans-serif"
+
+CSS = """:root {
+%s
+}
+* { box-sizing: border-box; }
+body { margin: 0; padding: 24px; background: #e2e8f0; font-family: %s; }
+.slide { position: relative; max-width: 1280px; aspect-ratio: %s / %s; margin: 0 auto 24px;
+         overflow: hidden; container-type: inline-size; background: var(--white);
+         box-shadow: 0 2px 12px rgba(30, 58, 95, 0.18); }
+.slide > * { position: absolute; margin: 0; }
+.t { padding: %s %s; line-height: %s; overflow-wrap: break-word; }
+.m { display: flex; flex-direction: column; justify-content: center; }
+.nw { white-space: pre; }
+.slide ul { list-style-position: outside; }
+.slide img { display: block; }
+""" % ("\n".join(f"    --{name}: #{hex_.lower()};" for hex_, name in CSS_VARS.items()), FONTS,
+       W, H, f"{INSET_Y / W * 100:.3f}cqw", f"{INSET_X / W * 100:.3f}cqw", LINE)
+
+
+def css_color(value):
+    hex_ = str(make_ppt.color(value))
+    return f"var(--{CSS_VARS[hex_]})" if hex_ in CSS_VARS else f"#{hex_.lower()}"
+
+def _cqw(inches):
+    return f"{inches / W * 100:.3f}cqw"
+
+def _pt(points):
+    return _cqw(points / 72)
+
+def _pos(l, t, w, h):
+    return (f"left:{l / W * 100:.3f}%;top:{t / H * 100:.3f}%;"
+            f"width:{w / W * 100:.3f}%;height:{h / H * 100:.3f}%;")
+
+def _font(fmt):
+    css = f"font-size:{_pt(fmt['size'])};color:{css_color(fmt['color'])};"
+    if fmt.get("bold"):
+        css += "font-weight:700;"
+    if fmt.get("italic"):
+        css += "font-style:italic;"
+    return css
+
+_ALIGN = {1: "left", 2: "center", 3: "right", 4: "justify"}
+
+def _text(text):
+    return html.escape(text).replace("\n", "<br>")
+
+
+class Media:
+    """Picture files for one HTML export: one per fitted image, named by content hash."""
+
+    _EXT = {b"\x89PNG": "png", b"GIF8": "gif"}
+
+    def __init__(self, out_dir):
+        self.out_dir = out_dir
+        self.files = {}
+
+    def url(self, source, px):
+        data = ppt_images.store().fitted(source, *px)
+        ext = self._EXT.get(data[:4], "jpg")
+        name = f"{source.sha[:20]}-{px[0]}x{px[1]}.{ext}"
+        if name not in self.files:
+            self.files[name] = data
+        return "media/" + name
+
+    def write(self):
+        if self.files:
+            os.makedirs(os.path.join(self.out_dir, "media"), exist_ok=True)
+        for name, data in self.files.items():
+            with open(os.path.join(self.out_dir, "media", name), "wb") as f:
+                f.write(data)
+
+
+class HtmlSlide:
+    """One slide's markup; methods mirror the plan ops (args after `slide`)."""
+
+    def __init__(self, media=None):
+        self.media = media
+        self.background = None
+        self.parts = []
+
+    def _add(self, tag, style, inner="", cls=None, attrs=""):
+        cls = f' class="{cls}"' if cls else ""
+        self.parts.append(f'<{tag}{cls} style="{style}"{attrs}>{inner}</{tag}>')
+
+    def bg(self, color_):
+        self.background = css_color(color_)
+
+    def box(self, l, t, w, h, fill_color=None, border_color=None, border_pt=0, inner="", cls=None,
+            extra=""):
+        style = _pos(l, t, w, h)
+        if fill_color:
+            style += f"background:{css_color(fill_color)};"
+        if border_color and border_pt:
+            style += f"border:{_pt(border_pt)} solid {css_color(border_color)};"
+        self._add("div", style + extra, inner, cls)
+
+    def txt(self, text, l, t, w, h, size=None, bold=None, color=None, align=1,
+            wrap=True, italic=None, style="text"):
+        fmt = make_ppt.run_format(style, size, bold, italic, color)
+        css = _pos(l, t, w, h) + _font(fmt) + f"text-align:{_ALIGN.get(int(align), 'left')};"
+        self._add("div", css, _text(text), "t" if wrap else "t nw")
+
+    def title_strip(self, title, l, t, w, h, color, size=13):
+        fmt = make_ppt.run_format("strip-title", size=size)
+        self.box(l, t, w, h, color, None, 0, _text(title), "t m",
+                 _font(fmt) + "text-align:center;")
+
+    def flow_box(self, label, l, t, w=1.7, h=0.55, fill=make_ppt.LBLUE, border=make_ppt.BLUE,
+                 tcolor=make_ppt.NAVY):
+        fmt = make_ppt.run_format("flow-label", color=tcolor)
+        self.box(l, t, w, h, fill, border, 1.5, _text(label), "t m",
+                 _font(fmt) + "text-align:center;")
+
+    def arrow(self, l, t, w=0.4, h=0.04):
+        self.box(l, t, w, h, make_ppt.BLUE)
+
+    def _runs(self, item, color, prefix=""):
+        runs = [(item, False, color)] if isinstance(item, str) else item
+        out = []
+        for i, (text, bold, run_color) in enumerate(runs):
+            text = _text((prefix if i == 0 else "") + text)
+            css = ("font-weight:700;" if bold else "") + (
+                f"color:{css_color(run_color)};" if run_color and str(run_color) != str(color) else "")
+            out.append(f'<span style="{css}">{text}</span>' if css else text)
+        return "".join(out)
+
+    def bullets(self, items, l, t, w, step, size=12, color=make_ppt.BLACK,
+                bullet="-", indent=0.2, frame=True):
+        fmt = make_ppt.run_format("bullet", size=size, color=color)
+        if not frame:
+            for item in items:
+                inner = self._runs(item, fmt["color"], bullet + " " if bullet else "")
+                self._add("div", _pos(l, t, w, step - 0.02) + _font(fmt), inner, "t")
+                t += step
+            return
+        gap = _pt(max(step*72 - size*LINE, 0))
+        marker = "padding-left:0;list-style-type:none;"
+        if bullet:
+            quoted = html.escape(bullet.replace("'", "\\'"))
+            marker = f"padding-left:{_cqw(indent)};list-style-type:'{quoted} ';"
+        lis = "".join(f'<li style="margin-bottom:{gap}">{self._runs(item, fmt["color"])}</li>'
+                      for item in items)
+        height = make_ppt.bullets_height(items, w, step, size, indent if bullet else 0)
+        self._add("div", _pos(l, t, w, height) + _font(fmt),
+                  f'<ul style="margin:0;{marker}">{lis}</ul>', "t")
+
+    def stamp(self, component, l, t, w, h, params):
+        for name, *args in make_ppt.COMPONENTS[component].ops(params, l, t):
+            getattr(self, name)(*args)
+
+    def image(self, src, l, t, w, h, fit="contain", px=None):
+        source = ppt_images.store().source(src)
+        if source is None or self.media is None:
+            return self.box(l, t, w, h, make_ppt.GREY, "DDE6F0", 1)
+        if px is None:
+            px = ppt_images.pixels(source, ppt_images.box_scale(source, w, h, fit))
+        self.parts.append(f'<img style="{_pos(l, t, w, h)}object-fit:{fit};"'
+                          f' src="{self.media.url(source, px)}" alt="">')
+
+    def chart(self, kind, categories, series, l, t, w, h, size=11):
+        """Inline SVG in slide-inch units: bars per series, or pie / doughnut slices."""
+        x0, y0, cw, ch = 0.3, 0.3, w - 0.6, h - 0.6
+        label = f'font-size="{size / 72:.3f}" fill="var(--muted)" font-family="{FONTS}"'
+        svg = []
+        if kind in ("pie", "doughnut"):
+            values = series[0][1]
+            total = sum(values) or 1
+            r = min(cw, ch) / 2
+            cx, cy = x0 + r, y0 + ch / 2
+            start = -math.pi / 2
+            for i, v in enumerate(values):
+                end = start + 2 * math.pi * v / total
+                fill = css_color(make_ppt.POINT_COLORS[i % len(make_ppt.POINT_COLORS)])
+                large = 1 if end - start > math.pi else 0
+                svg.append(f'<path d="M{cx:.3f},{cy:.3f} L{cx + r*math.cos(start):.3f},'
+                           f'{cy + r*math.sin(start):.3f} A{r:.3f},{r:.3f} 0 {large} 1 '
+                           f'{cx + r*math.cos(end):.3f},{cy + r*math.sin(end):.3f} Z" fill="{fill}"/>')
+                ly = y0 + i * size / 72 * 1.6
+                svg.append(f'<rect x="{x0 + 2*r + 0.3:.3f}" y="{ly:.3f}" width="{size / 72:.3f}"'
+                           f' height="{size / 72:.3f}" fill="{fill}"/>'
+                           f'<text x="{x0 + 2*r + 0.3 + size / 48:.3f}" y="{ly + size / 80:.3f}"'
+                           f' {label}>{html.escape(str(categories[i]))}</text>')
+                start = end
+            if kind == "doughnut":
+                svg.append(f'<circle cx="{cx:.3f}" cy="{cy:.3f}" r="{r / 2:.3f}" fill="var(--white)"/>')
+        else:
+            top = max((max(v) for _, v, _ in series if v), default=0) or 1
+            n, k = max(len(categories), 1), max(len(series), 1)
+            horizontal = kind == "bar"
+            slot = (ch if horizontal else cw) / n
+            bar = slot * 0.62 / k
+            for si, (_, values, series_color) in enumerate(series):
+                fill = css_color(series_color or make_ppt.BLUE)
+                for ci, v in enumerate(values):
+                    a = slot * ci + slot * 0.19 + bar * si
+                    if horizontal:
+                        bw, by = cw * v / top, y0 + ch - a - bar
+                        svg.append(f'<rect x="{x0:.3f}" y="{by:.3f}" width="{bw:.3f}"'
+                                   f' height="{bar:.3f}" fill="{fill}"/>')
+                    else:
+                        bh = ch * v / top
+                        svg.append(f'<rect x="{x0 + a:.3f}" y="{y0 + ch - bh:.3f}" width="{bar:.3f}"'
+                                   f' height="{bh:.3f}" fill="{fill}"/>'
+                                   f'<text x="{x0 + a + bar / 2:.3f}" y="{y0 + ch - bh - 0.05:.3f}"'
+                                   f' text-anchor="middle" {label}>{html.escape(str(v))}</text>')
+            if not horizontal:
+                for ci, cat in enumerate(categories):
+                    svg.append(f'<text x="{x0 + slot * (ci + 0.5):.3f}" y="{y0 + ch + size / 72 * 1.2:.3f}"'
+                               f' text-anchor="middle" {label}>{html.escape(str(cat))}</text>')
+        self._add("svg", _pos(l, t, w, h), "".join(svg), None,
+                  f' viewBox="0 0 {w:.3f} {h:.3f}"')
+
+    def markup(self, n):
+        style = f' style="background:{self.background}"' if self.background else ""
+        return f'<section class="slide" id="slide-{n}"{style}>\n' + "\n".join(self.parts) + "\n</section>"
+
+
+def render_html(plan, title="Digital Black Board", media=None):
+    """Whole HTML document for a compiled plan; pictures are collected in `media`."""
+    sections = []
+    for n, slide_plan in enumerate(plan, 1):
+        slide = HtmlSlide(media)
+        if slide_plan["bg"]:
+            slide.bg(slide_plan["bg"])
+        for name, *args in slide_plan["ops"]:
+            getattr(slide, name)(*args)
+        sections.append(slide.markup(n))
+    return ("<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"UTF-8\">\n"
+            "<meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">\n"
+            f"<title>{html.escape(title)}</title>\n<style>\n{CSS}</style>\n</head>\n<body>\n"
+            + "\n".join(sections) + "\n</body>\n</html>\n")
+
+def write_html(plan, out_dir, title="Digital Black Board"):
+    """Write index.html (and media/) for a compiled plan into out_dir; returns the page path."""
+    os.makedirs(out_dir, exist_ok=True)
+    media = Media(out_dir)
+    page = render_html(plan, title, media)
+    media.write()
+    path = os.path.join(out_dir, "index.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(page)
+    return path
+
+def _deck_title(spec):
+    slides = spec.get("slides") or [{}]
+    return spec.get("title") or slides[0].get("title") or "Digital Black Board"
+
+def export(spec, pptx_path, html_dir, cache_dir=None, level=6):
+    """Write `spec` as a .pptx and as static HTML from one compiled plan.
+
+    The HTML costs a few milliseconds next to the .pptx, so both are written
+    here in turn. Returns (pptx path, HTML page path).
+    """
+    plan = make_ppt.load_plan(spec, cache_dir)
+    page = write_html(plan, html_dir, _deck_title(spec))
+    ppt_save.save(make_ppt.emit_plan(plan), pptx_path, level)
+    return pptx_path, page
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render the deck as .pptx and static HTML in one pass.")
+    ap.add_argument("out", nargs="?", default=make_ppt.DEFAULT_OUT)
+    ap.add_argument("--html", default=DEFAULT_HTML_DIR, help="directory for index.html and media/")
+    ap.add_argument("--spec", default=make_ppt.SPEC_PATH, help="deck spec (.json, .yaml or .yml)")
+    ap.add_argument("--cache-dir", help="reuse compiled layout plans from this directory")
+    ap.add_argument("--level", type=int, default=6, choices=range(10),
+                    help="deflate level of the package, 0 stores (default 6)")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    pptx_path, page = export(make_ppt.load_spec(args.spec), args.out, args.html,
+                             args.cache_dir, args.level)
+    print(f"Saved: {pptx_path}\nSaved: {page}\n({(time.perf_counter() - t0) * 1000:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
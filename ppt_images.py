@@ -0,0 +1,288 @@
+"""Content-addressed slide images, downscaled once and cached on disk.
+
+    python ppt_images.py IMAGE... [--box 3x2] [--fit contain|cover]
+                         [--cache-dir DIR] [--repeat 50]          # timing
+
+An image is known by the SHA-256 of its bytes. Its record (hash and pixel
+size) is kept in the cache under a key of its path, size and mtime, so an
+unchanged upload is never re-read or re-hashed. Downscaled copies are kept
+as <hash>-<w>x<h>: each image is decoded and resized to a given pixel size
+once, and every later build reads the finished bytes.
+
+compile_plan() settles one pixel size per image for the whole deck, the
+largest any of its boxes needs at IMAGE_DPI. A picture used on several
+slides is therefore one part in the package (python-pptx shares parts with
+identical bytes). "contain" boxes letterbox the picture and "cover" boxes
+crop it through the picture's crop rectangle, so neither re-encodes it.
+
+Sources are file paths, or upload URLs as the backend stores them
+("/uploads/assignments/...", see backend/middleware/upload.js). Specs come
+from clients (POST /render), so a source is only read if its real path is
+under one of IMAGE_ROOTS: the upload directory plus any directories in
+DBB_IMAGE_ROOTS (os.pathsep-separated). Anything else is treated like a
+missing file and gets the placeholder. Pillow is only needed to fill the
+cache.
+"""
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from collections import namedtuple
+from io import BytesIO
+
+try:
+    from PIL import Image, ImageOps, UnidentifiedImageError
+except ImportError:
+    Image = None
+
+IMAGE_DPI = 150
+UPLOAD_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend", "uploads")
+UPLOAD_URL = "/uploads/"
+IMAGE_ROOTS = [UPLOAD_ROOT] + [d for d in os.environ.get("DBB_IMAGE_ROOTS", "").split(os.pathsep)
+                               if d]
+DEFAULT_CACHE = (os.environ.get("DBB_IMAGE_CACHE")
+                 or os.path.join(os.path.expanduser("~"), ".cache", "dbb-images"))
+# Formats python-pptx embeds as they are; anything else (WebP, ...) is re-encoded.
+EMBEDDABLE = ("JPEG", "PNG", "GIF")
+JPEG_QUALITY = 85
+
+Source = namedtuple("Source", "path sha width height")
+
+
+def _require_pillow():
+    if Image is None:
+        raise RuntimeError("Pillow is required to add images to the deck")
+
+def resolve(src, roots=None):
+    """Real path of an image source (a path, or an upload URL); None if outside `roots`."""
+    if src.startswith(UPLOAD_URL):
+        src = os.path.join(UPLOAD_ROOT, *src[len(UPLOAD_URL):].split("/"))
+    path = os.path.realpath(src)
+    for root in IMAGE_ROOTS if roots is None else roots:
+        root = os.path.realpath(root)
+        try:
+            if os.path.commonpath([path, root]) == root:
+                return path
+        except ValueError:
+            pass        # on another drive (Windows)
+    return None
+
+def _transposed(im):
+    # EXIF orientations 5-8 turn the picture a quarter
+    return im.getexif().get(0x0112, 1) in (5, 6, 7, 8)
+
+
+# ── Geometry ──────────────────────────────────────────────────
+def box_scale(source, w, h, fit="contain", dpi=IMAGE_DPI):
+    """Fraction of the source's pixels a w x h inch box shows at `dpi`, at most 1."""
+    fx, fy = w * dpi / source.width, h * dpi / source.height
+    return min(1.0, max(fx, fy) if fit == "cover" else min(fx, fy))
+
+def pixels(source, scale):
+    return [max(1, round(source.width * scale)), max(1, round(source.height * scale))]
+
+def placement(source, w, h, fit="contain"):
+    """(dx, dy, width, height, (crop l, t, r, b)) of the picture in a w x h box.
+
+    "contain" centres the whole picture; "cover" fills the box and crops the
+    overflow equally from both ends of the longer side.
+    """
+    ratio = (source.width * h) / (source.height * w)      # picture aspect / box aspect
+    if fit == "cover":
+        if ratio > 1:
+            side = (1 - 1/ratio) / 2
+            return 0, 0, w, h, (side, 0, side, 0)
+        side = (1 - ratio) / 2
+        return 0, 0, w, h, (0, side, 0, side)
+    pw, ph = (w, h / ratio) if ratio > 1 else (w * ratio, h)
+    return (w - pw) / 2, (h - ph) / 2, pw, ph, (0, 0, 0, 0)
+
+def settle(plan, store_=None, dpi=IMAGE_DPI):
+    """Give every image op in `plan` one pixel size per source: the largest its boxes need."""
+    store_ = store_ or store()
+    ops = [op for slide_plan in plan for op in slide_plan["ops"] if op[0] == "image"]
+    scales = {}
+    for op in ops:
+        source = store_.source(op[1])
+        if source:
+            scale = box_scale(source, op[4], op[5], op[6], dpi)
+            scales[source.sha] = max(scale, scales.get(source.sha, 0.0))
+    for op in ops:
+        source = store_.source(op[1])
+        if source:
+            op[7] = pixels(source, scales[source.sha])
+    return plan
+
+def spec_sources(spec):
+    """Every image source ("src" value) in a deck spec."""
+    if isinstance(spec, dict):
+        for k, v in spec.items():
+            if k == "src" and isinstance(v, str):
+                yield v
+            else:
+                yield from spec_sources(v)
+    elif isinstance(spec, list):
+        for v in spec:
+            yield from spec_sources(v)
+
+def sources_digest(spec, store_=None):
+    """Hash of the content of every image a spec uses ("" if none), for cache keys
+    that must change when an upload is replaced under the same URL."""
+    store_ = store_ or store()
+    srcs = sorted(set(spec_sources(spec)))
+    if not srcs:
+        return ""
+    h = hashlib.sha256()
+    for src in srcs:
+        source = store_.source(src)
+        h.update(f"{src}\0{source.sha if source else '-'}\n".encode())
+    return h.hexdigest()
+
+
+# ── Cache ─────────────────────────────────────────────────────
+class ImageStore:
+    """Source records and downscaled copies under one cache directory.
+
+    Both are memoized in the process too, so repeated slides cost a dict
+    lookup.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE, roots=None):
+        self.cache_dir = cache_dir
+        self.roots = roots
+        self._sources = {}
+        self._fitted = {}
+
+    def _path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def _write(self, name, data):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._path(name))
+
+    def source(self, src):
+        """Source record of `src`; None if it is missing, not allowed or not a raster image."""
+        path = resolve(src, self.roots)
+        if path is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        stamp = f"{path}\0{st.st_size}\0{st.st_mtime_ns}"
+        if stamp in self._sources:
+            return self._sources[stamp]
+        name = "src-" + hashlib.sha256(stamp.encode()).hexdigest()[:32] + ".json"
+        try:
+            with open(self._path(name), encoding="utf-8") as f:
+                source = Source(path, *json.load(f))
+        except (OSError, ValueError, TypeError):
+            source = self._probe(path)
+            if source:
+                self._write(name, json.dumps(source[1:]).encode())
+        self._sources[stamp] = source
+        return source
+
+    def _probe(self, path):
+        _require_pillow()
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            with Image.open(BytesIO(data)) as im:        # reads the header only
+                w, h = im.size
+                if _transposed(im):
+                    w, h = h, w
+        except (UnidentifiedImageError, OSError):
+            return None                                 # SVG, corrupt files, ...
+        return Source(path, hashlib.sha256(data).hexdigest(), w, h)
+
+    def fitted(self, source, width, height):
+        """Image bytes of `source` at width x height pixels (from the cache if there)."""
+        key = f"{source.sha}-{width}x{height}"
+        data = self._fitted.get(key)
+        if data is not None:
+            return data
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            data = self._resize(source, width, height)
+            self._write(key, data)
+        self._fitted[key] = data
+        return data
+
+    def _resize(self, source, width, height):
+        _require_pillow()
+        with Image.open(source.path) as im:
+            turned = _transposed(im)
+            if (im.format in EMBEDDABLE and not turned
+                    and (width, height) == (source.width, source.height)):
+                with open(source.path, "rb") as f:
+                    return f.read()                     # already small enough
+            # JPEG: let the decoder scale down by up to 8x first
+            im.draft("RGB", (height, width) if turned else (width, height))
+            im = ImageOps.exif_transpose(im)
+            alpha = im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info
+            im = im.convert("RGBA" if alpha else "RGB")
+            if im.size != (width, height):
+                im = im.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+            buf = BytesIO()
+            if alpha:
+                im.save(buf, "PNG")
+            else:
+                im.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True)
+            return buf.getvalue()
+
+
+_store = None
+
+def store():
+    """The process-wide ImageStore (DBB_IMAGE_CACHE or ~/.cache/dbb-images)."""
+    global _store
+    if _store is None:
+        _store = ImageStore()
+    return _store
+
+def use_cache(cache_dir):
+    """Point the process-wide ImageStore at cache_dir."""
+    global _store
+    _store = ImageStore(cache_dir)
+    return _store
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time cached image fitting on some images.")
+    ap.add_argument("images", nargs="+")
+    ap.add_argument("--box", default="3x2", help="box in inches, WxH")
+    ap.add_argument("--fit", choices=("contain", "cover"), default="contain")
+    ap.add_argument("--cache-dir", default=DEFAULT_CACHE)
+    ap.add_argument("--repeat", type=int, default=50, help="placements per image after the first")
+    args = ap.parse_args(argv)
+
+    w, h = map(float, args.box.lower().split("x"))
+    roots = IMAGE_ROOTS + [os.path.dirname(os.path.abspath(src)) for src in args.images]
+    for src in args.images:
+        t0 = time.perf_counter()
+        cold = ImageStore(args.cache_dir, roots)
+        source = cold.source(src)
+        if source is None:
+            print(f"{src}: not a raster image")
+            continue
+        data = cold.fitted(source, *pixels(source, box_scale(source, w, h, args.fit)))
+        t1 = time.perf_counter()
+        for _ in range(args.repeat):
+            again = cold.source(src)
+            cold.fitted(again, *pixels(again, box_scale(again, w, h, args.fit)))
+        t2 = time.perf_counter()
+        print(f"{src}: {source.width}x{source.height} {os.path.getsize(source.path) / 1024:.0f} KB"
+              f" -> {len(data) / 1024:.0f} KB; first {(t1 - t0) * 1000:.1f} ms,"
+              f" repeat {(t2 - t1) / max(args.repeat, 1) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Layout linter: overlapping and off-slide shapes in a compiled deck.
+
+    python ppt_lint.py [--spec deck_spec.json] [--margin 0] [--cell 1.0]
+    python ppt_lint.py --stress 200000          # time it on generated shapes
+
+Every op's bounding box (ppt_scene.Scene) goes into a uniform grid of
+`cell`-inch buckets per slide, so only shapes sharing a bucket are compared
+and a slide of n shapes costs about O(n) instead of O(n^2). Reported:
+
+    off-slide   a shape extends past the slide edge
+    margin      a shape reaches into the --margin band without bleeding off an edge
+    overlap     two shapes intersect without one containing the other
+    text        two text shapes overlap, even if one contains the other
+    overflow    wrapped text is taller than its box (ppt_metrics measurement)
+
+Containment is how cards work (a strip or text on a card box), so it is not
+an overlap. Edges may touch or cross by up to TOLERANCE. Exits 1 when
+anything is found.
+"""
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict, namedtuple
+
+import make_ppt
+from ppt_metrics import text_height
+from ppt_scene import EMU_PER_INCH, Scene, emu
+
+TOLERANCE = emu(0.05)
+TEXT_OPS = {"txt", "bullets", "flow_box", "title_strip"}
+
+Issue = namedtuple("Issue", "slide kind shapes message")
+
+
+def _name(scene, i):
+    item = scene.items[i]
+    text = (item.text or "").split("\n", 1)[0]
+    return f"{item.op}#{i}" + (f" {text[:30]!r}" if text else "")
+
+def _inches(v):
+    return f"{v / EMU_PER_INCH:.2f}"
+
+def _contains(a, b, tol):
+    return a[0] - tol <= b[0] and a[1] - tol <= b[1] and a[2] + tol >= b[2] and a[3] + tol >= b[3]
+
+
+def _text_height(item, box):
+    """Measured height in inches of a wrapping txt or a bullet frame; None for other ops."""
+    width = (box[2] - box[0]) / EMU_PER_INCH
+    if item.op == "txt" and item.args[9]:
+        bold = item.args[6]
+        if bold is None:
+            bold = make_ppt.STYLES[item.args[11]].get("bold")
+        return text_height(item.text, width, item.size, bool(bold))
+    if item.op == "bullets" and item.args[9]:
+        items, step, bullet, indent = item.args[0], item.args[4], item.args[7], item.args[8]
+        return make_ppt.bullets_height(items, width, step, item.size, indent if bullet else 0)
+    return None
+
+def candidate_pairs(boxes, cell):
+    """Index pairs (i < j) of boxes sharing a grid bucket of `cell` EMU.
+
+    Every intersecting pair comes out exactly once: from the bucket holding
+    the top-left corner of the intersection. Other pairs may or may not.
+    """
+    buckets = defaultdict(list)
+    for i, (l, t, r, b) in enumerate(boxes):
+        for gx in range(l // cell, max(r - 1, l) // cell + 1):
+            for gy in range(t // cell, max(b - 1, t) // cell + 1):
+                buckets[gx, gy].append(i)
+    for (gx, gy), members in buckets.items():
+        for a, i in enumerate(members):
+            li, ti = boxes[i][0], boxes[i][1]
+            for j in members[a + 1:]:
+                if (max(li, boxes[j][0]) // cell == gx
+                        and max(ti, boxes[j][1]) // cell == gy):
+                    yield i, j
+
+def lint_scene(scene, slide=1, margin=0.0, cell=1.0):
+    """Issues of one Scene."""
+    issues = []
+    width, height = emu(make_ppt.SLIDE_W), emu(make_ppt.SLIDE_H)
+    boxes = [scene.bounds(i) for i in range(len(scene))]
+    m = emu(margin)
+    for i, (l, t, r, b) in enumerate(boxes):
+        if l < -TOLERANCE or t < -TOLERANCE or r > width + TOLERANCE or b > height + TOLERANCE:
+            kind = "off-slide"
+        elif m and (l < m or t < m or r > width - m or b > height - m) and not (
+                l <= 0 or t <= 0 or r >= width or b >= height):
+            kind = "margin"     # full-bleed bands touch an edge on purpose
+        else:
+            continue
+        issues.append(Issue(slide, kind, (i,), f"{_name(scene, i)} spans {_inches(l)},{_inches(t)}"
+                                               f" to {_inches(r)},{_inches(b)} in"))
+
+    for i, item in enumerate(scene.items):
+        need = _text_height(item, boxes[i])
+        if need is not None and emu(need) > boxes[i][3] - boxes[i][1] + TOLERANCE:
+            issues.append(Issue(slide, "overflow", (i,),
+                                f"{_name(scene, i)} needs {need:.2f} in,"
+                                f" box is {_inches(boxes[i][3] - boxes[i][1])} in"))
+
+    for i, j in candidate_pairs(boxes, emu(cell)):
+        a, b = boxes[i], boxes[j]
+        ix = min(a[2], b[2]) - max(a[0], b[0])
+        iy = min(a[3], b[3]) - max(a[1], b[1])
+        if ix <= TOLERANCE or iy <= TOLERANCE:
+            continue
+        both_text = scene.items[i].op in TEXT_OPS and scene.items[j].op in TEXT_OPS
+        if both_text:
+            kind = "text"
+        elif _contains(a, b, TOLERANCE) or _contains(b, a, TOLERANCE):
+            continue
+        else:
+            kind = "overlap"
+        issues.append(Issue(slide, kind, (i, j),
+                            f"{_name(scene, i)} and {_name(scene, j)} overlap by"
+                            f" {_inches(ix)} x {_inches(iy)} in"))
+    return issues
+
+def lint_plan(plan, margin=0.0, cell=1.0):
+    """Issues of every slide in a compiled plan, slides numbered from 1."""
+    issues = []
+    for n, slide_plan in enumerate(plan, 1):
+        scene = Scene.from_ops(make_ppt.expand_ops(slide_plan["ops"]), slide_plan["bg"])
+        issues += lint_scene(scene, n, margin, cell)
+    return issues
+
+
+def stress_plan(shapes, per_slide=200, seed=0):
+    """Plan of `shapes` random small boxes, `per_slide` to a slide."""
+    rng = random.Random(seed)
+    plan = []
+    for start in range(0, shapes, per_slide):
+        ops = []
+        for _ in range(min(per_slide, shapes - start)):
+            w, h = rng.uniform(0.1, 1.0), rng.uniform(0.1, 0.4)
+            ops.append(["box", rng.uniform(0, make_ppt.SLIDE_W - w), rng.uniform(0, make_ppt.SLIDE_H - h),
+                        w, h, None, None, 0])
+        plan.append({"bg": None, "ops": ops})
+    return plan
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Report overlapping and off-slide shapes.")
+    ap.add_argument("--spec", default=make_ppt.SPEC_PATH, help="deck spec (.json, .yaml or .yml)")
+    ap.add_argument("--margin", type=float, default=0.0, help="inches kept clear at the slide edges")
+    ap.add_argument("--cell", type=float, default=1.0, help="grid bucket size in inches")
+    ap.add_argument("--stress", type=int, metavar="N", help="lint N generated shapes and report timing")
+    args = ap.parse_args(argv)
+
+    plan = (stress_plan(args.stress) if args.stress
+            else make_ppt.load_plan(make_ppt.load_spec(args.spec)))
+    t0 = time.perf_counter()
+    issues = lint_plan(plan, args.margin, args.cell)
+    elapsed = time.perf_counter() - t0
+    if args.stress:
+        print(f"{args.stress} shapes on {len(plan)} slides: {len(issues)} issues in {elapsed:.2f}s")
+        return
+    for issue in issues:
+        print(f"slide {issue.slide}: {issue.kind}: {issue.message}")
+    print(f"{len(issues)} issue(s) on {len(plan)} slides ({elapsed * 1000:.1f} ms)")
+    sys.exit(1 if issues else 0)
+
+
+if __name__ == "__main__":
+    main()
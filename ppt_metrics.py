@@ -0,0 +1,248 @@
+"""Text measurement from TrueType advance widths.
+
+    python ppt_metrics.py [--strings 100000]     # timing on generated bullets
+
+A font's advance widths are read once (straight from the hmtx/cmap tables,
+no font library needed) into a per-codepoint table in ems. Measuring a
+string is then a table lookup per word, and word widths are memoized, so
+wrapping a bullet costs a few microseconds:
+
+    m = metrics()                               # regular face; metrics(True) for bold
+    m.line_count("Long bullet text ...", 2.75, 10)      # width in inches, size in pt
+    text_height(["a", "b"], 2.75, 10)           # inches, insets included
+    fit_size(desc, 2.8, 1.05, 9)                # largest size <= 9 that fits
+
+The face is DBB_FONT / DBB_FONT_BOLD or the first of FONT_CANDIDATES found
+(ppt_thumbs draws with the same one). Without any TrueType file it falls
+back to built-in Helvetica widths. Wrapping breaks at spaces only, like the
+thumbnails; kerning is ignored.
+"""
+import argparse
+import os
+import random
+import struct
+import time
+from functools import lru_cache
+
+INSET_X, INSET_Y = 0.1, 0.05    # python-pptx text frame insets, inches
+LINE = 1.2                      # line pitch as a multiple of the font size
+
+FONT_DIRS = ("/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts"),
+             "/Library/Fonts", "/System/Library/Fonts", "C:/Windows/Fonts")
+# Regular / bold faces tried in order; DBB_FONT / DBB_FONT_BOLD take precedence.
+# The deck's theme font is Calibri (Carlito has the same metrics); the others
+# are wider, so layouts measured with them wrap a little early.
+FONT_CANDIDATES = {
+    False: ("calibri.ttf", "Calibri.ttf", "Carlito-Regular.ttf", "arial.ttf", "Arial.ttf",
+            "LiberationSans-Regular.ttf", "DejaVuSans.ttf"),
+    True: ("calibrib.ttf", "Calibri Bold.ttf", "Carlito-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf",
+           "LiberationSans-Bold.ttf", "DejaVuSans-Bold.ttf"),
+}
+
+# Helvetica AFM widths (1/1000 em) for ' ' .. '~', used when no font file is found
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584)
+
+
+# ── Fonts ─────────────────────────────────────────────────────
+@lru_cache(maxsize=None)
+def font_path(bold=False):
+    """Path of the TrueType face for regular or bold text, or None."""
+    env = os.environ.get("DBB_FONT_BOLD" if bold else "DBB_FONT")
+    if env and os.path.isfile(env):
+        return env
+    wanted = {name.lower(): rank for rank, name in enumerate(FONT_CANDIDATES[bold])}
+    best = None
+    for root_dir in FONT_DIRS:
+        for root, _, files in os.walk(root_dir):
+            for name in files:
+                rank = wanted.get(name.lower())
+                if rank is not None and (best is None or rank < best[0]):
+                    best = (rank, os.path.join(root, name))
+    return best[1] if best else None
+
+def face_id():
+    """Names of the measuring faces, e.g. for cache keys of measured layouts."""
+    return ",".join(os.path.basename(font_path(bold) or "helvetica") for bold in (False, True))
+
+def read_advances(path):
+    """{codepoint: advance in ems} from a TrueType/OpenType file's cmap and hmtx tables."""
+    with open(path, "rb") as f:
+        data = f.read()
+    count = struct.unpack_from(">H", data, 4)[0]
+    tables = {data[12 + 16*i:16 + 16*i].decode("latin-1"):
+              struct.unpack_from(">II", data, 20 + 16*i) for i in range(count)}
+    upem = struct.unpack_from(">H", data, tables["head"][0] + 18)[0]
+    n_metrics = struct.unpack_from(">H", data, tables["hhea"][0] + 34)[0]
+    hmtx = tables["hmtx"][0]
+    advances = struct.unpack_from(f">{2 * n_metrics}H", data, hmtx)[::2]   # (advance, lsb) pairs
+
+    def advance(glyph):
+        return advances[min(glyph, n_metrics - 1)] / upem
+
+    cmap = tables["cmap"][0]
+    subtables = {}
+    for i in range(struct.unpack_from(">H", data, cmap + 2)[0]):
+        platform, encoding, offset = struct.unpack_from(">HHI", data, cmap + 4 + 8*i)
+        subtables[platform, encoding] = cmap + offset
+    widths = {}
+    start = subtables.get((3, 10)) or subtables.get((0, 4))
+    if start and struct.unpack_from(">H", data, start)[0] == 12:
+        for g in range(struct.unpack_from(">I", data, start + 12)[0]):
+            first, last, glyph = struct.unpack_from(">III", data, start + 16 + 12*g)
+            for cp in range(first, last + 1):
+                widths[cp] = advance(glyph + cp - first)
+        return widths
+    start = subtables.get((3, 1)) or subtables.get((0, 3))
+    if start is None or struct.unpack_from(">H", data, start)[0] != 4:
+        raise ValueError(f"{path}: no Unicode cmap subtable")
+    segs = struct.unpack_from(">H", data, start + 6)[0] // 2
+    ends = struct.unpack_from(f">{segs}H", data, start + 14)
+    starts = struct.unpack_from(f">{segs}H", data, start + 16 + 2*segs)
+    deltas = struct.unpack_from(f">{segs}h", data, start + 16 + 4*segs)
+    range_at = start + 16 + 6*segs
+    offsets = struct.unpack_from(f">{segs}H", data, range_at)
+    for s, (first, last, delta, ro) in enumerate(zip(starts, ends, deltas, offsets)):
+        for cp in range(first, min(last, 0xFFFE) + 1):
+            if ro:
+                glyph = struct.unpack_from(">H", data, range_at + 2*s + ro + 2*(cp - first))[0]
+                glyph = (glyph + delta) & 0xFFFF if glyph else 0
+            else:
+                glyph = (cp + delta) & 0xFFFF
+            if glyph:
+                widths[cp] = advance(glyph)
+    return widths
+
+
+class FontMetrics:
+    """Advance widths of one face, in ems, with memoized word widths."""
+    __slots__ = ("widths", "default", "space", "word_em")
+
+    def __init__(self, widths):
+        self.widths = widths
+        self.default = widths.get(ord("n"), 0.55)
+        self.space = widths.get(32, 0.25)
+        self.word_em = lru_cache(maxsize=1 << 16)(self._word_em)
+
+    def _word_em(self, word):
+        get, default = self.widths.get, self.default
+        return sum([get(ord(c), default) for c in word])
+
+    def width(self, text, size):
+        """Width of `text` in inches at `size` pt, on one line."""
+        words = text.split(" ")
+        em = sum(map(self.word_em, words)) + self.space * (len(words) - 1)
+        return em * size / 72
+
+    def lines(self, text, width, size):
+        """`text` broken at spaces (and at newlines) to fit `width` inches at `size` pt."""
+        limit = width * 72 / size       # in ems
+        out = []
+        for para in text.split("\n"):
+            line, used = [], 0.0
+            for word in para.split(" "):
+                w = self.word_em(word)
+                if line and used + self.space + w > limit:
+                    out.append(" ".join(line))
+                    line, used = [word], w
+                else:
+                    used += (self.space if line else 0.0) + w
+                    line.append(word)
+            out.append(" ".join(line))
+        return out
+
+    def line_count(self, text, width, size):
+        """len(lines(...)) without building the lines."""
+        limit = width * 72 / size
+        space, word_em = self.space, self.word_em
+        count = 0
+        for para in text.split("\n"):
+            count += 1
+            used = -space
+            for w in map(word_em, para.split(" ")):
+                used += space + w
+                if used > limit and used > w:
+                    count += 1
+                    used = w
+        return count
+
+    def clip(self, text, width, size, ellipsis="…"):
+        """`text` cut to fit `width` inches on one line, ending in `ellipsis` if cut."""
+        limit = width * 72 / size
+        if self.word_em(text) <= limit:
+            return text
+        limit -= self._word_em(ellipsis)
+        get, default, used = self.widths.get, self.default, 0.0
+        for i, c in enumerate(text):
+            used += get(ord(c), default)
+            if used > limit:
+                return text[:i] + ellipsis
+        return text
+
+
+@lru_cache(maxsize=None)
+def metrics(bold=False):
+    """FontMetrics of the regular or bold face, loaded once per process."""
+    path = font_path(bold) or (font_path(False) if bold else None)
+    if path:
+        try:
+            return FontMetrics(read_advances(path))
+        except (OSError, ValueError, struct.error, KeyError):
+            pass
+    table = _HELVETICA_BOLD if bold else _HELVETICA
+    return FontMetrics({32 + i: w / 1000 for i, w in enumerate(table)})
+
+
+# ── Layout helpers ────────────────────────────────────────────
+def line_counts(texts, width, size, bold=False):
+    """Wrapped line count of each string in `texts` in a `width`-inch box (insets included)."""
+    count = metrics(bold).line_count
+    inner = width - 2*INSET_X
+    return [count(text, inner, size) for text in texts]
+
+def text_height(texts, width, size, bold=False, gap=0.0):
+    """Inches a text box needs for `texts` as paragraphs, `gap` inches after each but the last."""
+    texts = [texts] if isinstance(texts, str) else texts
+    lines = sum(line_counts(texts, width, size, bold))
+    return lines * size * LINE / 72 + gap * max(len(texts) - 1, 0) + 2*INSET_Y
+
+def fit_size(text, width, height, size, min_size=7, bold=False, step=0.5):
+    """Largest font size from `size` down to `min_size` (in `step`s) at which `text` fits the box."""
+    while size > min_size and text_height(text, width, size, bold) > height:
+        size -= step
+    return max(size, min_size)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Time text measurement on generated bullets.")
+    ap.add_argument("--strings", type=int, default=100000)
+    args = ap.parse_args(argv)
+
+    words = "course assignment submission grade student instructor dashboard upload " \
+            "deadline review announcement enrollment quiz media library progress".split()
+    rng = random.Random(0)
+    texts = [" ".join(rng.choices(words, k=rng.randint(3, 24))) for _ in range(args.strings)]
+    t0 = time.perf_counter()
+    m = metrics()
+    t1 = time.perf_counter()
+    counts = line_counts(texts, 2.75, 10)
+    t2 = time.perf_counter()
+    print(f"font: {font_path() or 'built-in Helvetica widths'} (loaded in {(t1 - t0) * 1000:.1f} ms,"
+          f" {len(m.widths)} glyphs)")
+    print(f"{len(texts)} strings, {sum(counts)} lines: {(t2 - t1) / len(texts) * 1e6:.2f} us/string")
+
+
+if __name__ == "__main__":
+    main()
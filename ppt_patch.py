@@ -0,0 +1,178 @@
+"""Patch text and fill colors of named shapes in an existing deck.
+
+    python ppt_patch.py DECK.pptx CHANGES.json [-o OUT.pptx] [--level 6]
+    python ppt_patch.py DECK.pptx --list 8          # shape names on slide 8
+
+make_ppt names every shape after the op that drew it (see emit_scene), so
+a regeneration that only changes text or colors can be a patch instead of
+a rebuild. Names are op positions: a spec change that adds or removes an
+op (an optional subtitle, a bullet, a step, or text long enough to spill
+into another card) shifts the later names, and needs a rebuild instead.
+Look names up in the deck being patched (--list), never in another
+render. CHANGES maps slide numbers (from 1) to {shape name: change}:
+
+    {"8": {"cred_card-9.password": "Pass: new-secret",
+           "box-5": {"fill": "DBEAFE"},
+           "txt-3": {"text": "Updated", "fill": "FFFFFF"}}}
+
+A string is the new text. For a shape with several paragraphs (a bullet
+frame) pass a list of strings, one per paragraph. Run formatting is kept:
+each paragraph's first run gets the text and any later runs are dropped.
+"fill" sets the shape's solid fill.
+
+Only the touched slides are parsed and rewritten. Every other zip entry is
+copied over still compressed, so patching a 1000-slide deck costs
+milliseconds. Patched slides lose their slide key, so the next incremental
+build rebuilds them instead of reusing the patched XML.
+"""
+import argparse
+import json
+import posixpath
+import sys
+import time
+import zipfile
+from io import BytesIO
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+from ppt_zip import ZipWriter
+
+_CNVPR, _P, _R, _T = qn("p:cNvPr"), qn("a:p"), qn("a:r"), qn("a:t")
+_SP_PR, _TX_BODY, _CSLD = qn("p:spPr"), qn("p:txBody"), qn("p:cSld")
+_FILLS = {qn("a:noFill"), qn("a:solidFill"), qn("a:gradFill"), qn("a:blipFill"),
+          qn("a:pattFill"), qn("a:grpFill")}
+_GEOMETRY = {qn("a:xfrm"), qn("a:custGeom"), qn("a:prstGeom")}
+_NV_GRP, _REL_ID = qn("p:nvGrpSpPr"), qn("r:id")
+
+
+def slide_parts(zf):
+    """Zip entry names of the slides, in presentation order."""
+    pres = etree.fromstring(zf.read("ppt/presentation.xml"))
+    rels = etree.fromstring(zf.read("ppt/_rels/presentation.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target") for rel in rels}
+    return [posixpath.normpath(posixpath.join("ppt", targets[sld.get(_REL_ID)]))
+            for sld in pres.iter(qn("p:sldId"))]
+
+def shapes_by_name(root):
+    """{name: shape element} of one slide's XML tree (groups left out)."""
+    return {el.get("name"): el.getparent().getparent() for el in root.iter(_CNVPR)
+            if el.getparent().tag != _NV_GRP}
+
+def _set_text(shape, value):
+    body = shape.find(_TX_BODY)
+    if body is None:
+        raise ValueError("shape has no text")
+    paras = body.findall(_P)
+    values = [value] if isinstance(value, str) else list(value)
+    if len(values) != len(paras):
+        raise ValueError(f"{len(values)} paragraph(s) given, shape has {len(paras)}")
+    for p, text in zip(paras, values):
+        runs = p.findall(_R)
+        if not runs:
+            raise ValueError("paragraph has no run to carry the text")
+        runs[0].find(_T).text = text
+        for r in runs[1:]:
+            p.remove(r)
+
+def _set_fill(shape, hex_):
+    sp_pr = shape.find(_SP_PR)
+    if sp_pr is None:
+        raise ValueError("shape has no fill")
+    fill = etree.Element(qn("a:solidFill"))
+    etree.SubElement(fill, qn("a:srgbClr"), val=hex_.lstrip("#").upper())
+    old = next((el for el in sp_pr if el.tag in _FILLS), None)
+    if old is not None:
+        sp_pr.replace(old, fill)
+    else:
+        # the fill goes after the geometry and before the outline
+        geom = [i for i, el in enumerate(sp_pr) if el.tag in _GEOMETRY]
+        sp_pr.insert(geom[-1] + 1 if geom else 0, fill)
+
+def patch_slide(xml, changes):
+    """Slide XML bytes with `changes` ({shape name: change}) applied."""
+    root = etree.fromstring(xml)
+    shapes = shapes_by_name(root)
+    for name, change in changes.items():
+        shape = shapes.get(name)
+        if shape is None:
+            raise KeyError(f"no shape named {name!r}")
+        if not isinstance(change, dict):
+            change = {"text": change}
+        try:
+            if "text" in change:
+                _set_text(shape, change["text"])
+            if "fill" in change:
+                _set_fill(shape, change["fill"])
+        except ValueError as e:
+            raise ValueError(f"{name}: {e}") from None
+    c_sld = root.find(_CSLD)
+    if c_sld is not None and "name" in c_sld.attrib:
+        del c_sld.attrib["name"]        # no longer the slide its key describes
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+def patch(src, dst, changes, level=6):
+    """Apply {slide number: {shape name: change}} to deck `src`, writing `dst`.
+
+    src and dst are paths or binary file objects. Returns the number of
+    shapes changed.
+    """
+    with zipfile.ZipFile(src) as zin:
+        parts = slide_parts(zin)
+        by_part = {}
+        for number, shapes in changes.items():
+            number = int(number)
+            if not 1 <= number <= len(parts):
+                raise IndexError(f"slide {number} out of range (deck has {len(parts)})")
+            by_part.setdefault(parts[number - 1], {}).update(shapes)
+        with ZipWriter(dst, level) as zout:
+            for info in zin.infolist():
+                if info.filename in by_part:
+                    zout.write(info.filename, patch_slide(zin.read(info), by_part[info.filename]))
+                else:
+                    zout.copy(zin, info)
+    return sum(len(shapes) for shapes in by_part.values())
+
+def patch_bytes(data, changes, level=6):
+    out = BytesIO()
+    patch(BytesIO(data), out, changes, level)
+    return out.getvalue()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Patch text and fills of named shapes in a deck.")
+    ap.add_argument("deck")
+    ap.add_argument("changes", nargs="?", help="JSON file of {slide: {shape name: change}}")
+    ap.add_argument("-o", "--out", help="output path (default: patch the deck in place)")
+    ap.add_argument("--level", type=int, default=6, choices=range(10),
+                    help="deflate level of rewritten slides (default 6)")
+    ap.add_argument("--list", type=int, metavar="SLIDE", help="print the shape names on a slide")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        with zipfile.ZipFile(args.deck) as zf:
+            root = etree.fromstring(zf.read(slide_parts(zf)[args.list - 1]))
+        for name, shape in shapes_by_name(root).items():
+            text = "".join(t.text or "" for t in shape.iter(_T))
+            print(f"{name:<28} {text[:60]!r}" if text else name)
+        return
+    if not args.changes:
+        ap.error("CHANGES.json is required unless --list is given")
+    with open(args.changes, encoding="utf-8") as f:
+        changes = json.load(f)
+    with open(args.deck, "rb") as f:
+        data = f.read()
+    t0 = time.perf_counter()
+    try:
+        out = patch_bytes(data, changes, args.level)
+    except (KeyError, IndexError, ValueError) as e:
+        sys.exit(f"patch failed: {e.args[0] if e.args else e}")
+    elapsed = time.perf_counter() - t0
+    with open(args.out or args.deck, "wb") as f:
+        f.write(out)
+    print(f"Patched {sum(map(len, changes.values()))} shape(s) in {elapsed * 1000:.1f} ms:"
+          f" {args.out or args.deck}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Array-backed scene graph of a compiled slide plan.
+
+A Scene holds one row per plan op: the geometry as parallel arrays of EMU
+integers (l, t, w, h) and everything else in a small __slots__ Item (op
+name, text, font size, the remaining helper arguments). Bulk geometry work
+(bounds, translation, overlap checks) runs over the arrays, with NumPy
+when it is installed and plain array('q') otherwise, and calls() replays the
+scene through the make_ppt helpers in one pass.
+
+    scene = Scene.from_plan(slide_plan)
+    right, bottom = scene.extents()
+
+grid() places card layouts in bulk for SlidePlan layouts.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EMU_PER_INCH = 914400
+
+# op -> index of its `l` argument; l, t, w, h follow (bullets: l, t, w, step)
+GEOMETRY = {
+    "box": 0,
+    "txt": 1,
+    "title_strip": 1,
+    "flow_box": 1,
+    "arrow": 0,
+    "chart": 3,
+    "bullets": 1,
+    "stamp": 1,         # a make_ppt component; w, h are its bounds
+    "image": 1,
+}
+# op -> (index of its font size argument, default size); None: not a text op
+TEXT_SIZE = {
+    "txt": (5, None),
+    "title_strip": (6, 13),
+    "flow_box": (None, 11),
+    "bullets": (5, 12),
+    "chart": (7, 11),
+}
+
+
+def emu(inches):
+    """EMU integer for a length in inches, truncated like pptx.util.Inches."""
+    return int(inches * EMU_PER_INCH)
+
+def _ints(values):
+    return np.array(values, dtype=np.int64) if np is not None else array("q", values)
+
+def grid(n, cols, w, h, gap_x=0.0, gap_y=0.0, x0=0.0, y0=0.0):
+    """(left, top) in inches of n cells of w x h filled row by row, `cols` per row."""
+    if np is not None:
+        idx = np.arange(n)
+        lefts = x0 + (idx % cols) * (w + gap_x)
+        tops = y0 + (idx // cols) * (h + gap_y)
+        return list(zip(lefts.tolist(), tops.tolist()))
+    return [(x0 + (i % cols)*(w + gap_x), y0 + (i // cols)*(h + gap_y)) for i in range(n)]
+
+
+class Item:
+    """Non-geometry part of one op."""
+    __slots__ = ("op", "text", "size", "args")
+
+    def __init__(self, op, text, size, args):
+        self.op = op
+        self.text = text
+        self.size = size
+        self.args = args
+
+    def __repr__(self):
+        return f"Item({self.op!r}, {self.text!r})"
+
+
+def _text(op, args):
+    if op == "bullets":
+        return "\n".join(item if isinstance(item, str) else "".join(r[0] for r in item)
+                         for item in args[0])
+    if op in ("txt", "title_strip", "flow_box"):
+        return args[0]
+    if op == "chart":
+        return " ".join(map(str, args[1]))
+    return None
+
+def _bullets_height(args):
+    items, _, _, width, step, size, _, bullet, indent, frame = args[:10]
+    if not frame:
+        return step * len(items)
+    import make_ppt         # a frame is as tall as its measured, wrapped text
+    return make_ppt.bullets_height(items, width, step, size, indent if bullet else 0)
+
+def _size(op, args):
+    if op not in TEXT_SIZE:
+        return None
+    pos, default = TEXT_SIZE[op]
+    size = args[pos] if pos is not None else None
+    if size is None and op == "txt":
+        import make_ppt     # txt falls back to its run style's size
+        size = make_ppt.STYLES[args[11]]["size"]
+    return size if size is not None else default
+
+
+class Scene:
+    """Ops of one slide: geometry in EMU arrays, the rest in Items."""
+    __slots__ = ("background", "items", "l", "t", "w", "h")
+
+    def __init__(self, background, items, l, t, w, h):
+        self.background = background
+        self.items = items
+        self.l, self.t, self.w, self.h = _ints(l), _ints(t), _ints(w), _ints(h)
+
+    @classmethod
+    def from_plan(cls, slide_plan):
+        return cls.from_ops(slide_plan["ops"], slide_plan.get("bg"))
+
+    @classmethod
+    def from_ops(cls, ops, background=None):
+        items, l, t, w, h = [], [], [], [], []
+        for op, *args in ops:
+            i = GEOMETRY[op]
+            x, y, width, height = args[i:i+4]
+            if op == "bullets":
+                height = _bullets_height(args)
+            l.append(emu(x)); t.append(emu(y)); w.append(emu(width)); h.append(emu(height))
+            items.append(Item(op, _text(op, args), _size(op, args), args))
+        return cls(background, items, l, t, w, h)
+
+    def __len__(self):
+        return len(self.items)
+
+    def extents(self):
+        """(right, bottom) EMU arrays."""
+        if np is not None:
+            return self.l + self.w, self.t + self.h
+        return (array("q", map(sum, zip(self.l, self.w))),
+                array("q", map(sum, zip(self.t, self.h))))
+
+    def bounds(self, i):
+        """(l, t, r, b) in EMU of op i."""
+        l, t = int(self.l[i]), int(self.t[i])
+        return l, t, l + int(self.w[i]), t + int(self.h[i])
+
+    def translate(self, dx=0, dy=0, index=None):
+        """Move every op (or the ops in `index`) by dx, dy EMU."""
+        if np is not None and index is None:
+            self.l += dx
+            self.t += dy
+            return
+        for i in (range(len(self)) if index is None else index):
+            self.l[i] += dx
+            self.t[i] += dy
+
+    def calls(self, length=int):
+        """(op, helper args) per op, with geometry as length(EMU) and all else unchanged.
+
+        make_ppt passes pptx.util.Emu, which its helpers take in place of inches.
+        """
+        for i, item in enumerate(self.items):
+            args = list(item.args)
+            pos = GEOMETRY[item.op]
+            # bullets keep their step in inches; their height is derived
+            n = 3 if item.op == "bullets" else 4
+            args[pos:pos+n] = (length(int(a[i])) for a in (self.l, self.t, self.w, self.h)[:n])
+            yield item.op, args
+
+    def to_ops(self):
+        """Plan ops back in inches, e.g. after translate()."""
+        return [[op, *args] for op, args in self.calls(lambda v: v / EMU_PER_INCH)]
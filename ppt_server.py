@@ -0,0 +1,303 @@
+"""Asyncio HTTP front for the deck builder.
+
+    python ppt_server.py [--port 8765] [--db URL | --demo N] [--workers N]
+                         [--cache-mb 256] [--data-ttl 60]
+
+Endpoints (all return .pptx bytes unless noted):
+
+    GET  /decks/course/<id>     course report (ppt_batch.ReportData.course_spec)
+    GET  /decks/student/<id>    student report
+    GET  /decks/analytics       analytics charts (ppt_charts.analytics_slides)
+    POST /render                body: a deck spec as JSON
+    GET  /health                JSON counters
+
+Renders run in a process pool of warm workers. Every deck is keyed by
+make_ppt.spec_hash(spec), plus the content hashes of the images it uses
+(ppt_images.sources_digest): finished bytes go into a size-bounded LRU cache,
+and identical requests that arrive while a render is running wait on that
+render instead of starting their own, so a burst of downloads of the same
+deck costs one render. The key doubles as the ETag. Report data is read in
+a background thread and reused for --data-ttl seconds.
+
+Only the standard library is used; the HTTP handling covers what the Node
+backend and browsers send (HTTP/1.1, Content-Length bodies, keep-alive).
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import make_ppt
+import ppt_charts
+import ppt_data
+import ppt_images
+from ppt_batch import ReportData
+
+PPTX_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+MAX_BODY = 10 * 1024 * 1024     # same limit as the backend's express.json()
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ── Caching ───────────────────────────────────────────────────
+class LRUBytes:
+    """Byte strings by key, evicting least recently used entries past `max_bytes`."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key):
+        data = self._items.get(key)
+        if data is not None:
+            self._items.move_to_end(key)
+        return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        old = self._items.pop(key, None)
+        if old is not None:
+            self.size -= len(old)
+        self._items[key] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._items.popitem(last=False)
+            self.size -= len(evicted)
+
+class RenderService:
+    """Coalescing, caching front for make_ppt.render_bytes in a process pool."""
+
+    def __init__(self, pool, cache_bytes):
+        self.pool = pool
+        self.cache = LRUBytes(cache_bytes)
+        self.stats = Counter()
+        self._inflight = {}
+
+    async def render(self, spec):
+        """(spec hash, pptx bytes) for `spec`."""
+        key = make_ppt.spec_hash(spec)
+        # stats, and on a cold cache reads and hashes, files: off the event loop
+        images = await asyncio.get_running_loop().run_in_executor(
+            None, ppt_images.sources_digest, spec)
+        if images:
+            # a replaced upload keeps its URL; its bytes must change the key
+            key = hashlib.sha256((key + images).encode()).hexdigest()
+        data = self.cache.get(key)
+        if data is not None:
+            self.stats["cache_hits"] += 1
+            return key, data
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render(key, spec))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.stats["coalesced"] += 1
+        # shield: a client hanging up must not cancel a render others wait on
+        return key, await asyncio.shield(task)
+
+    async def _render(self, key, spec):
+        loop = asyncio.get_running_loop()
+        self.stats["renders"] += 1
+        data = await loop.run_in_executor(self.pool, make_ppt.render_bytes, spec)
+        self.cache.put(key, data)
+        return data
+
+class ReportSource:
+    """ReportData plus the analytics slides, reloaded when older than `ttl` seconds."""
+
+    def __init__(self, connect, ttl=60):
+        self.connect = connect
+        self.ttl = ttl
+        self._snapshot = None
+        self._loaded = 0.0
+        self._lock = asyncio.Lock()
+
+    def _load(self):
+        conn = self.connect()
+        try:
+            return ReportData(conn), ppt_charts.analytics_slides(conn)
+        finally:
+            conn.close()
+
+    async def get(self):
+        async with self._lock:
+            if self._snapshot is None or time.monotonic() - self._loaded > self.ttl:
+                loop = asyncio.get_running_loop()
+                self._snapshot = await loop.run_in_executor(None, self._load)
+                self._loaded = time.monotonic()
+            return self._snapshot
+
+
+# ── Routes ────────────────────────────────────────────────────
+class DeckApp:
+    def __init__(self, service, source):
+        self.service = service
+        self.source = source
+
+    async def spec_for(self, method, parts, body):
+        if parts == ["render"]:
+            if method != "POST":
+                raise HTTPError(405, "POST a deck spec to /render")
+            try:
+                spec = json.loads(body)
+            except ValueError as e:
+                raise HTTPError(400, f"invalid JSON: {e}") from None
+            if not isinstance(spec, dict) or not isinstance(spec.get("slides"), list):
+                raise HTTPError(400, 'a deck spec needs a "slides" list')
+            for i, slide in enumerate(spec["slides"], 1):
+                if not isinstance(slide, dict) or slide.get("layout") not in make_ppt.LAYOUTS:
+                    raise HTTPError(400, f'slide {i}: "layout" must be one of '
+                                         + ", ".join(sorted(make_ppt.LAYOUTS)))
+            return spec, "deck"
+        if method != "GET" or not parts or parts[0] != "decks":
+            raise HTTPError(404, "not found")
+
+        data, analytics = await self.source.get()
+        if parts[1:] == ["analytics"]:
+            return {"slides": analytics}, "analytics"
+        if len(parts) == 3 and parts[2].isdigit():
+            kind, ident = parts[1], int(parts[2])
+            if kind == "course":
+                for course in data.courses:
+                    if course[0] == ident:
+                        return data.course_spec(course), f"course-{ident}"
+            elif kind == "student":
+                user = data.users.get(ident)
+                if user and user[2] == "Student":
+                    return data.student_spec(ident), f"student-{ident}"
+            raise HTTPError(404, f"no {kind} {ident}")
+        raise HTTPError(404, "not found")
+
+    async def handle(self, method, path, headers, body):
+        """(status, headers, body) for one request."""
+        parts = [p for p in path.split("?", 1)[0].split("/") if p]
+        if parts == ["health"]:
+            stats = dict(self.service.stats, cached=len(self.service.cache),
+                         cache_bytes=self.service.cache.size)
+            return 200, {"Content-Type": "application/json"}, json.dumps(stats).encode()
+
+        spec, name = await self.spec_for(method, parts, body)
+        key, data = await self.service.render(spec)
+        etag = f'"{key[:32]}"'
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"Content-Type": PPTX_TYPE, "ETag": etag,
+                     "Content-Disposition": f'attachment; filename="{name}.pptx"'}, data
+
+
+# ── HTTP ──────────────────────────────────────────────────────
+async def _read_request(reader):
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPError(400, "bad Content-Length") from None
+    if length < 0:
+        raise HTTPError(400, "bad Content-Length")
+    if length > MAX_BODY:
+        raise HTTPError(413, "request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target, headers, body
+
+def _response(status, headers, body, keep_alive):
+    head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    head += [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+def _error(status, message):
+    return status, {"Content-Type": "application/json"}, json.dumps({"error": message}).encode()
+
+async def serve_connection(app, reader, writer):
+    try:
+        while True:
+            keep_alive = False
+            try:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, out_headers, out = await app.handle(method, target, headers, body)
+            except HTTPError as e:
+                status, out_headers, out = _error(e.status, str(e))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            except Exception as e:
+                status, out_headers, out = _error(500, f"{type(e).__name__}: {e}")
+            writer.write(_response(status, out_headers, out, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(args):
+    if args.demo:
+        connect = lambda: ppt_data.sqlite_standin(students=args.demo,
+                                                  courses=max(4, args.demo // 100))
+    else:
+        connect = lambda: ppt_data.connect(args.db)
+    workers = args.workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers, initializer=make_ppt.warm_up) as pool:
+        app = DeckApp(RenderService(pool, args.cache_mb * 1024 * 1024),
+                      ReportSource(connect, args.data_ttl))
+        server = await asyncio.start_server(
+            lambda r, w: serve_connection(app, r, w), args.host, args.port)
+        print(f"Serving decks on http://{args.host}:{args.port} with {workers} workers")
+        async with server:
+            await server.serve_forever()
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="HTTP render endpoint for LMS decks.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=int(os.environ.get("DECK_PORT", 8765)))
+    ap.add_argument("--db", help="database URL (default: DATABASE_URL / DB_* like the backend)")
+    ap.add_argument("--demo", type=int, metavar="N",
+                    help="use an in-memory SQLite stand-in with N generated students")
+    ap.add_argument("--workers", type=int, help="render processes (default: CPU count)")
+    ap.add_argument("--cache-mb", type=int, default=256, help="size bound of the deck cache")
+    ap.add_argument("--data-ttl", type=float, default=60,
+                    help="seconds before report data is read again")
+    args = ap.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Constant-memory deck writer for very large decks.
+
+python-pptx keeps every slide's XML tree alive until prs.save(). StreamingDeck
+instead builds each slide in a scratch presentation with the usual helpers,
+writes its part straight into the output zip and drops it again, so memory
+stays flat however many slides the deck has:
+
+    with StreamingDeck("roster.pptx") as deck:
+        for student in students:
+            with deck.slide() as s:
+                header_bar(s, student.name, student.email)
+                txt(s, ...)
+
+Plans from make_ppt.load_plan() go through add() / write_plan(). The slide
+list in presentation.xml, its relationships and the content types are
+generated from the slide count when the deck is closed.
+"""
+import re
+import zipfile
+from contextlib import contextmanager
+from io import BytesIO
+
+import make_ppt
+from ppt_zip import ZipWriter
+
+_RT_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+_CT_SLIDE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
+_PRESENTATION = "ppt/presentation.xml"
+_PRESENTATION_RELS = "ppt/_rels/presentation.xml.rels"
+_CONTENT_TYPES = "[Content_Types].xml"
+_FIRST_SLIDE_ID = 256
+_CHUNK = 1000   # slide entries per generated XML chunk
+
+
+class StreamingDeck:
+    """Write a deck slide by slide to `file` (a path or binary file object)."""
+
+    def __init__(self, file, level=6):
+        buf = BytesIO()
+        make_ppt.new_presentation().save(buf)
+        self._zip = ZipWriter(file, level)
+        self._scratch = make_ppt.new_presentation()
+        self._count = 0
+        with zipfile.ZipFile(buf) as base:
+            self._tail = {name: base.read(name) for name in
+                          (_PRESENTATION, _PRESENTATION_RELS, _CONTENT_TYPES)}
+            for info in base.infolist():
+                if info.filename not in self._tail:
+                    self._zip.write(info.filename, base.read(info))
+        ids = re.findall(rb'Id="rId(\d+)"', self._tail[_PRESENTATION_RELS])
+        self._rid_base = max(int(i) for i in ids)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self._zip.close()
+
+    def __len__(self):
+        return self._count
+
+    def new_slide(self):
+        """Blank slide in the scratch presentation; pass it to finish() when done."""
+        return make_ppt.blank_slide(self._scratch)
+
+    def finish(self, slide):
+        """Write `slide` to the output and release it."""
+        part = slide.part
+        if len(part.rels) != 1:
+            # Pictures, charts etc. would need their parts carried along.
+            raise ValueError("streamed slides may only reference their layout")
+        self._count += 1
+        n = self._count
+        self._zip.write(f"ppt/slides/slide{n}.xml", part.blob)
+        self._zip.write(f"ppt/slides/_rels/slide{n}.xml.rels", part.rels.xml)
+
+        prs = self._scratch
+        sld_id = prs.slides._sldIdLst[-1]
+        prs.slides._sldIdLst.remove(sld_id)
+        prs.part.drop_rel(sld_id.rId)
+
+    @contextmanager
+    def slide(self, bg=None):
+        """Context manager yielding a blank slide that is written on exit."""
+        s = self.new_slide()
+        if bg:
+            make_ppt.bg(s, bg)
+        yield s
+        self.finish(s)
+
+    def add(self, slide_plan):
+        """Emit one compiled slide plan (see make_ppt.compile_slide)."""
+        self.finish(make_ppt.emit_slide(self._scratch, slide_plan))
+
+    def write_plan(self, plan):
+        for slide_plan in plan:
+            self.add(slide_plan)
+
+    # ── Package tail ──────────────────────────────────────────
+    def _slide_entries(self, template):
+        for start in range(1, self._count + 1, _CHUNK):
+            stop = min(start + _CHUNK, self._count + 1)
+            yield "".join(template(i) for i in range(start, stop)).encode()
+
+    def _spliced(self, name, marker, template, wrap=(b"", b"")):
+        xml = self._tail[name]
+        at = xml.index(marker)
+        yield xml[:at] + wrap[0]
+        yield from self._slide_entries(template)
+        yield wrap[1] + xml[at:]
+
+    def close(self):
+        rid = self._rid_base
+        if self._count:
+            self._zip.write_iter(_PRESENTATION, self._spliced(
+                _PRESENTATION, b"<p:sldSz",
+                lambda i: f'<p:sldId id="{_FIRST_SLIDE_ID + i - 1}" r:id="rId{rid + i}"/>',
+                (b"<p:sldIdLst>", b"</p:sldIdLst>")))
+        else:
+            self._zip.write(_PRESENTATION, self._tail[_PRESENTATION])
+        self._zip.write_iter(_PRESENTATION_RELS, self._spliced(
+            _PRESENTATION_RELS, b"</Relationships>",
+            lambda i: f'<Relationship Id="rId{rid + i}" Type="{_RT_SLIDE}" Target="slides/slide{i}.xml"/>'))
+        self._zip.write_iter(_CONTENT_TYPES, self._spliced(
+            _CONTENT_TYPES, b"</Types>",
+            lambda i: f'<Override PartName="/ppt/slides/slide{i}.xml" ContentType="{_CT_SLIDE}"/>'))
+        self._zip.close()
+
+
+def render_streaming(spec, file, cache_dir=None, level=6):
+    """Like make_ppt.render_bytes(), but streamed to `file`; returns the slide count."""
+    with StreamingDeck(file, level) as deck:
+        deck.write_plan(make_ppt.load_plan(spec, cache_dir))
+    return len(deck)
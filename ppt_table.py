@@ -0,0 +1,132 @@
+"""Auto-paginating table slides fed by a row iterator.
+
+    python ppt_table.py OUT.pptx [--table users|submissions] [--db URL | --demo N]
+
+add_table() draws rows (any iterable, e.g. ppt_data.rows() over a cursor)
+as native tables under a header_bar, one page at a time: each slide takes
+as many rows as fit between the header bar and the bottom margin, and the
+next page starts on a new slide with the column headings repeated. Rows are
+pulled from the iterator one page at a time, so a large export never holds
+more than a slide's worth of them. The target is a Presentation or a
+ppt_stream.StreamingDeck; with the latter each page is written out as soon
+as it is full.
+"""
+import argparse
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from pptx.util import Inches
+
+import make_ppt
+import ppt_data
+import ppt_stream
+from ppt_metrics import INSET_X, metrics
+from make_ppt import BLACK, NAVY, SLIDE_H, SLIDE_W, WHITE
+
+HEADER_H = 1.1      # height of make_ppt.header_bar
+MARGIN = 0.4
+ROW_H = 0.32
+
+# name -> (title, query, [(heading, width in inches)])
+TABLES = {
+    "users": ("User Management",
+              "SELECT id, name, email, role FROM users ORDER BY id",
+              [("ID", 0.9), ("Name", 3.6), ("Email", 5.0), ("Role", 2.8)]),
+    "submissions": ("Assignments",
+                    "SELECT student_name, assignment_title, course_name, score, status"
+                    " FROM submissions ORDER BY id",
+                    [("Student", 3.0), ("Assignment", 3.2), ("Course", 2.9),
+                     ("Score", 1.4), ("Status", 1.8)]),
+}
+
+
+def rows_per_slide(row_h=ROW_H):
+    """Body rows that fit under the header bar, below the repeated heading row."""
+    budget = SLIDE_H - HEADER_H - 2*MARGIN
+    return int(budget / row_h + 1e-9) - 1
+
+def _clip(text, width, size):
+    # One line inside the cell's 0.1in left/right margins.
+    return metrics().clip(text, width - 2*INSET_X, size)
+
+@contextmanager
+def _page(target):
+    if hasattr(target, "slide"):        # StreamingDeck
+        with target.slide() as s:
+            yield s
+    else:
+        yield make_ppt.blank_slide(target)
+
+def table_page(slide, columns, page, top, row_h=ROW_H, size=11):
+    """Native table of `page` rows with a heading row; returns the shape."""
+    width = sum(w for _, w in columns)
+    frame = slide.shapes.add_table(len(page) + 1, len(columns), Inches((SLIDE_W - width) / 2),
+                                   Inches(top), Inches(width), Inches(row_h * (len(page) + 1)))
+    table = frame.table
+    for c, (_, w) in enumerate(columns):
+        table.columns[c].width = Inches(w)
+
+    # Walk rows and cells once; table.cell(r, c) rescans the row list per call.
+    table_rows = iter(table.rows)
+    head = make_ppt.run_style("text", size, True, None, WHITE)
+    for cell, (heading, _) in zip(next(table_rows).cells, columns):
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = NAVY
+        make_ppt.add_run(cell.text_frame.paragraphs[0], heading, head)
+
+    body = make_ppt.run_style("text", size, None, None, BLACK)
+    for table_row, row in zip(table_rows, page):
+        for cell, value, (_, w) in zip(table_row.cells, row, columns):
+            text = "" if value is None else str(value)
+            make_ppt.add_run(cell.text_frame.paragraphs[0], _clip(text, w, size), body)
+    return frame
+
+def add_table(target, title, columns, rows, subtitle=None, row_h=ROW_H, size=11):
+    """Lay `rows` out over as many table slides as needed; returns (slides, rows)."""
+    per_slide = rows_per_slide(row_h)
+    top = HEADER_H + MARGIN
+    rows = iter(rows)
+    slides = done = 0
+    while True:
+        page = list(islice(rows, per_slide))
+        if not page and slides:
+            break
+        with _page(target) as s:
+            span = f"rows {done + 1}-{done + len(page)}" if page else "no rows"
+            make_ppt.header_bar(s, title if not slides else f"{title} (cont.)",
+                                f"{subtitle}  |  {span}" if subtitle else span)
+            table_page(s, columns, page, top, row_h, size)
+        slides += 1
+        done += len(page)
+        if len(page) < per_slide:
+            break
+    return slides, done
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Export an LMS table as paginated table slides.")
+    ap.add_argument("out")
+    ap.add_argument("--table", choices=sorted(TABLES), default="users")
+    ap.add_argument("--db", help="database URL (default: DATABASE_URL / DB_* like the backend)")
+    ap.add_argument("--demo", type=int, metavar="N",
+                    help="use an in-memory SQLite stand-in with N generated students")
+    args = ap.parse_args(argv)
+
+    if args.demo:
+        conn = ppt_data.sqlite_standin(students=args.demo, courses=max(4, args.demo // 100))
+    else:
+        conn = ppt_data.connect(args.db)
+    title, sql, columns = TABLES[args.table]
+    t0 = time.perf_counter()
+    try:
+        with ppt_stream.StreamingDeck(args.out) as deck:
+            slides, count = add_table(deck, title, columns, ppt_data.rows(conn, sql),
+                                      subtitle=f"{args.table} table")
+    finally:
+        conn.close()
+    print(f"Saved: {args.out}  ({count} rows on {slides} slides, {time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
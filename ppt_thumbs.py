@@ -0,0 +1,294 @@
+"""Slide thumbnails drawn with Pillow straight from the layout plan.
+
+    python ppt_thumbs.py OUT_DIR [--spec deck_spec.json] [--width 480]
+                         [--format png|webp] [--workers N]
+
+The deck is built from a handful of primitives (box, txt, title_strip,
+bullets, flow_box, arrow, chart, image and the slide background), so previews
+don't need an office suite: each op of a compiled slide plan is drawn with
+the same geometry and run styles make_ppt gives it. Fonts come from
+ppt_metrics, which also does the line breaking, so thumbnails wrap where
+layout measurement says text wraps. --workers spreads the slides over
+processes. Pillow is only needed here.
+
+Text placement follows python-pptx's defaults: 0.1in/0.05in insets,
+textboxes anchored at the top and shape text centred vertically.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = None
+
+import make_ppt
+import ppt_images
+from ppt_metrics import INSET_X, INSET_Y, LINE, font_path, metrics
+
+
+def _require_pillow():
+    if Image is None:
+        raise RuntimeError("Pillow is required to render thumbnails")
+
+@lru_cache(maxsize=None)
+def _font(px, bold):
+    path = font_path(bold) or font_path(False)
+    return ImageFont.truetype(path, px) if path else ImageFont.load_default(px)
+
+def _fake_bold(bold):
+    # Without a bold face, thicken the regular one.
+    return 1 if bold and not font_path(True) else 0
+
+@lru_cache(maxsize=65536)
+def _width(px, bold, text):
+    return _font(px, bold).getlength(text)
+
+@lru_cache(maxsize=256)
+def _picture(source, px, crop, size):
+    # The deck's fitted copy, cropped like the picture shape and scaled to `size` px.
+    store = ppt_images.store()
+    if px is None:
+        px = tuple(ppt_images.pixels(source, 1.0))
+    im = Image.open(BytesIO(store.fitted(source, *px))).convert("RGBA")
+    w, h = im.size
+    cl, ct, cr, cb = crop
+    im = im.crop((round(cl*w), round(ct*h), round(w - cr*w), round(h - cb*h)))
+    return im.resize(size, Image.LANCZOS, reducing_gap=2.0)
+
+def _rgb(value):
+    return tuple(make_ppt.color(value)) if value is not None else None
+
+
+class ThumbCanvas:
+    """One slide image; methods mirror the plan ops (args after `slide`)."""
+
+    def __init__(self, width):
+        self.scale = width / make_ppt.SLIDE_W
+        self.size = (width, round(make_ppt.SLIDE_H * self.scale))
+        self.im = Image.new("RGB", self.size, (255, 255, 255))
+        self.draw = ImageDraw.Draw(self.im)
+
+    def px(self, inches):
+        return round(inches * self.scale)
+
+    def rect(self, l, t, w, h):
+        return (self.px(l), self.px(t), self.px(l + w) - 1, self.px(t + h) - 1)
+
+    # ── Text ──────────────────────────────────────────────────
+    def _font_px(self, size):
+        return max(round(size / 72 * self.scale), 4)
+
+    def wrap(self, text, px, bold, width):
+        """Lines of `text` broken at spaces to fit `width` pixels."""
+        return metrics(bold).lines(text, width / self.scale, px * 72 / self.scale)
+
+    def text_lines(self, lines, x, y, w, fmt, align=1):
+        """Draw pre-wrapped lines from (x, y) px; returns the y below them."""
+        px = self._font_px(fmt["size"])
+        bold = bool(fmt.get("bold"))
+        fill = _rgb(fmt["color"])
+        pitch = px * LINE
+        for line in lines:
+            lx = x
+            if align in (2, 3):
+                slack = w - _width(px, bold, line)
+                lx = x + (slack / 2 if align == 2 else slack)
+            self.draw.text((lx, y), line, font=_font(px, bold), fill=fill,
+                           stroke_width=_fake_bold(bold), stroke_fill=fill)
+            y += pitch
+        return y
+
+    def run_lines(self, lines, texts, runs, x, y, w, fmt, color):
+        """Draw wrapped `lines` of the joined run `texts`, each piece in its run's format."""
+        px = self._font_px(fmt["size"])
+        full = "".join(texts)
+        ends, end = [], 0
+        for text in texts:
+            end += len(text)
+            ends.append(end)
+        pos = 0
+        for line in lines:
+            start = full.find(line, pos)
+            pos = start + len(line)
+            rx, run_start = x, 0
+            for run_end, (_, bold, run_color) in zip(ends, runs):
+                piece = full[max(start, run_start):min(pos, run_end)]
+                run_start = run_end
+                if piece:
+                    self.text_lines([piece], rx, y, w, dict(fmt, bold=bold, color=run_color or color))
+                    rx += _width(px, bool(bold), piece)
+            y += px * LINE
+        return y
+
+    def text(self, text, l, t, w, h, fmt, align=1, wrap=True, middle=False):
+        x, width = self.px(l + INSET_X), self.px(w - 2*INSET_X)
+        px = self._font_px(fmt["size"])
+        bold = bool(fmt.get("bold"))
+        lines = self.wrap(text, px, bold, width) if wrap else text.split("\n")
+        y = self.px(t + INSET_Y)
+        if middle:
+            y = self.px(t + h/2) - len(lines) * px * LINE / 2
+        self.text_lines(lines, x, y, width, fmt, align)
+
+    # ── Ops ───────────────────────────────────────────────────
+    def bg(self, color_):
+        self.draw.rectangle((0, 0) + self.size, fill=_rgb(color_))
+
+    def box(self, l, t, w, h, fill_color=None, border_color=None, border_pt=0):
+        outline = _rgb(border_color) if border_color and border_pt else None
+        width = max(1, round(border_pt / 72 * self.scale)) if outline else 0
+        self.draw.rectangle(self.rect(l, t, w, h), fill=_rgb(fill_color), outline=outline, width=width)
+
+    def txt(self, text, l, t, w, h, size=None, bold=None, color=None, align=1,
+            wrap=True, italic=None, style="text"):
+        self.text(text, l, t, w, h, make_ppt.run_format(style, size, bold, italic, color),
+                  align, wrap)
+
+    def title_strip(self, title, l, t, w, h, color, size=13):
+        self.box(l, t, w, h, color, color, 0)
+        self.text(title, l, t, w, h, make_ppt.run_format("strip-title", size=size), 2, middle=True)
+
+    def flow_box(self, label, l, t, w=1.7, h=0.55, fill=make_ppt.LBLUE, border=make_ppt.BLUE,
+                 tcolor=make_ppt.NAVY):
+        self.box(l, t, w, h, fill, border, 1.5)
+        self.text(label, l, t, w, h, make_ppt.run_format("flow-label", color=tcolor), 2, middle=True)
+
+    def arrow(self, l, t, w=0.4, h=0.04):
+        self.box(l, t, w, h, make_ppt.BLUE)
+
+    def bullets(self, items, l, t, w, step, size=12, color=make_ppt.BLACK,
+                bullet="-", indent=0.2, frame=True):
+        fmt = make_ppt.run_format("bullet", size=size, color=color)
+        px = self._font_px(size)
+        x = self.px(l + INSET_X)
+        text_x = x + (self.px(indent) if frame and bullet else 0)
+        width = self.px(l + w - INSET_X) - text_x
+        y = self.px(t + INSET_Y)
+        for item in items:
+            runs = [(item, False, color)] if isinstance(item, str) else item
+            if frame and bullet:
+                self.text_lines([bullet], x, y, width, fmt)
+            prefix = "" if frame or not bullet else bullet + " "
+            if len(runs) == 1:
+                text, bold, run_color = runs[0]
+                run_fmt = dict(fmt, bold=bold, color=run_color or color)
+                lines = self.wrap(prefix + text, px, bool(bold), width)
+                self.text_lines(lines, text_x, y, width, run_fmt)
+            else:
+                texts = [(prefix if i == 0 else "") + run[0] for i, run in enumerate(runs)]
+                lines = self.wrap("".join(texts), px, False, width)
+                self.run_lines(lines, texts, runs, text_x, y, width, fmt, color)
+            # Later lines of a wrapped item push the rest down, as in the text frame.
+            y += self.px(step) + (len(lines) - 1) * px * LINE if frame else self.px(step)
+
+    def stamp(self, component, l, t, w, h, params):
+        for name, *args in make_ppt.COMPONENTS[component].ops(params, l, t):
+            getattr(self, name)(*args)
+
+    def image(self, src, l, t, w, h, fit="contain", px=None):
+        source = ppt_images.store().source(src)
+        if source is None:
+            return self.box(l, t, w, h, make_ppt.GREY, "DDE6F0", 1)
+        dx, dy, pw, ph, crop = ppt_images.placement(source, w, h, fit)
+        x0, y0, x1, y1 = self.rect(l + dx, t + dy, pw, ph)
+        pic = _picture(source, tuple(px) if px else None, crop, (x1 - x0 + 1, y1 - y0 + 1))
+        self.im.paste(pic, (x0, y0), pic)
+
+    def chart(self, kind, categories, series, l, t, w, h, size=11):
+        x0, y0, x1, y1 = self.rect(l + 0.3, t + 0.3, w - 0.6, h - 0.6)
+        if kind in ("pie", "doughnut"):
+            values = series[0][1]
+            total = sum(values) or 1
+            d = min(x1 - x0, y1 - y0)
+            cx = x0 + (x1 - x0 - d) // 2
+            box_ = (cx, y0, cx + d, y0 + d)
+            start = -90.0
+            for i, v in enumerate(values):
+                end = start + 360.0 * v / total
+                self.draw.pieslice(box_, start, end, fill=_rgb(make_ppt.POINT_COLORS[i % 6]))
+                start = end
+            if kind == "doughnut":
+                r = d // 4
+                c = (box_[0] + d // 2, box_[1] + d // 2)
+                self.draw.ellipse((c[0] - r, c[1] - r, c[0] + r, c[1] + r), fill=(255, 255, 255))
+            return
+        top = max((max(v) for _, v, _ in series if v), default=0) or 1
+        n, k = max(len(categories), 1), max(len(series), 1)
+        horizontal = kind == "bar"
+        span = (y1 - y0) if horizontal else (x1 - x0)
+        slot = span / n
+        bar = slot * 0.62 / k
+        for si, (_, values, series_color) in enumerate(series):
+            fill = _rgb(series_color or make_ppt.BLUE)
+            for ci, v in enumerate(values):
+                a = slot * ci + slot * 0.19 + bar * si
+                if horizontal:
+                    top_y = y1 - a - bar
+                    self.draw.rectangle((x0, top_y, x0 + (x1 - x0) * v / top, top_y + bar - 1), fill=fill)
+                else:
+                    self.draw.rectangle((x0 + a, y1 - (y1 - y0) * v / top, x0 + a + bar - 1, y1),
+                                        fill=fill)
+
+    # ── Output ────────────────────────────────────────────────
+    def encode(self, fmt="png"):
+        buf = BytesIO()
+        if fmt == "webp":
+            self.im.save(buf, "WEBP", quality=80, method=3)
+        else:
+            self.im.save(buf, "PNG", compress_level=3)
+        return buf.getvalue()
+
+
+def render_slide(slide_plan, width=480, fmt="png"):
+    """Encoded thumbnail of one compiled slide plan."""
+    _require_pillow()
+    canvas = ThumbCanvas(width)
+    if slide_plan["bg"]:
+        canvas.bg(slide_plan["bg"])
+    for name, *args in slide_plan["ops"]:
+        getattr(canvas, name)(*args)
+    return canvas.encode(fmt)
+
+def _render_job(job):
+    return render_slide(*job)
+
+def render_thumbnails(spec=None, width=480, fmt="png", workers=1, cache_dir=None):
+    """Encoded thumbnails of every slide, in order; workers > 1 renders in processes."""
+    _require_pillow()
+    plan = make_ppt.load_plan(spec if spec is not None else make_ppt.default_spec(), cache_dir)
+    jobs = [(slide_plan, width, fmt) for slide_plan in plan]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(min(workers, len(jobs))) as pool:
+            return list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
+    return [_render_job(job) for job in jobs]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render slide thumbnails without an office suite.")
+    ap.add_argument("out_dir")
+    ap.add_argument("--spec", default=make_ppt.SPEC_PATH, help="deck spec (.json, .yaml or .yml)")
+    ap.add_argument("--width", type=int, default=480, help="thumbnail width in pixels")
+    ap.add_argument("--format", choices=("png", "webp"), default="png")
+    ap.add_argument("--workers", type=int, default=1, help="render slides in N processes")
+    ap.add_argument("--cache-dir", help="reuse compiled layout plans from this directory")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    images = render_thumbnails(make_ppt.load_spec(args.spec), args.width, args.format,
+                               args.workers, args.cache_dir)
+    elapsed = time.perf_counter() - t0
+    os.makedirs(args.out_dir, exist_ok=True)
+    for i, data in enumerate(images, 1):
+        with open(os.path.join(args.out_dir, f"slide{i}.{args.format}"), "wb") as f:
+            f.write(data)
+    print(f"Rendered {len(images)} thumbnails in {elapsed * 1000:.0f} ms"
+          f" ({elapsed * 1000 / max(len(images), 1):.1f} ms/slide)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Opt-in build tracing: per-slide and per-helper time, shapes and XML bytes.
+
+    with BuildTrace() as trace:
+        prs = make_ppt.build_deck(spec)
+    trace.write_chrome("trace.json")    # chrome://tracing or ui.perfetto.dev
+    print(trace.summary())
+
+While a BuildTrace is active, the helpers in make_ppt (and the EMITTERS
+table that replays plans through them) are swapped for wrappers that record
+one event per call: wall time, shapes added to the slide and the serialized
+size of those shapes. Leaving the block puts the original functions back,
+so an untraced build runs exactly the code it always did. Tracing patches
+module globals and is therefore process wide; don't trace two builds in
+different threads at once.
+
+For production sampling, wrap builds in BuildTrace.sampled(rate), which
+traces roughly one build in 1/rate and is a no-op context otherwise.
+"""
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+from lxml import etree
+
+import make_ppt
+
+# make_ppt helpers that get an event per call
+TRACED = ("bg", "box", "txt", "header_bar", "title_strip", "bullet_list",
+          "bullet_block", "flow_box", "arrow", "chart", "stamp", "image")
+
+
+def _sp_tree(slide):
+    return slide.shapes._spTree
+
+def _xml_bytes(elements):
+    return sum(len(etree.tostring(e)) for e in elements)
+
+
+class BuildTrace:
+    """Records trace events for builds run inside the `with` block.
+
+    `module` is the make_ppt module object to instrument; pass it when
+    make_ppt runs as __main__ and is not the imported copy.
+    """
+
+    def __init__(self, module=None):
+        self.module = module or make_ppt
+        self.events = []
+        self._saved = None
+        self._slide_no = 0
+        self._t0 = time.perf_counter()
+
+    @classmethod
+    def sampled(cls, rate):
+        """A BuildTrace for about `rate` of calls, else a do-nothing context."""
+        return cls() if random.random() < rate else nullcontext()
+
+    # ── Patching ──────────────────────────────────────────────
+    def __enter__(self):
+        m = self.module
+        saved = {name: getattr(m, name) for name in TRACED}
+        saved["emit_slide"] = m.emit_slide
+        saved["EMITTERS"] = dict(m.EMITTERS)
+        self._saved = saved
+        wrapped = {name: self._wrap_helper(name, saved[name]) for name in TRACED}
+        for name, fn in wrapped.items():
+            setattr(m, name, fn)
+        by_fn = {saved[name]: fn for name, fn in wrapped.items()}
+        for op, fn in saved["EMITTERS"].items():
+            m.EMITTERS[op] = by_fn.get(fn, fn)
+        m.emit_slide = self._wrap_slide(saved["emit_slide"])
+        return self
+
+    def __exit__(self, *exc):
+        m = self.module
+        saved, self._saved = self._saved, None
+        m.EMITTERS.clear()
+        m.EMITTERS.update(saved.pop("EMITTERS"))
+        for name, fn in saved.items():
+            setattr(m, name, fn)
+
+    def _now(self):
+        return (time.perf_counter() - self._t0) * 1e6
+
+    def _event(self, name, cat, start, shapes, xml_bytes, **extra):
+        # Complete ("X") events on one thread; viewers nest them by time.
+        self.events.append({
+            "name": name, "cat": cat, "ph": "X", "ts": round(start, 1),
+            "dur": round(self._now() - start, 1), "pid": os.getpid(), "tid": 1,
+            "args": dict(extra, slide=self._slide_no, shapes=shapes, xml_bytes=xml_bytes),
+        })
+
+    def _wrap_helper(self, name, fn):
+        def traced(slide, *args, **kwargs):
+            tree = _sp_tree(slide)
+            before = len(tree)
+            start = self._now()
+            try:
+                return fn(slide, *args, **kwargs)
+            finally:
+                added = tree[before:]
+                self._event(name, "helper", start, len(added), _xml_bytes(added))
+        traced.__wrapped__ = fn
+        return traced
+
+    def _wrap_slide(self, fn):
+        def traced(prs, slide_plan):
+            self._slide_no = len(prs.slides) + 1
+            start = self._now()
+            slide = fn(prs, slide_plan)
+            self._event(f"s{self._slide_no}", "slide", start, len(slide.shapes),
+                        len(slide.part.blob), key=slide_plan.get("key"))
+            return slide
+        traced.__wrapped__ = fn
+        return traced
+
+    # ── Reports ───────────────────────────────────────────────
+    def chrome_trace(self):
+        """Trace-event JSON object (the format chrome://tracing loads)."""
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write_chrome(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def totals(self, cat):
+        """name -> [calls, total µs, shapes, xml bytes] over events of one category."""
+        out = defaultdict(lambda: [0, 0.0, 0, 0])
+        for e in self.events:
+            if e["cat"] == cat:
+                t = out[e["name"]]
+                t[0] += 1
+                t[1] += e["dur"]
+                t[2] += e["args"]["shapes"]
+                t[3] += e["args"]["xml_bytes"]
+        return dict(out)
+
+    def summary(self):
+        """Plain-text tables: one row per slide, then one per helper (slowest first).
+
+        Helper rows are inclusive: a title_strip also counts the box it draws,
+        and header_bar/bullet_block count the primitives they expand to.
+        """
+        lines = [f"{'slide':<8} {'ms':>9} {'shapes':>7} {'xml KB':>8}"]
+        for name, (_, us, shapes, size) in self.totals("slide").items():
+            lines.append(f"{name:<8} {us / 1000:>9.2f} {shapes:>7} {size / 1024:>8.1f}")
+        lines += ["", f"{'helper':<13} {'calls':>6} {'ms':>9} {'us/call':>9} {'shapes':>7} {'xml KB':>8}"]
+        helpers = sorted(self.totals("helper").items(), key=lambda kv: -kv[1][1])
+        for name, (calls, us, shapes, size) in helpers:
+            lines.append(f"{name:<13} {calls:>6} {us / 1000:>9.2f} {us / calls:>9.1f}"
+                         f" {shapes:>7} {size / 1024:>8.1f}")
+        return "\n".join(lines)
@@ -0,0 +1,192 @@
+"""Theme x locale variants of one deck from a single layout and emit pass.
+
+    python ppt_variants.py OUT_DIR [--spec deck_spec.json] [--themes light,dark]
+                           [--locale de=deck_de.json ...] [--workers N]
+
+The deck is laid out and emitted once (make_ppt.render_bytes). Every
+variant is that package with its slide and chart XML rewritten:
+
+  * each <a:srgbClr> is looked up by role (slide background, shape fill,
+    line or text) in the theme's tables, so white card fills and white
+    title text can map differently;
+  * each run's text, chart category label and series name is looked up in
+    the locale's catalog, a JSON object of source string -> translation;
+    strings it lacks stay as they are.
+
+Rewritten slides drop make_ppt's slide key, so render_incremental() run
+against a variant rebuilds them instead of reusing the variant's XML.
+
+Geometry is never touched, so a variant costs an XML pass instead of a
+rebuild. Variants are written in a process pool, one file each, named
+deck-<theme>-<locale>.pptx.
+"""
+import argparse
+import json
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+from lxml import etree
+from pptx.oxml.ns import qn
+
+import make_ppt
+import ppt_save
+from ppt_zip import ZipWriter
+
+# Dark colors follow the LMS front end's dark theme (frontend/src/index.css).
+DARK_CARD = "1A1D35"
+DARK_TEXT = "F0F0FF"
+
+# theme -> role -> {light hex: themed hex}; "light" is the deck as designed
+THEMES = {
+    "light": {},
+    "dark": {
+        "bg":   {"F4F7FB": "0D0E1A", "1E3A5F": "13152A"},
+        "fill": {"FFFFFF": DARK_CARD, "F4F7FB": "13152A", "DBEAFE": "21254A",
+                 "1E3A5F": "13152A", "141E33": DARK_CARD},
+        "line": {"DDE6F0": "2A2E55"},
+        "text": {"1E2A3A": DARK_TEXT, "1E3A5F": DARK_TEXT, "607D9A": "A0A3C4",
+                 "A8C4E0": "A0A3C4"},
+    },
+}
+# Colors a table doesn't list: pale fills (spec tints) sink toward the card
+# color and dark text turns light, so no variant ends up unreadable.
+DARK_FALLBACK = {"bg": 0.85, "fill": 0.85, "line": 0.7}
+
+_PARTS = ("ppt/slides/slide", "ppt/charts/chart")
+_TEXT_PARENTS = {qn("a:rPr"), qn("a:defRPr"), qn("a:endParaRPr")}
+_LINE, _BG = qn("a:ln"), qn("p:bg")
+_SRGB, _T = qn("a:srgbClr"), qn("a:t")
+_CSLD, _V = qn("p:cSld"), qn("c:v")
+_LABELS = {qn("c:cat"), qn("c:tx")}     # chart category labels and series names
+
+
+def _luminance(hex_):
+    r, g, b = (int(hex_[i:i+2], 16) / 255 for i in (0, 2, 4))
+    return 0.2126*r + 0.7152*g + 0.0722*b
+
+def _blend(hex_, toward, amount):
+    mix = (round(int(hex_[i:i+2], 16)*(1 - amount) + int(toward[i:i+2], 16)*amount)
+           for i in (0, 2, 4))
+    return "".join(f"{v:02X}" for v in mix)
+
+@lru_cache(maxsize=4096)
+def themed(theme, role, hex_):
+    """Color `hex_` in role 'bg', 'fill', 'line' or 'text' under `theme`."""
+    table = THEMES[theme].get(role, {})
+    if hex_ in table:
+        return table[hex_]
+    if theme == "dark":
+        if role == "text" and _luminance(hex_) < 0.3:
+            return DARK_TEXT
+        if role != "text" and _luminance(hex_) > 0.8:
+            return _blend(hex_, DARK_CARD, DARK_FALLBACK[role])
+    return hex_
+
+def _role(el):
+    for anc in el.iterancestors():
+        if anc.tag in _TEXT_PARENTS:
+            return "text"
+        if anc.tag == _LINE:
+            return "line"
+        if anc.tag == _BG:
+            return "bg"
+    return "fill"
+
+def rewrite_part(xml, theme, catalog):
+    """Part XML bytes with colors themed, text and chart labels translated, slide key dropped."""
+    root = etree.fromstring(xml)
+    if THEMES[theme]:
+        for el in root.iter(_SRGB):
+            val = el.get("val")
+            new = themed(theme, _role(el), val)
+            if new != val:
+                el.set("val", new)
+    if catalog:
+        labels = (el for el in root.iter(_V)
+                  if any(anc.tag in _LABELS for anc in el.iterancestors()))
+        for el in (*root.iter(_T), *labels):
+            text = catalog.get(el.text)
+            if text is not None:
+                el.text = text
+    c_sld = root.find(_CSLD)
+    if c_sld is not None and "name" in c_sld.attrib:
+        del c_sld.attrib["name"]        # the slide key describes the base slide, not this one
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+def variant_bytes(base, theme="light", catalog=None, level=6):
+    """The .pptx `base` rewritten for one theme and locale catalog; rewritten parts at `level`."""
+    if not THEMES[theme] and not catalog:
+        return base
+    out = BytesIO()
+    with zipfile.ZipFile(BytesIO(base)) as zin, ZipWriter(out, level) as zout:
+        for info in zin.infolist():
+            name = info.filename
+            if name.startswith(_PARTS) and name.endswith(".xml"):
+                zout.write(name, rewrite_part(zin.read(info), theme, catalog),
+                           0 if name.lower().endswith(ppt_save.STORED_MEDIA) else level)
+            else:
+                zout.copy(zin, info)        # untouched: still compressed as the base has it
+    return out.getvalue()
+
+
+def _write_variant(job):
+    base, theme, catalog, path = job
+    t0 = time.perf_counter()
+    data = variant_bytes(base, theme, catalog)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path, len(data), time.perf_counter() - t0
+
+def render_variants(spec, out_dir, themes=("light", "dark"), locales=None, workers=None):
+    """Write every theme x locale of `spec` into out_dir; returns [(path, bytes, seconds)].
+
+    `locales` maps a locale code to its catalog dict ({"en": None} by default).
+    """
+    locales = locales or {"en": None}
+    base = make_ppt.render_bytes(spec)
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = [(base, theme, catalog, os.path.join(out_dir, f"deck-{theme}-{code}.pptx"))
+            for theme in themes for code, catalog in locales.items()]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return [_write_variant(job) for job in jobs]
+    with ProcessPoolExecutor(workers) as pool:
+        return list(pool.map(_write_variant, jobs))
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render theme and locale variants of a deck.")
+    ap.add_argument("out_dir")
+    ap.add_argument("--spec", default=make_ppt.SPEC_PATH, help="deck spec (.json, .yaml or .yml)")
+    ap.add_argument("--themes", default="light,dark", help=f"comma-separated, of {', '.join(THEMES)}")
+    ap.add_argument("--locale", action="append", default=[], metavar="CODE=CATALOG.json",
+                    help="add a locale from a JSON catalog (repeatable); 'en' is the spec itself")
+    ap.add_argument("--workers", type=int, help="writer processes (default: CPU count)")
+    args = ap.parse_args(argv)
+
+    themes = [t for t in args.themes.split(",") if t]
+    for theme in themes:
+        if theme not in THEMES:
+            ap.error(f"unknown theme {theme!r}")
+    locales = {"en": None}
+    for item in args.locale:
+        code, _, path = item.partition("=")
+        if not path:
+            ap.error(f"--locale expects CODE=CATALOG.json, got {item!r}")
+        with open(path, encoding="utf-8") as f:
+            locales[code] = json.load(f)
+
+    t0 = time.perf_counter()
+    results = render_variants(make_ppt.load_spec(args.spec), args.out_dir, themes, locales,
+                              args.workers)
+    for path, size, seconds in results:
+        print(f"  {path}  {size / 1024:.0f} KB  {seconds * 1000:.0f} ms")
+    print(f"Wrote {len(results)} variants in {time.perf_counter() - t0:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
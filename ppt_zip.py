@@ -0,0 +1,148 @@
+"""Minimal streaming zip writer for .pptx packages.
+
+Unlike zipfile.ZipFile, ZipWriter keeps nothing per entry in memory: local
+headers and data go straight to the output and central-directory records
+are spooled to a temporary file until close(). Every entry carries the same
+fixed timestamp, so identical input gives identical bytes. ZIP64 records
+are written when the entry count or offsets outgrow the classic format.
+copy() moves an entry over from an existing zip still compressed.
+"""
+import struct
+import tempfile
+import zlib
+
+# 1980-01-01 00:00:00, the earliest DOS timestamp
+_DOS_TIME = 0
+_DOS_DATE = (1 << 5) | 1
+
+_U16 = 0xFFFF
+_U32 = 0xFFFFFFFF
+
+STORED = 0
+DEFLATED = 8
+
+
+def read_raw(zf, info):
+    """(method, payload) of entry `info` in zipfile.ZipFile `zf`, without decompressing it."""
+    fp = zf.fp
+    fp.seek(info.header_offset)
+    name_len, extra_len = struct.unpack("<HH", fp.read(30)[26:])
+    fp.seek(info.header_offset + 30 + name_len + extra_len)
+    return info.compress_type, fp.read(info.compress_size)
+
+
+class ZipWriter:
+    """Write zip entries to a binary file object (or a path) one at a time."""
+
+    def __init__(self, file, level=6):
+        if isinstance(file, (str, bytes)) or hasattr(file, "__fspath__"):
+            self._fp = open(file, "wb")
+            self._owns_fp = True
+        else:
+            self._fp = file
+            self._owns_fp = False
+        self.level = level
+        self._offset = 0
+        self._count = 0
+        self._cd = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+        self._cd_size = 0
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, data):
+        self._fp.write(data)
+        self._offset += len(data)
+
+    def _local_header(self, name, flags, method, crc, csize, usize):
+        return struct.pack("<IHHHHHIIIHH", 0x04034B50, 20, flags, method,
+                           _DOS_TIME, _DOS_DATE, crc, csize, usize, len(name), 0) + name
+
+    def _central_record(self, name, flags, method, crc, csize, usize, offset):
+        extra, needed = b"", 20
+        if offset > _U32:
+            extra, needed = struct.pack("<HHQ", 0x0001, 8, offset), 45    # ZIP64 needs 4.5
+            offset = _U32
+        record = struct.pack("<IHHHHHHIIIHHHHHII", 0x02014B50, 45, needed, flags, method,
+                             _DOS_TIME, _DOS_DATE, crc, csize, usize, len(name),
+                             len(extra), 0, 0, 0, 0, offset) + name + extra
+        self._cd.write(record)
+        self._cd_size += len(record)
+        self._count += 1
+
+    def compress(self, data, level=None):
+        """(method, payload) for `data` at `level` (default: the writer's level); 0 stores."""
+        level = self.level if level is None else level
+        if level == 0:
+            return STORED, data
+        c = zlib.compressobj(level, zlib.DEFLATED, -15)
+        return DEFLATED, c.compress(data) + c.flush()
+
+    def write(self, name, data, level=None):
+        """Add an entry whose full contents are in memory."""
+        method, payload = self.compress(data, level)
+        self.write_compressed(name, method, payload, zlib.crc32(data), len(data))
+
+    def write_compressed(self, name, method, payload, crc, usize):
+        """Add an entry from an already compressed (or stored) payload."""
+        name = name.encode("utf-8")
+        offset = self._offset
+        self._write(self._local_header(name, 0, method, crc, len(payload), usize))
+        self._write(payload)
+        self._central_record(name, 0, method, crc, len(payload), usize, offset)
+
+    def copy(self, zf, info):
+        """Add entry `info` of zipfile.ZipFile `zf` as it is stored there."""
+        method, payload = read_raw(zf, info)
+        self.write_compressed(info.filename, method, payload, info.CRC, info.file_size)
+
+    def write_iter(self, name, chunks, level=None):
+        """Add an entry from an iterable of byte chunks without holding it all in memory."""
+        level = self.level if level is None else level
+        name = name.encode("utf-8")
+        offset = self._offset
+        flags = 0x08   # sizes and CRC follow the data in a data descriptor
+        method = STORED if level == 0 else DEFLATED
+        self._write(self._local_header(name, flags, method, 0, 0, 0))
+        c = None if level == 0 else zlib.compressobj(level, zlib.DEFLATED, -15)
+        crc = usize = csize = 0
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc)
+            usize += len(chunk)
+            out = c.compress(chunk) if c else chunk
+            csize += len(out)
+            self._write(out)
+        if c:
+            out = c.flush()
+            csize += len(out)
+            self._write(out)
+        self._write(struct.pack("<IIII", 0x08074B50, crc, csize, usize))
+        self._central_record(name, flags, method, crc, csize, usize, offset)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        cd_offset = self._offset
+        self._cd.seek(0)
+        while True:
+            block = self._cd.read(1 << 20)
+            if not block:
+                break
+            self._write(block)
+        self._cd.close()
+
+        if self._count > _U16 or cd_offset > _U32 or self._cd_size > _U32:
+            eocd64 = self._offset
+            self._write(struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0,
+                                    self._count, self._count, self._cd_size, cd_offset))
+            self._write(struct.pack("<IIQI", 0x07064B50, 0, eocd64, 1))
+        self._write(struct.pack("<IHHHHIIH", 0x06054B50, 0, 0,
+                                min(self._count, _U16), min(self._count, _U16),
+                                min(self._cd_size, _U32), min(cd_offset, _U32), 0))
+        if self._owns_fp:
+            self._fp.close()